@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+配置存储后端基准测试
+
+对比 yaml / json / sqlite 三种存储后端的：
+- 加载：从存储中读取并解析完整的配置文档（不使用快照）
+- 保存：修改一个配置项后同步写入（包括文件锁、变更戳和快照刷新）
+
+用法:
+    python -m benchmarks.bench_config_backends [-n 次数]
+"""
+
+import argparse
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from config import ConfigManager  # noqa: E402
+from config.config_backends import BACKENDS  # noqa: E402
+
+
+def measure(func, iterations):
+    """
+    多次执行并统计耗时
+
+    Returns:
+        tuple: (中位数微秒, 平均值微秒)
+    """
+    samples = []
+    for index in range(iterations):
+        start = time.perf_counter()
+        func(index)
+        samples.append((time.perf_counter() - start) * 1e6)
+    return statistics.median(samples), statistics.mean(samples)
+
+
+def bench_backend(backend_name, iterations):
+    """
+    测试单个存储后端
+
+    Returns:
+        tuple: (加载中位数, 加载平均值, 保存中位数, 保存平均值)，单位为微秒
+    """
+    with tempfile.TemporaryDirectory() as temp_dir:
+        manager = ConfigManager(
+            custom_app_info={"name": "ACE-PyQt-Benchmark"},
+            custom_system_config={"config_dir_name": temp_dir, "config_backend": backend_name},
+        )
+        backend = manager._backend
+
+        def load(_):
+            backend.load()
+
+        def save(index):
+            manager.window_width = 700 + index % 2
+            manager.save_config(sync=True)
+
+        # 预热一次，避免首次导入和建表等开销影响结果
+        load(0)
+        save(1)
+        load_result = measure(load, iterations)
+        save_result = measure(save, iterations)
+        manager.close()
+    return load_result + save_result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="配置存储后端基准测试")
+    parser.add_argument("-n", "--iterations", type=int, default=200, help="每项测试的执行次数")
+    args = parser.parse_args()
+
+    print(f"{'后端':<10}{'加载中位数(us)':>16}{'加载平均值(us)':>16}{'保存中位数(us)':>16}{'保存平均值(us)':>16}")
+    for backend_name in BACKENDS:
+        load_median, load_mean, save_median, save_mean = bench_backend(backend_name, args.iterations)
+        print(f"{backend_name:<10}{load_median:>16.1f}{load_mean:>16.1f}{save_median:>16.1f}{save_mean:>16.1f}")
+
+
+if __name__ == "__main__":
+    main()
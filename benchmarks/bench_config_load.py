@@ -0,0 +1,102 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+配置加载基准测试
+
+对比三种配置加载路径的耗时：
+- 原始路径：纯 Python yaml.safe_load + 按点分路径逐项查找
+- 冷启动：快照不存在，使用 libyaml 解析并生成快照
+- 热启动：快照有效，跳过 YAML 解析
+
+用法:
+    python -m benchmarks.bench_config_load [-n 次数]
+"""
+
+import argparse
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import yaml
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from config import ConfigManager  # noqa: E402
+from config.config_backends import YAML_LOADER  # noqa: E402
+
+
+def legacy_load(manager):
+    """原始加载路径：纯 Python 解析并逐项拆分路径查找"""
+    with manager.config_file.open("r", encoding="utf-8") as f:
+        config_data = yaml.safe_load(f)
+
+    attributes = {}
+    for attr_name, (config_path, type_func, validator) in manager.CONFIG_MAPPING.items():
+        current = config_data
+        try:
+            for key in config_path.split("."):
+                current = current[key]
+        except (KeyError, TypeError):
+            continue
+        value = type_func(current)
+        if validator:
+            value = validator(value)
+        attributes[attr_name] = value
+    return attributes
+
+
+def cold_load(manager):
+    """冷启动路径：删除快照后加载"""
+    manager._snapshot.invalidate()
+    return manager._read_config_attributes()
+
+
+def warm_load(manager):
+    """热启动路径：快照有效时加载"""
+    return manager._read_config_attributes()
+
+
+def measure(func, manager, iterations):
+    """
+    多次执行并统计耗时
+
+    Returns:
+        tuple: (中位数微秒, 平均值微秒)
+    """
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        func(manager)
+        samples.append((time.perf_counter() - start) * 1e6)
+    return statistics.median(samples), statistics.mean(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="配置加载基准测试")
+    parser.add_argument("-n", "--iterations", type=int, default=200, help="每种路径的执行次数")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        manager = ConfigManager(
+            custom_app_info={"name": "ACE-PyQt-Benchmark"},
+            custom_system_config={"config_dir_name": temp_dir},
+        )
+        manager.theme = "dark"
+        manager.save_config(sync=True)
+
+        print(f"YAML 加载器: {YAML_LOADER.__name__}")
+        print(f"{'路径':<12}{'中位数(us)':>14}{'平均值(us)':>14}")
+        for name, func in (("原始路径", legacy_load), ("冷启动", cold_load), ("热启动", warm_load)):
+            # 预热一次，避免首次导入等开销影响结果
+            func(manager)
+            median, mean = measure(func, manager, args.iterations)
+            print(f"{name:<12}{median:>14.1f}{mean:>14.1f}")
+
+        manager.close()
+
+
+if __name__ == "__main__":
+    main()
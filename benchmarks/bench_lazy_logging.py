@@ -0,0 +1,114 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+未输出调试日志的开销基准测试
+
+默认日志级别为 INFO，调试日志不会被输出，但直接调用 logger.debug(f"...") 时
+f-string 仍会被格式化，loguru 也仍会创建日志记录。本测试对比：
+- 之前：logger.debug(f"...") 在级别关闭时的单次开销
+- 之后：LazyLogger.debug("... {}", ...) 在级别关闭时的单次开销
+并统计启动加载配置和切换主题时实际执行的调试日志次数，估算每次启动和每次切换主题的总开销。
+
+用法:
+    python -m benchmarks.bench_lazy_logging [-n 次数]
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from utils.logger import logger, log_controller, get_logger, setup_logger  # noqa: E402
+from config import ConfigManager  # noqa: E402
+
+# 切换主题时 WindowThemeManager.switch_theme 中的调试日志次数（该类依赖完整的主窗口，这里不实际创建）
+THEME_SWITCH_UI_CALLS = 2
+
+log = get_logger("config.config_manager")
+
+
+def per_call_ns(func, iterations):
+    """
+    多次执行并返回单次调用的平均耗时
+
+    Returns:
+        float: 纳秒
+    """
+    start = time.perf_counter()
+    func(iterations)
+    return (time.perf_counter() - start) * 1e9 / iterations
+
+
+def eager_calls(iterations):
+    """之前的写法：级别关闭时仍会格式化 f-string"""
+    attr_name, value = "window_width", 700
+    for _ in range(iterations):
+        logger.debug(f"已从配置文件加载 {attr_name}: {value}")
+
+
+def lazy_calls(iterations):
+    """之后的写法：级别关闭时直接返回"""
+    attr_name, value = "window_width", 700
+    for _ in range(iterations):
+        log.debug("已从配置文件加载 {}: {}", attr_name, value)
+
+
+def count_debug_calls(config_dir):
+    """
+    在调试模式下运行启动和切换主题的配置路径，统计执行的调试日志次数
+
+    Returns:
+        tuple: (启动时的次数, 每次切换主题的次数)
+    """
+    records = []
+    log_controller.set_debug_mode(True)
+    sink_id = logger.add(
+        lambda message: records.append(message.record), level="DEBUG", filter=lambda record: record["level"].no < 20
+    )
+    try:
+        # 第一次运行创建默认配置文件，之后的运行才是正常启动路径
+        ConfigManager(custom_app_info={"name": "ACE-PyQt-Benchmark"}, custom_system_config={"config_dir_name": config_dir}).close()
+        del records[:]
+
+        manager = ConfigManager(
+            custom_app_info={"name": "ACE-PyQt-Benchmark"}, custom_system_config={"config_dir_name": config_dir}
+        )
+        startup = len(records)
+
+        del records[:]
+        manager.theme = "dark" if manager.theme != "dark" else "light"
+        manager.save_config(sync=True)
+        theme_switch = len(records) + THEME_SWITCH_UI_CALLS
+        manager.close()
+    finally:
+        logger.remove(sink_id)
+        log_controller.set_debug_mode(False)
+    return startup, theme_switch
+
+
+def main():
+    parser = argparse.ArgumentParser(description="未输出调试日志的开销基准测试")
+    parser.add_argument("-n", "--iterations", type=int, default=200000, help="单次开销测试的调用次数")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # 与程序默认设置相同：控制台和文件输出器，级别为 INFO
+        setup_logger(Path(temp_dir) / "logs", debug_mode=False)
+        startup, theme_switch = count_debug_calls(temp_dir)
+
+        eager_ns = per_call_ns(eager_calls, args.iterations)
+        lazy_ns = per_call_ns(lazy_calls, args.iterations)
+        log_controller.reset()
+
+    print(f"{'':<16}{'单次(ns)':>12}{f'启动 x{startup}(us)':>18}{f'切换主题 x{theme_switch}(us)':>22}")
+    for name, cost in (("之前 f-string", eager_ns), ("之后 LazyLogger", lazy_ns)):
+        print(f"{name:<16}{cost:>12.0f}{cost * startup / 1000:>18.2f}{cost * theme_switch / 1000:>22.2f}")
+    print(f"单次调用开销降低 {eager_ns / lazy_ns:.1f} 倍")
+
+
+if __name__ == "__main__":
+    main()
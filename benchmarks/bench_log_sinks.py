@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+文件日志输出器吞吐量基准测试
+
+以固定速率（默认每秒 1 万条和 10 万条）持续写日志，对比：
+- 文本输出器：当前 setup_logger 使用的文本文件输出器（enqueue=True，每条记录经多进程队列 pickle）
+- 结构化输出器：JsonLinesSink（内存缓冲，普通线程批量写入）
+统计调用方每条日志的平均耗时、实际达到的写入速率，以及停止写日志后把剩余日志写完所需的时间。
+速率超过输出器的处理能力时，实际速率会低于目标速率。
+
+用法:
+    python -m benchmarks.bench_log_sinks [-d 秒数] [-r 速率 ...]
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from utils.logger import logger, FILE_FORMAT, STRUCTURED_FORMAT  # noqa: E402
+from utils.json_sink import JsonLinesSink  # noqa: E402
+
+
+def add_text_sink(log_dir):
+    """添加与 setup_logger 相同设置的文本文件输出器"""
+    return logger.add(
+        str(log_dir / "{time:YYYY-MM-DD}.log"),
+        level="DEBUG",
+        format=FILE_FORMAT,
+        rotation="1 day",
+        encoding="utf-8",
+        enqueue=True,
+        catch=True,
+    )
+
+
+def add_structured_sink(log_dir):
+    """添加结构化 JSON Lines 输出器"""
+    return logger.add(JsonLinesSink(log_dir), level="DEBUG", format=STRUCTURED_FORMAT, catch=True)
+
+
+def run(add_sink, rate, duration):
+    """
+    以目标速率写日志并等待输出器写完
+
+    Args:
+        add_sink (callable): 接收日志目录并添加输出器的函数，返回输出器 ID
+        rate (int): 目标速率（条/秒）
+        duration (float): 持续时间（秒）
+
+    Returns:
+        tuple: (调用方单条耗时纳秒, 实际速率条/秒, 写完剩余日志耗时毫秒)
+    """
+    total = int(rate * duration)
+    # 每批按时间片补足应写的条数，避免逐条 sleep 的精度问题
+    slice_size = max(1, rate // 1000)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        logger.remove()
+        sink_id = add_sink(Path(temp_dir))
+        bound = logger.bind(user="benchmark")
+
+        call_time = 0.0
+        sent = 0
+        start = time.perf_counter()
+        while sent < total:
+            due = min(total, int((time.perf_counter() - start) * rate) + slice_size)
+            if due <= sent:
+                time.sleep(0.0005)
+                continue
+            call_start = time.perf_counter()
+            for i in range(sent, due):
+                bound.info("处理第 {} 条记录，耗时 {} 毫秒", i, 3)
+            call_time += time.perf_counter() - call_start
+            sent = due
+        produced = time.perf_counter()
+
+        # remove 会等待输出器写完缓冲或队列中的所有日志
+        logger.remove(sink_id)
+        finished = time.perf_counter()
+
+    return call_time * 1e9 / total, total / (finished - start), (finished - produced) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="文件日志输出器吞吐量基准测试")
+    parser.add_argument("-d", "--duration", type=float, default=2.0, help="每个速率的持续时间（秒）")
+    parser.add_argument("-r", "--rates", type=int, nargs="+", default=[10000, 100000], help="目标速率（条/秒）")
+    args = parser.parse_args()
+
+    sinks = (("文本 enqueue", add_text_sink), ("结构化 JSONL", add_structured_sink))
+
+    print(f"{'输出器':<14}{'目标速率':>10}{'单条(ns)':>12}{'实际速率':>12}{'写完剩余(ms)':>16}")
+    for rate in args.rates:
+        for name, add_sink in sinks:
+            per_call_ns, achieved, drain_ms = run(add_sink, rate, args.duration)
+            print(f"{name:<14}{rate:>10}{per_call_ns:>12.0f}{achieved:>12.0f}{drain_ms:>16.1f}")
+
+    logger.remove()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+主题切换耗时基准测试
+
+在离屏 QApplication 中创建与主窗口规模相近的控件树（导航选项卡、卡片、按钮和标签），
+对比两种切换方式从调用到绘制完成（处理完事件队列）的耗时：
+- 不使用事务：theme_manager.set_theme，各组件在信号处理中各自刷新样式，窗口可能多次重绘
+- 使用事务：theme_manager.switch_transaction 中调用 set_theme，暂停窗口绘制，
+  样式刷新推迟并合并为一次全局样式表更新，结束时只重绘一次
+
+用法:
+    python -m benchmarks.bench_theme_switch [-n 次数] [--cards 数量]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5.QtWidgets import QApplication, QLabel, QPushButton, QVBoxLayout, QWidget  # noqa: E402
+
+from ui.components import CardGroupBox, NavigationTabWidget  # noqa: E402
+from ui.styles import StyleApplier, StyleHelper, theme_manager  # noqa: E402
+
+# 导航页数量（与主窗口相同）
+NAV_PAGES = 3
+
+
+def build_window(cards):
+    """
+    创建测试窗口
+
+    Args:
+        cards (int): 每个导航页中的卡片数量
+
+    Returns:
+        QWidget: 已显示的测试窗口
+    """
+    window = QWidget()
+    window.resize(900, 700)
+    tabs = NavigationTabWidget()
+
+    for page_index in range(NAV_PAGES):
+        page = QWidget()
+        page_layout = QVBoxLayout(page)
+        for card_index in range(cards):
+            card = CardGroupBox()
+            card.addWidget(QLabel(f"卡片 {page_index}-{card_index}"))
+            button = QPushButton("按钮")
+            StyleHelper.set_button_type(button, "primary" if card_index % 2 else "default")
+            card.addWidget(button)
+            page_layout.addWidget(card)
+        tabs.addTab(page, f"页面 {page_index}", "◆")
+
+    layout = QVBoxLayout(window)
+    layout.addWidget(tabs)
+    window.show()
+    return window
+
+
+def measure(app, window, switch, iterations):
+    """
+    多次切换主题并返回每次切换的耗时
+
+    Args:
+        switch (callable): 切换函数，参数为窗口和目标主题
+
+    Returns:
+        list: 每次切换的耗时（毫秒）
+    """
+    timings = []
+    for _ in range(iterations):
+        theme = "dark" if theme_manager.get_current_theme() == "light" else "light"
+        start = time.perf_counter()
+        switch(window, theme)
+        app.processEvents()
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def switch_plain(window, theme):
+    """不使用事务"""
+    theme_manager.set_theme(theme)
+
+
+def switch_transaction(window, theme):
+    """使用事务"""
+    with theme_manager.switch_transaction(window):
+        theme_manager.set_theme(theme)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="主题切换耗时基准测试")
+    parser.add_argument("-n", "--iterations", type=int, default=20, help="每种方式的切换次数")
+    parser.add_argument("--cards", type=int, default=20, help="每个导航页中的卡片数量")
+    args = parser.parse_args()
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    StyleApplier.apply_ant_design_theme(app)
+    window = build_window(args.cards)
+    app.processEvents()
+
+    # 预热：生成两种主题的样式表
+    measure(app, window, switch_plain, 2)
+
+    print(f"{'':<12}{'中位数(ms)':>12}{'最小(ms)':>12}{'最大(ms)':>12}")
+    results = {}
+    for name, switch in (("不使用事务", switch_plain), ("使用事务", switch_transaction)):
+        timings = measure(app, window, switch, args.iterations)
+        results[name] = statistics.median(timings)
+        print(f"{name:<12}{results[name]:>12.1f}{min(timings):>12.1f}{max(timings):>12.1f}")
+    print(f"切换耗时降低 {results['不使用事务'] / results['使用事务']:.1f} 倍")
+
+    window.close()
+
+
+if __name__ == "__main__":
+    main()
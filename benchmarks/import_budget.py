@@ -0,0 +1,159 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+导入耗时预算检查
+
+在新的解释器中以 -X importtime 分别导入各入口模块，解析每个模块的导入耗时，检查：
+- 入口模块的累计导入耗时是否超过预算
+- 是否导入了预算中禁止在导入阶段加载的模块（如 requests、winrt 等应在首次使用时才加载的依赖）
+并列出自身耗时最多的模块，便于定位新增的重量级导入。
+
+预算保存在同目录的 import_budget.json 中，格式为 {"模块": {"max_ms": 毫秒, "forbidden": [模块名, ...]}}。
+耗时取多次测量中的最小值以减小磁盘缓存和系统负载的影响；有超出预算的项时以非零状态码退出。
+
+用法:
+    python -m benchmarks.import_budget [-m 模块 ...] [-n 次数] [--top 条数] [--budget 文件]
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_BUDGET = Path(__file__).resolve().parent / "import_budget.json"
+
+# -X importtime 输出行的前缀
+IMPORTTIME_PREFIX = "import time:"
+
+
+def measure(module):
+    """
+    在新的解释器中导入模块并解析 -X importtime 的输出
+
+    Args:
+        module (str): 要导入的模块名
+
+    Returns:
+        dict: {模块名: (自身耗时微秒, 累计耗时微秒)}，只包含导入该模块时加载的模块
+              （不含解释器启动时已加载的 site、encodings 等），按导入完成的顺序排列
+
+    Raises:
+        RuntimeError: 导入失败时
+    """
+    env = dict(os.environ, PYTHONDONTWRITEBYTECODE="1")
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=str(ROOT),
+        env=env,
+        capture_output=True,
+        text=True,
+        encoding="utf-8",
+        errors="replace",
+    )
+
+    entries = []
+    errors = []
+    for line in result.stderr.splitlines():
+        if not line.startswith(IMPORTTIME_PREFIX):
+            errors.append(line)
+            continue
+        fields = line[len(IMPORTTIME_PREFIX):].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            # 表头行
+            continue
+        # 模块名前的缩进表示嵌套深度，子模块先于导入它的模块输出
+        name = fields[2].rstrip()
+        depth = len(name) - len(name.lstrip())
+        entries.append((name.strip(), depth, int(fields[0]), int(fields[1])))
+
+    if result.returncode != 0:
+        raise RuntimeError("\n".join(errors[-5:]) or f"导入 {module} 失败")
+
+    # 从入口模块所在行向前，缩进更深的连续行都是导入它时加载的模块
+    end = max((i for i, entry in enumerate(entries) if entry[0] == module), default=None)
+    if end is None:
+        return {}
+    start = end
+    while start > 0 and entries[start - 1][1] > entries[end][1]:
+        start -= 1
+    return {name: (self_us, cumulative_us) for name, _, self_us, cumulative_us in entries[start : end + 1]}
+
+
+def check(module, budget, runs):
+    """
+    测量模块的导入耗时并与预算比较
+
+    Args:
+        module (str): 要导入的模块名
+        budget (dict): 该模块的预算 {"max_ms": 毫秒, "forbidden": [模块名, ...]}
+        runs (int): 测量次数
+
+    Returns:
+        tuple: (累计耗时毫秒, 最快一次的耗时明细, 违反预算的说明列表)
+    """
+    best = None
+    for _ in range(max(1, runs)):
+        timings = measure(module)
+        if module not in timings:
+            raise RuntimeError(f"-X importtime 输出中没有 {module}")
+        if best is None or timings[module][1] < best[module][1]:
+            best = timings
+
+    total_ms = best[module][1] / 1000
+    violations = []
+
+    max_ms = budget.get("max_ms")
+    if max_ms is not None and total_ms > max_ms:
+        violations.append(f"累计导入耗时 {total_ms:.1f} ms 超过预算 {max_ms} ms")
+
+    for forbidden in budget.get("forbidden", []):
+        loaded = [name for name in best if name == forbidden or name.startswith(forbidden + ".")]
+        if loaded:
+            violations.append(f"导入阶段加载了 {forbidden}（{loaded[0]}）")
+
+    return total_ms, best, violations
+
+
+def main():
+    parser = argparse.ArgumentParser(description="导入耗时预算检查")
+    parser.add_argument("-m", "--modules", nargs="+", help="要检查的模块（默认检查预算文件中的全部模块）")
+    parser.add_argument("-n", "--runs", type=int, default=3, help="每个模块的测量次数")
+    parser.add_argument("--top", type=int, default=10, help="列出自身耗时最多的模块条数")
+    parser.add_argument("--budget", type=Path, default=DEFAULT_BUDGET, help="预算文件路径")
+    args = parser.parse_args()
+
+    with open(args.budget, "r", encoding="utf-8") as f:
+        budgets = json.load(f)
+
+    failed = False
+    for module in args.modules or list(budgets):
+        budget = budgets.get(module, {})
+        try:
+            total_ms, timings, violations = check(module, budget, args.runs)
+        except RuntimeError as e:
+            print(f"{module}: 导入失败\n{e}\n")
+            failed = True
+            continue
+
+        max_ms = budget.get("max_ms")
+        print(f"{module}: {total_ms:.1f} ms" + (f" / 预算 {max_ms} ms" if max_ms is not None else ""))
+
+        heaviest = sorted(timings.items(), key=lambda item: item[1][0], reverse=True)[: args.top]
+        print(f"  {'自身(ms)':>10}{'累计(ms)':>10}  模块")
+        for name, (self_us, cumulative_us) in heaviest:
+            print(f"  {self_us / 1000:>10.1f}{cumulative_us / 1000:>10.1f}  {name}")
+
+        for violation in violations:
+            print(f"  ✗ {violation}")
+        failed = failed or bool(violations)
+        print()
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+多进程配置写入压力测试
+
+启动多个进程共享同一个配置目录，每个进程只反复修改属于自己的一个配置项并同步写盘。
+文件锁和变更戳生效时，所有进程结束后每个配置项都应等于各自进程最后写入的值；
+否则"最后写入者覆盖一切"会丢失其他进程的修改。
+
+用法:
+    python -m benchmarks.stress_config_processes [-n 每个进程的写入次数] [-b 存储后端]
+"""
+
+import argparse
+import multiprocessing
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from config import ConfigManager  # noqa: E402
+
+# 每个进程负责的配置项及其初始值
+WORKER_FIELDS = {
+    "window_width": 1000,
+    "window_height": 2000,
+    "log_retention_days": 3000,
+}
+
+
+def create_manager(config_dir, backend):
+    """创建使用临时目录的配置管理器（使用独立的应用名，避免改动真实的开机自启设置）"""
+    return ConfigManager(
+        custom_app_info={"name": "ACE-PyQt-Benchmark"},
+        custom_system_config={"config_dir_name": config_dir, "config_save_delay": 0, "config_backend": backend},
+    )
+
+
+def worker(config_dir, backend, attr_name, start_value, iterations, barrier):
+    """
+    压力测试进程：反复修改自己负责的配置项并同步写盘
+
+    Args:
+        config_dir (str): 共享的配置目录
+        backend (str): 配置存储后端名称
+        attr_name (str): 负责的配置属性名
+        start_value (int): 起始值
+        iterations (int): 写入次数
+        barrier: 用于让所有进程同时开始写入的屏障
+    """
+    manager = create_manager(config_dir, backend)
+    barrier.wait()
+    for offset in range(1, iterations + 1):
+        setattr(manager, attr_name, start_value + offset)
+        manager.save_config(sync=True)
+    manager.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="多进程配置写入压力测试")
+    parser.add_argument("-n", "--iterations", type=int, default=50, help="每个进程的写入次数")
+    parser.add_argument("-b", "--backend", default="yaml", help="配置存储后端（yaml / json / sqlite）")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # 先创建配置文件，避免各进程同时创建默认配置
+        create_manager(temp_dir, args.backend).close()
+
+        barrier = multiprocessing.Barrier(len(WORKER_FIELDS))
+        processes = [
+            multiprocessing.Process(
+                target=worker, args=(temp_dir, args.backend, attr_name, start_value, args.iterations, barrier)
+            )
+            for attr_name, start_value in WORKER_FIELDS.items()
+        ]
+
+        start = time.perf_counter()
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+        elapsed = time.perf_counter() - start
+
+        manager = create_manager(temp_dir, args.backend)
+        print(
+            f"[{args.backend}] {len(processes)} 个进程 x {args.iterations} 次写入，"
+            f"耗时 {elapsed:.2f} 秒，最终变更戳 {manager._backend.stamp}"
+        )
+
+        failed = False
+        for attr_name, start_value in WORKER_FIELDS.items():
+            expected = start_value + args.iterations
+            actual = getattr(manager, attr_name)
+            status = "OK" if actual == expected else "丢失更新"
+            failed = failed or actual != expected
+            print(f"{attr_name:<22}期望 {expected:<8}实际 {actual:<8}{status}")
+        manager.close()
+
+    if failed or any(process.exitcode for process in processes):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
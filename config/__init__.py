@@ -1,6 +1,52 @@
-"""配置管理模块"""
+"""
+配置管理模块
+
+应用信息和默认配置（app_config）在导入包时直接加载，只包含字面量；配置管理器和命令行覆盖解析
+通过模块级 __getattr__（PEP 562）在首次访问时才导入，重复启动时只读取应用名称就退出，
+不需要加载 yaml 和日志等配置管理器的依赖。
+"""
 
-from config.config_manager import ConfigManager
 from config.app_config import APP_INFO, DEFAULT_CONFIG, SYSTEM_CONFIG
 
-__all__ = ["ConfigManager", "APP_INFO", "DEFAULT_CONFIG", "SYSTEM_CONFIG"] 
\ No newline at end of file
+# 按需加载的名称 -> 所在的子模块
+_LAZY_ATTRS = {
+    "ConfigManager": "config_manager",
+    "ConfigLayers": "config_layers",
+    "parse_cli_overrides": "config_layers",
+    "parse_env_overrides": "config_layers",
+}
+
+
+def _import_submodule(module_name):
+    """导入子模块（使用静态 import 语句而不是 importlib，Nuitka 打包时才能发现这些模块）"""
+    if module_name == "config_manager":
+        from . import config_manager as module
+    else:
+        from . import config_layers as module
+    return module
+
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(_import_submodule(module_name), name)
+    # 缓存到模块命名空间，之后的访问不再经过 __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
+
+
+__all__ = [
+    "ConfigManager",
+    "APP_INFO",
+    "DEFAULT_CONFIG",
+    "SYSTEM_CONFIG",
+    "ConfigLayers",
+    "parse_cli_overrides",
+    "parse_env_overrides",
+]
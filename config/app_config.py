@@ -23,6 +23,13 @@ DEFAULT_CONFIG = {
         "retention_days": 7,  # 日志保留天数
         "rotation": "1 day",  # 日志轮转周期
         "debug_mode": False,  # 调试模式默认关闭
+        "structured": False,  # 是否将文件日志写为结构化 JSON Lines（默认写文本日志）
+        "compression_level": 3,  # 轮转日志的 zstd 压缩级别（1-22，越大压缩率越高、越慢）
+        "max_total_size_mb": 0,  # 日志目录总大小上限（MB），超出时删除最旧的归档日志，0表示不限制
+        "ring_buffer_size": 2000,  # 内存中保留的最近调试日志条数，崩溃或从托盘导出时写入日志目录，0表示不保留
+        "flood_rate": 20,  # 同一处代码每秒最多写出的日志条数，超出部分被丢弃并汇总，0表示不限流
+        "flood_burst": 100,  # 同一处代码允许的突发日志条数
+        "flood_dedup": True,  # 是否把同一处代码连续写出的相同日志合并为"重复了 N 次"
     },
     "application": {
         "auto_start": False,  # 开机自启动默认关闭
@@ -39,5 +46,11 @@ SYSTEM_CONFIG = {
     "log_dir_name": "logs",  # 日志目录名称
     "config_file_name": "config.yaml",  # 配置文件名称
     "network_timeout": 10,  # 网络请求超时时间（秒）
+    "config_backend": "yaml",  # 配置存储后端：yaml（可手动编辑）/ json / sqlite
+    "config_save_delay": 0.3,  # 配置保存合并等待时间（秒），期间的多次保存只写入一次
+    "config_journal": False,  # 是否使用追加式变更日志保存配置（每次修改只追加记录，退出时合并回配置文件）
+    "config_journal_compact_threshold": 256,  # 变更日志记录数达到该值时合并回配置文件
+    "config_lock_timeout": 5.0,  # 获取配置文件锁的超时时间（秒）
+    "env_prefix": "",  # 环境变量覆盖前缀（空字符串表示根据应用名称生成，如 ACE_PYQT__）
     "require_admin_privileges": False,  # 是否要求管理员权限启动应用程序
 }
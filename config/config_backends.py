@@ -0,0 +1,383 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+配置存储后端模块
+
+ConfigManager 通过统一的后端接口读写配置文档（嵌套字典）：
+- yaml:   人类可编辑的 YAML 文件（默认，与之前的行为一致）
+- json:   JSON 文件，序列化和解析比 YAML 快得多
+- sqlite: SQLite 键值表，保存时只原地更新变化的配置项
+
+文件型后端（yaml/json）使用 ConfigStore 提供的文件锁和变更戳，并支持解析结果快照；
+SQLite 后端依靠数据库自身的事务和锁保证多进程安全。
+"""
+
+import json
+import sqlite3
+import threading
+from pathlib import Path
+
+import yaml
+
+from utils.logger import logger
+from config.config_layers import merge_dicts
+from config.config_store import ConfigStore, YAML_STAMP, JSON_STAMP
+
+# 优先使用 libyaml 提供的 C 实现，不可用时回退到纯 Python 实现
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+
+def _read_path(data, keys, default=None):
+    """按键序列从嵌套字典中读取值"""
+    current = data
+    try:
+        for key in keys:
+            current = current[key]
+        return current
+    except (KeyError, TypeError):
+        return default
+
+
+def _write_path(data, keys, value):
+    """按键序列在嵌套字典中设置值"""
+    current = data
+    for key in keys[:-1]:
+        current = current.setdefault(key, {})
+    current[keys[-1]] = value
+
+
+def _flatten(data, prefix=()):
+    """
+    将嵌套字典展开为 (键序列, 值) 列表
+
+    Args:
+        data (dict): 嵌套字典
+        prefix (tuple): 当前键序列前缀
+
+    Returns:
+        list: (键序列, 值) 列表
+    """
+    items = []
+    for key, value in data.items():
+        keys = prefix + (key,)
+        if isinstance(value, dict):
+            items.extend(_flatten(value, keys))
+        else:
+            items.append((keys, value))
+    return items
+
+
+class ConfigBackend:
+    """配置存储后端基类"""
+
+    # 后端名称和默认文件扩展名
+    name = None
+    suffix = None
+
+    # 是否支持解析结果快照（只有需要解析文本的后端才需要）
+    cacheable = False
+
+    def __init__(self, path, lock_timeout=5.0):
+        """
+        初始化存储后端
+
+        Args:
+            path (str | Path): 存储文件路径
+            lock_timeout (float): 获取锁的超时时间（秒）
+        """
+        self.path = Path(path)
+        self.lock_timeout = lock_timeout
+
+    def exists(self):
+        """存储文件是否存在"""
+        return self.path.exists()
+
+    def load(self):
+        """
+        读取完整的配置文档
+
+        Returns:
+            dict | None: 配置文档，内容为空或无效时返回None
+        """
+        raise NotImplementedError
+
+    def save(self, data, dirty_paths=None):
+        """
+        保存配置文档
+
+        Args:
+            data (dict): 完整的配置文档
+            dirty_paths (list, optional): 本次变更的配置项键序列，为None时整体覆盖
+
+        Returns:
+            tuple: (stat 结果, 写入的原始内容, 是否与其他写入者的修改发生冲突)，
+                不支持快照的后端前两项为None
+        """
+        raise NotImplementedError
+
+    def is_stale(self):
+        """最近一次读取或写入后存储是否被其他写入者修改过"""
+        raise NotImplementedError
+
+    def mark_stale(self):
+        """强制下次 is_stale() 返回True"""
+        raise NotImplementedError
+
+    def close(self):
+        """释放后端占用的资源"""
+
+
+class FileBackend(ConfigBackend):
+    """基于文本文件的存储后端"""
+
+    cacheable = True
+    stamp_format = YAML_STAMP
+
+    def __init__(self, path, lock_timeout=5.0):
+        super().__init__(path, lock_timeout)
+        self._store = ConfigStore(self.path, lock_timeout, self.stamp_format)
+
+    def decode(self, raw):
+        """
+        解析文件内容
+
+        Args:
+            raw (bytes): 文件内容（可以包含变更戳行）
+
+        Returns:
+            解析结果
+        """
+        raise NotImplementedError
+
+    def encode(self, data):
+        """
+        序列化配置文档
+
+        Args:
+            data (dict): 配置文档
+
+        Returns:
+            bytes: 文件内容（不含变更戳行）
+        """
+        raise NotImplementedError
+
+    @property
+    def stamp(self):
+        """最近一次读取或写入的变更戳"""
+        return self._store.stamp
+
+    def read_raw(self):
+        """
+        在共享锁下读取文件原始内容
+
+        Returns:
+            tuple: (stat 结果, 文件原始内容)
+        """
+        return self._store.read()
+
+    def load(self):
+        _, raw = self.read_raw()
+        data = self.decode(raw)
+        return data if isinstance(data, dict) and data else None
+
+    def save(self, data, dirty_paths=None):
+        def render(disk_body):
+            merged = data
+            if disk_body is not None and dirty_paths is not None:
+                merged = self._merge_disk_data(disk_body, data, dirty_paths)
+            return self.encode(merged)
+
+        return self._store.write(render)
+
+    def _merge_disk_data(self, disk_body, data, dirty_paths):
+        """
+        将本次变更的配置项合并到其他写入者的文件内容中
+
+        Args:
+            disk_body (bytes): 磁盘上的文件内容
+            data (dict): 本进程的配置文档
+            dirty_paths (list): 本次变更的配置项键序列
+
+        Returns:
+            dict: 合并后的配置文档
+        """
+        try:
+            disk_data = self.decode(disk_body)
+        except ValueError as e:
+            logger.warning(f"其他进程写入的配置文件无法解析，将整体覆盖: {e}")
+            return data
+        if not isinstance(disk_data, dict):
+            return data
+
+        merged = merge_dicts(disk_data)
+        for keys in dirty_paths:
+            _write_path(merged, keys, _read_path(data, keys))
+        return merged
+
+    def is_stale(self):
+        return self._store.is_stale()
+
+    def mark_stale(self):
+        self._store.mark_stale()
+
+
+class YAMLBackend(FileBackend):
+    """YAML 文件后端"""
+
+    name = "yaml"
+    suffix = ".yaml"
+
+    def decode(self, raw):
+        try:
+            return yaml.load(raw, Loader=YAML_LOADER)
+        except yaml.YAMLError as e:
+            raise ValueError(str(e)) from e
+
+    def encode(self, data):
+        return yaml.dump(data, Dumper=YAML_DUMPER, default_flow_style=False, allow_unicode=True).encode("utf-8")
+
+
+class JSONBackend(FileBackend):
+    """JSON 文件后端"""
+
+    name = "json"
+    suffix = ".json"
+    stamp_format = JSON_STAMP
+
+    def decode(self, raw):
+        return json.loads(self.stamp_format.strip(raw))
+
+    def encode(self, data):
+        return json.dumps(data, ensure_ascii=False, indent=2, sort_keys=True).encode("utf-8")
+
+
+class SQLiteBackend(ConfigBackend):
+    """
+    SQLite 键值后端
+
+    每个配置项以点分路径为键保存一行，值为 JSON 编码。保存时在一个写事务中只更新变化的行，
+    并递增 user_version 作为变更戳；通过 data_version 低成本地检测其他连接的写入。
+    """
+
+    name = "sqlite"
+    suffix = ".db"
+
+    def __init__(self, path, lock_timeout=5.0):
+        super().__init__(path, lock_timeout)
+        self._conn = None
+        self._lock = threading.Lock()
+        self._data_version = None
+        self._stale = False
+
+    def _connect(self):
+        """按需打开数据库连接（需在持有锁时调用）"""
+        if self._conn is None:
+            # 连接由主线程和后台写入线程共用，访问由 self._lock 串行化
+            conn = sqlite3.connect(
+                str(self.path), timeout=self.lock_timeout, isolation_level=None, check_same_thread=False
+            )
+            conn.execute("CREATE TABLE IF NOT EXISTS config (path TEXT PRIMARY KEY, value TEXT NOT NULL)")
+            self._conn = conn
+        return self._conn
+
+    def _remember(self, conn):
+        """记录当前的 data_version，用于检测其他连接的写入"""
+        self._data_version = conn.execute("PRAGMA data_version").fetchone()[0]
+        self._stale = False
+
+    @property
+    def stamp(self):
+        """数据库中的变更戳"""
+        with self._lock:
+            return self._connect().execute("PRAGMA user_version").fetchone()[0]
+
+    def load(self):
+        with self._lock:
+            conn = self._connect()
+            rows = conn.execute("SELECT path, value FROM config").fetchall()
+            self._remember(conn)
+
+        data = {}
+        for path, value in rows:
+            try:
+                _write_path(data, path.split("."), json.loads(value))
+            except (ValueError, TypeError, AttributeError) as e:
+                logger.warning(f"配置项 {path} 的值无法解析，已忽略: {e}")
+        return data or None
+
+    def save(self, data, dirty_paths=None):
+        if dirty_paths is None:
+            items = _flatten(data)
+        else:
+            items = [(tuple(keys), _read_path(data, keys)) for keys in dirty_paths]
+        rows = [(".".join(keys), json.dumps(value, ensure_ascii=False)) for keys, value in items]
+
+        with self._lock:
+            conn = self._connect()
+            # 上次读取后其他连接是否写入过，需要在本次写事务之前判断
+            conflict = self._stale or (
+                self._data_version is not None
+                and conn.execute("PRAGMA data_version").fetchone()[0] != self._data_version
+            )
+
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                if dirty_paths is None:
+                    conn.execute("DELETE FROM config")
+                conn.executemany("INSERT OR REPLACE INTO config (path, value) VALUES (?, ?)", rows)
+                stamp = conn.execute("PRAGMA user_version").fetchone()[0] + 1
+                conn.execute(f"PRAGMA user_version = {int(stamp)}")
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+
+            if not conflict:
+                self._remember(conn)
+
+        # 只写入了变化的行，其他连接的修改不会被覆盖，冲突时只需重新加载
+        return None, None, conflict
+
+    def is_stale(self):
+        with self._lock:
+            if self._stale:
+                return True
+            if self._data_version is None:
+                return False
+            return self._connect().execute("PRAGMA data_version").fetchone()[0] != self._data_version
+
+    def mark_stale(self):
+        self._stale = True
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+# 可用的存储后端
+BACKENDS = {backend.name: backend for backend in (YAMLBackend, JSONBackend, SQLiteBackend)}
+
+
+def create_backend(name, path, lock_timeout=5.0):
+    """
+    按名称创建存储后端
+
+    Args:
+        name (str): 后端名称（yaml / json / sqlite）
+        path (str | Path): 存储文件路径
+        lock_timeout (float): 获取锁的超时时间（秒）
+
+    Returns:
+        ConfigBackend: 存储后端实例
+
+    Raises:
+        ValueError: 未知的后端名称
+    """
+    backend_cls = BACKENDS.get(name)
+    if backend_cls is None:
+        raise ValueError(f"未知的配置存储后端: {name}，可选: {', '.join(BACKENDS)}")
+    return backend_cls(path, lock_timeout)
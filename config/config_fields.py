@@ -0,0 +1,170 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+配置字段描述符模块
+
+用预编译的描述符替代点分路径字符串查找：配置路径在类创建时拆分为键元组，
+类型转换和校验函数在类创建时绑定，字段值存放在 __slots__ 中，
+每个字段对应一个脏标记位，保存时只需处理发生变化的字段。
+"""
+
+
+class ConfigField:
+    """配置字段描述符"""
+
+    __slots__ = ("path", "keys", "type_func", "validator", "name", "slot_name", "index", "mask", "_get", "_set")
+
+    def __init__(self, path, type_func, validator=None):
+        """
+        初始化配置字段
+
+        Args:
+            path (str): 点分隔的配置路径，如 'application.theme'
+            type_func (callable): 类型转换函数
+            validator (callable, optional): 验证函数，返回None表示值无效
+        """
+        self.path = path
+        self.keys = tuple(path.split("."))
+        self.type_func = type_func
+        self.validator = validator
+        self.name = None
+        self.slot_name = None
+        self.index = -1
+        self.mask = 0
+        self._get = None
+        self._set = None
+
+    def __set_name__(self, owner, name):
+        self.name = name
+        self.slot_name = f"_cfg_{name}"
+
+    def bind(self, member, index):
+        """
+        绑定 __slots__ 存储和脏标记位（由 ConfigMeta 在类创建时调用）
+
+        Args:
+            member: 字段值对应的 slot 成员描述符
+            index (int): 字段序号，决定脏标记位
+        """
+        self.index = index
+        self.mask = 1 << index
+        self._get = member.__get__
+        self._set = member.__set__
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        return self._get(instance, owner)
+
+    def __set__(self, instance, value):
+        try:
+            if self._get(instance) == value:
+                return
+        except AttributeError:
+            # 首次赋值（初始化默认值）不标记为脏
+            self._set(instance, value)
+            return
+
+        self._set(instance, value)
+        instance._cfg_dirty |= self.mask
+
+    def assign(self, instance, value):
+        """
+        为字段赋值但不标记为脏（用于不应写回配置文件的覆盖值）
+
+        Args:
+            instance: 配置管理器实例
+            value: 字段值
+        """
+        self._set(instance, value)
+
+    def convert(self, value):
+        """
+        对原始值进行类型转换和校验
+
+        Args:
+            value: 原始值
+
+        Returns:
+            转换并校验后的值
+
+        Raises:
+            ValueError: 类型转换失败或校验不通过
+        """
+        try:
+            converted_value = self.type_func(value)
+        except (ValueError, TypeError) as e:
+            raise ValueError(f"配置项 {self.path} 的值 {value!r} 类型转换失败: {e}") from e
+
+        if self.validator:
+            validated_value = self.validator(converted_value)
+            if validated_value is None:
+                raise ValueError(f"配置项 {self.path} 的值 {converted_value!r} 无效")
+            converted_value = validated_value
+
+        return converted_value
+
+    def read(self, data, default=None):
+        """
+        从嵌套字典中读取字段值
+
+        Args:
+            data (dict): 数据字典
+            default: 默认值
+
+        Returns:
+            获取到的值或默认值
+        """
+        current = data
+        try:
+            for key in self.keys:
+                current = current[key]
+            return current
+        except (KeyError, TypeError):
+            return default
+
+    def write(self, data, value):
+        """
+        将字段值写入嵌套字典
+
+        Args:
+            data (dict): 数据字典
+            value: 要设置的值
+        """
+        current = data
+        for key in self.keys[:-1]:
+            current = current.setdefault(key, {})
+        current[self.keys[-1]] = value
+
+
+class ConfigMeta(type):
+    """收集配置字段并为其生成 __slots__ 存储的元类"""
+
+    def __new__(mcs, name, bases, namespace):
+        own_fields = {key: value for key, value in namespace.items() if isinstance(value, ConfigField)}
+
+        if own_fields:
+            slots = list(namespace.get("__slots__", ()))
+            if not any(hasattr(base, "_config_fields") for base in bases):
+                # 首个定义字段的类：保留 __dict__ 以便存放普通实例属性，并加入脏标记存储
+                slots += ["__dict__", "__weakref__", "_cfg_dirty"]
+            slots += [f"_cfg_{field_name}" for field_name in own_fields]
+            namespace["__slots__"] = tuple(slots)
+
+        cls = super().__new__(mcs, name, bases, namespace)
+
+        fields = {}
+        for base in reversed(cls.__mro__[1:]):
+            fields.update(getattr(base, "_config_fields", {}))
+
+        for field_name, field in own_fields.items():
+            field.bind(cls.__dict__[field.slot_name], len(fields))
+            fields[field_name] = field
+
+        cls._config_fields = fields
+        # 兼容旧的映射接口：属性名 -> (配置路径, 类型转换函数, 验证函数)
+        cls.CONFIG_MAPPING = {
+            field_name: (field.path, field.type_func, field.validator) for field_name, field in fields.items()
+        }
+        return cls
@@ -0,0 +1,176 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+配置变更日志模块
+
+每次修改配置时只向日志文件追加几条 JSON 行记录（配置路径、值、时间戳），
+而不是重写整个配置文件，使单次保存的磁盘 I/O 与配置项总数无关。
+记录按批次调用 fsync 落盘；加载配置时重放日志，程序异常退出后也能恢复到最后的状态。
+日志超过阈值或程序正常退出时合并回主配置文件并清空。
+"""
+
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from utils.logger import logger
+
+
+class ConfigJournal:
+    """追加式配置变更日志"""
+
+    def __init__(self, journal_file, sync_every=16, sync_interval=1.0):
+        """
+        初始化变更日志
+
+        Args:
+            journal_file (str | Path): 日志文件路径
+            sync_every (int): 累计多少条未落盘记录后调用一次 fsync
+            sync_interval (float): 距上次 fsync 超过该时长（秒）后，下次追加时调用 fsync
+        """
+        self.journal_file = Path(journal_file)
+        self.sync_every = sync_every
+        self.sync_interval = sync_interval
+
+        self._lock = threading.Lock()
+        self._file = None
+        self._record_count = None
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+        # 累计追加的记录数（统计用）
+        self.append_count = 0
+
+    @property
+    def record_count(self):
+        """日志中的记录数"""
+        with self._lock:
+            if self._record_count is None:
+                self._record_count = len(self._read_records())
+            return self._record_count
+
+    def _open(self):
+        """按需以追加模式打开日志文件（需在持有锁时调用）"""
+        if self._file is None:
+            self._file = open(self.journal_file, "ab")
+        return self._file
+
+    def append(self, changes):
+        """
+        追加变更记录
+
+        Args:
+            changes (dict): 配置路径到新值的映射
+        """
+        if not changes:
+            return
+
+        timestamp = round(time.time(), 3)
+        data = b"".join(
+            json.dumps({"k": path, "v": value, "t": timestamp}, ensure_ascii=False).encode("utf-8") + b"\n"
+            for path, value in changes.items()
+        )
+
+        with self._lock:
+            f = self._open()
+            f.write(data)
+            f.flush()
+
+            self.append_count += len(changes)
+            if self._record_count is not None:
+                self._record_count += len(changes)
+            self._unsynced += len(changes)
+            if self._unsynced >= self.sync_every or time.monotonic() - self._last_sync >= self.sync_interval:
+                self._sync_locked()
+
+    def _sync_locked(self):
+        """将已写入的记录刷新到磁盘（需在持有锁时调用）"""
+        if self._file is not None and self._unsynced:
+            os.fsync(self._file.fileno())
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+    def sync(self):
+        """立即将所有记录刷新到磁盘"""
+        with self._lock:
+            self._sync_locked()
+
+    def _read_records(self, repair=False):
+        """
+        读取日志中的所有完整记录（需在持有锁时调用）
+
+        异常退出时最后一行可能只写入了一部分，遇到无法解析的行时停止读取。
+
+        Args:
+            repair (bool): 是否截掉无法解析的部分，避免之后追加的记录接在残缺的行后面
+
+        Returns:
+            list: (配置路径, 值) 列表，按写入顺序排列
+        """
+        try:
+            raw = self.journal_file.read_bytes()
+        except FileNotFoundError:
+            return []
+
+        records = []
+        offset = 0
+        for line in raw.splitlines(keepends=True):
+            try:
+                if not line.endswith(b"\n"):
+                    raise ValueError("记录未写完")
+                if line.strip():
+                    record = json.loads(line)
+                    records.append((record["k"], record["v"]))
+            except (ValueError, KeyError, TypeError):
+                logger.warning(f"配置变更日志第 {len(records) + 1} 条记录不完整，已忽略该记录及之后的内容")
+                if repair:
+                    self._truncate_locked(offset)
+                break
+            offset += len(line)
+        return records
+
+    def _truncate_locked(self, size):
+        """将日志文件截断到指定长度（需在持有锁时调用）"""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        try:
+            with open(self.journal_file, "r+b") as f:
+                f.truncate(size)
+        except OSError as e:
+            logger.error(f"修复配置变更日志失败: {str(e)}")
+
+    def replay(self):
+        """
+        读取日志中的所有记录用于重放
+
+        Returns:
+            list: (配置路径, 值) 列表，按写入顺序排列
+        """
+        with self._lock:
+            records = self._read_records(repair=True)
+            self._record_count = len(records)
+            return records
+
+    def reset(self):
+        """清空日志（配置已合并回主配置文件后调用）"""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+            try:
+                os.unlink(self.journal_file)
+            except FileNotFoundError:
+                pass
+            self._record_count = 0
+            self._unsynced = 0
+
+    def close(self):
+        """刷新并关闭日志文件"""
+        with self._lock:
+            self._sync_locked()
+            if self._file is not None:
+                self._file.close()
+                self._file = None
@@ -0,0 +1,309 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+分层配置模块
+
+配置按优先级从低到高分为五层：
+    defaults  内置默认配置（DEFAULT_CONFIG）
+    system    程序传入的自定义默认配置
+    user      用户配置文件
+    env       环境变量覆盖，如 ACE_PYQT__application__theme=dark
+    cli       命令行覆盖，如 --set application.theme=dark
+
+合并结果按需计算并缓存，只有某一层发生变化时才会失效。
+"""
+
+import os
+import re
+import yaml
+
+# 配置层名称，按优先级从低到高排列
+LAYER_ORDER = ("defaults", "system", "user", "env", "cli")
+
+
+def merge_dicts(*layers):
+    """
+    按顺序深度合并多个嵌套字典，后面的字典优先
+
+    结果中的嵌套字典都是新建的，不会修改任何输入字典。
+
+    Args:
+        *layers (dict): 要合并的字典，None 会被忽略
+
+    Returns:
+        dict: 合并后的新字典
+    """
+    result = {}
+    for layer in layers:
+        if layer:
+            _merge_into(result, layer)
+    return result
+
+
+def _merge_into(target, source):
+    """
+    将 source 深度合并到 target 中，source 中的嵌套字典会被复制
+
+    Args:
+        target (dict): 目标字典
+        source (dict): 来源字典
+    """
+    for key, value in source.items():
+        if isinstance(value, dict):
+            current = target.get(key)
+            if not isinstance(current, dict):
+                current = target[key] = {}
+            _merge_into(current, value)
+        else:
+            target[key] = value
+
+
+def _set_path(data, keys, value):
+    """
+    按键序列在嵌套字典中设置值
+
+    Args:
+        data (dict): 数据字典
+        keys (list): 键序列
+        value: 要设置的值
+    """
+    current = data
+    for key in keys[:-1]:
+        child = current.get(key)
+        if not isinstance(child, dict):
+            child = current[key] = {}
+        current = child
+    current[keys[-1]] = value
+
+
+def parse_override_value(text):
+    """
+    将覆盖项的字符串值解析为对应的类型
+
+    使用 YAML 标量规则，"true" 解析为布尔值，"900" 解析为整数，其余保持字符串。
+
+    Args:
+        text (str): 原始字符串
+
+    Returns:
+        解析后的值
+    """
+    try:
+        value = yaml.safe_load(text)
+    except yaml.YAMLError:
+        return text
+    # 只接受标量，避免 "[1, 2]" 之类的值意外变成容器
+    if isinstance(value, (dict, list)) or value is None:
+        return text
+    return value
+
+
+def get_env_prefix(app_name):
+    """
+    根据应用名称生成环境变量前缀
+
+    Args:
+        app_name (str): 应用名称，如 "ACE-PyQt"
+
+    Returns:
+        str: 环境变量前缀，如 "ACE_PYQT__"
+    """
+    return re.sub(r"[^0-9A-Za-z]+", "_", app_name).strip("_").upper() + "__"
+
+
+def parse_env_overrides(prefix, environ=None):
+    """
+    从环境变量中解析配置覆盖项
+
+    变量名去掉前缀后以双下划线分隔路径，如 ACE_PYQT__window__width=900
+    对应配置路径 window.width。
+
+    Args:
+        prefix (str): 环境变量前缀
+        environ (dict, optional): 环境变量字典，默认为 os.environ
+
+    Returns:
+        dict: 嵌套的覆盖配置
+    """
+    environ = os.environ if environ is None else environ
+    overrides = {}
+    prefix_upper = prefix.upper()
+    for name, text in environ.items():
+        # Windows 的环境变量名不区分大小写，统一按大写比较前缀
+        if not name.upper().startswith(prefix_upper):
+            continue
+        keys = [key.lower() for key in name[len(prefix):].split("__") if key]
+        if keys:
+            _set_path(overrides, keys, parse_override_value(text))
+    return overrides
+
+
+def parse_cli_overrides(argv):
+    """
+    从命令行参数中解析配置覆盖项
+
+    支持 "--set key=value" 和 "--set=key=value" 两种写法，key 为点分隔的配置路径，
+    可以多次指定。
+
+    Args:
+        argv (list): 命令行参数列表
+
+    Returns:
+        dict: 嵌套的覆盖配置
+    """
+    overrides = {}
+    index = 0
+    while index < len(argv):
+        arg = argv[index]
+        item = None
+        if arg == "--set" and index + 1 < len(argv):
+            item = argv[index + 1]
+            index += 1
+        elif arg.startswith("--set="):
+            item = arg[len("--set="):]
+        index += 1
+
+        if item is None:
+            continue
+        key, sep, text = item.partition("=")
+        keys = [part for part in key.strip().split(".") if part]
+        if not sep or not keys:
+            continue
+        _set_path(overrides, keys, parse_override_value(text.strip()))
+    return overrides
+
+
+class ConfigLayers:
+    """分层配置栈，合并结果按需计算并缓存"""
+
+    def __init__(self, **layers):
+        """
+        初始化配置栈
+
+        Args:
+            **layers: 各层的初始数据，键为 LAYER_ORDER 中的层名称
+        """
+        self._layers = {name: {} for name in LAYER_ORDER}
+        self._version = 0
+        self._merged_cache = {}
+        for name, data in layers.items():
+            self.set_layer(name, data)
+
+    def _check_layer(self, name):
+        """检查层名称是否有效"""
+        if name not in self._layers:
+            raise ValueError(f"未知的配置层: {name}")
+
+    def set_layer(self, name, data):
+        """
+        替换某一层的全部数据
+
+        Args:
+            name (str): 层名称
+            data (dict | None): 嵌套的配置数据
+        """
+        self._check_layer(name)
+        self._layers[name] = merge_dicts(data)
+        self._invalidate(name)
+
+    def get_layer(self, name):
+        """
+        获取某一层的数据（返回副本）
+
+        Args:
+            name (str): 层名称
+
+        Returns:
+            dict: 该层的配置数据
+        """
+        self._check_layer(name)
+        return merge_dicts(self._layers[name])
+
+    def set_value(self, name, path, value):
+        """
+        设置某一层中的单个配置项
+
+        Args:
+            name (str): 层名称
+            path (str): 点分隔的配置路径
+            value: 要设置的值
+        """
+        self._check_layer(name)
+        _set_path(self._layers[name], path.split("."), value)
+        self._invalidate(name)
+
+    def _invalidate(self, name):
+        """
+        清除包含指定层的合并缓存
+
+        Args:
+            name (str): 发生变化的层名称
+        """
+        self._version += 1
+        for names in [names for names in self._merged_cache if name in names]:
+            del self._merged_cache[names]
+
+    @property
+    def version(self):
+        """配置栈版本号，任意一层变化时递增"""
+        return self._version
+
+    def merged(self, *names):
+        """
+        获取合并后的配置视图
+
+        结果会被缓存直到某一层发生变化，调用方不应修改返回的字典。
+
+        Args:
+            *names (str): 参与合并的层名称，为空时合并全部层
+
+        Returns:
+            dict: 合并后的配置
+        """
+        names = tuple(name for name in LAYER_ORDER if not names or name in names)
+        result = self._merged_cache.get(names)
+        if result is None:
+            result = merge_dicts(*(self._layers[name] for name in names))
+            self._merged_cache[names] = result
+        return result
+
+    def get(self, path, default=None):
+        """
+        从合并后的配置中读取单个配置项
+
+        Args:
+            path (str): 点分隔的配置路径
+            default: 配置项不存在时的默认值
+
+        Returns:
+            配置项的值或默认值
+        """
+        current = self.merged()
+        try:
+            for key in path.split("."):
+                current = current[key]
+            return current
+        except (KeyError, TypeError):
+            return default
+
+    def source_of(self, path):
+        """
+        查找提供某个配置项最终值的层
+
+        Args:
+            path (str): 点分隔的配置路径
+
+        Returns:
+            str | None: 层名称，没有任何层提供该配置项时返回None
+        """
+        keys = path.split(".")
+        for name in reversed(LAYER_ORDER):
+            current = self._layers[name]
+            try:
+                for key in keys:
+                    current = current[key]
+                return name
+            except (KeyError, TypeError):
+                continue
+        return None
@@ -5,31 +5,56 @@
 配置管理模块
 """
 
-import yaml
+import copy
+from contextlib import contextmanager
 from pathlib import Path
-from utils.logger import logger
+from utils.logger import logger, get_logger
 from utils.system_utils import check_auto_start, enable_auto_start, disable_auto_start
 from config.app_config import APP_INFO, DEFAULT_CONFIG, SYSTEM_CONFIG
+from config.config_writer import ConfigWriter
+from config.config_backends import BACKENDS, create_backend
+from config.config_snapshot import ConfigSnapshot
+from config.config_journal import ConfigJournal
+from config.config_fields import ConfigField, ConfigMeta
+from config.config_layers import ConfigLayers, merge_dicts, get_env_prefix, parse_env_overrides
 
+log = get_logger(__name__)
 
-class ConfigManager:
+# 读取已保存文档时表示"配置项不存在"的哨兵值
+_MISSING = object()
+
+
+class ConfigManager(metaclass=ConfigMeta):
     """配置管理类"""
 
-    # 配置属性映射：(属性名, 配置路径, 类型转换函数, 验证函数)
-    CONFIG_MAPPING = {
-        "show_notifications": ("notifications.enabled", bool, None),
-        "log_retention_days": ("logging.retention_days", int, None),
-        "log_rotation": ("logging.rotation", str, None),
-        "debug_mode": ("logging.debug_mode", bool, None),
-        "auto_start": ("application.auto_start", bool, None),
-        "close_to_tray": ("application.close_to_tray", bool, None),
-        "theme": ("application.theme", str, lambda x: x if x in ["light", "dark"] else None),
-        "check_update_on_start": ("application.check_update_on_start", bool, None),
-        "window_width": ("window.width", int, None),
-        "window_height": ("window.height", int, None),
-    }
-
-    def __init__(self, custom_app_info=None, custom_default_config=None, custom_system_config=None):
+    # 配置字段：ConfigField(配置路径, 类型转换函数, 验证函数)
+    # 由 ConfigMeta 在类创建时生成 __slots__ 存储、脏标记位和兼容的 CONFIG_MAPPING
+    show_notifications = ConfigField("notifications.enabled", bool)
+    log_retention_days = ConfigField("logging.retention_days", int)
+    log_rotation = ConfigField("logging.rotation", str)
+    debug_mode = ConfigField("logging.debug_mode", bool)
+    log_structured = ConfigField("logging.structured", bool)
+    log_compression_level = ConfigField("logging.compression_level", int, lambda x: x if 1 <= x <= 22 else None)
+    log_max_total_size_mb = ConfigField("logging.max_total_size_mb", int, lambda x: x if x >= 0 else None)
+    log_ring_buffer_size = ConfigField("logging.ring_buffer_size", int, lambda x: x if x >= 0 else None)
+    log_flood_rate = ConfigField("logging.flood_rate", float, lambda x: x if x >= 0 else None)
+    log_flood_burst = ConfigField("logging.flood_burst", int, lambda x: x if x >= 1 else None)
+    log_flood_dedup = ConfigField("logging.flood_dedup", bool)
+    auto_start = ConfigField("application.auto_start", bool)
+    close_to_tray = ConfigField("application.close_to_tray", bool)
+    theme = ConfigField("application.theme", str, lambda x: x if x in ["light", "dark"] else None)
+    check_update_on_start = ConfigField("application.check_update_on_start", bool)
+    window_width = ConfigField("window.width", int)
+    window_height = ConfigField("window.height", int)
+
+    def __init__(
+        self,
+        custom_app_info=None,
+        custom_default_config=None,
+        custom_system_config=None,
+        cli_overrides=None,
+        defer_auto_start=False,
+    ):
         """
         初始化配置管理器
 
@@ -37,18 +62,47 @@ class ConfigManager:
             custom_app_info (dict, optional): 自定义应用信息，用于覆盖默认值
             custom_default_config (dict, optional): 自定义默认配置，用于覆盖默认值
             custom_system_config (dict, optional): 自定义系统配置，用于覆盖默认值
+            cli_overrides (dict, optional): 命令行覆盖配置（见 parse_cli_overrides），优先级最高且不会写回配置文件
+            defer_auto_start (bool, optional): 加载配置时不检查开机自启注册表，由调用方稍后调用 sync_auto_start
         """
         # 合并配置
         self.app_info = self._merge_config(APP_INFO, custom_app_info)
-        self.default_config = self._merge_config(DEFAULT_CONFIG, custom_default_config, deep=True)
         self.system_config = self._merge_config(SYSTEM_CONFIG, custom_system_config)
 
+        # 分层配置：默认值 < 自定义默认值 < 配置文件 < 环境变量 < 命令行
+        env_prefix = self.system_config.get("env_prefix") or get_env_prefix(self.app_info["name"])
+        self.layers = ConfigLayers(
+            defaults=DEFAULT_CONFIG,
+            system=custom_default_config,
+            env=parse_env_overrides(env_prefix),
+            cli=cli_overrides,
+        )
+        self.default_config = self.layers.merged("defaults", "system")
+        self._override_values = {}
+
         # 设置配置路径
         self._setup_paths()
 
-        # 初始化配置属性
+        # 初始化配置属性，字段修改后对应的脏标记位被置位
+        self._cfg_dirty = 0
         self._init_config_attributes()
 
+        # 配置项变更监听器：属性名 -> 回调列表
+        self._listeners = {}
+        self._global_listeners = []
+
+        # 批量更新嵌套深度，大于0时保存操作推迟到提交时执行
+        self._batch_depth = 0
+
+        # 推迟的开机自启同步：None 表示无需同步，否则为配置文件中是否包含开机自启设置
+        self._defer_auto_start = defer_auto_start
+        self._pending_auto_start_sync = None
+
+        # 后台合并写入器：最后一次保存请求后静默一段时间再写盘
+        # _document 为最近一次保存（或加载）的配置数据，保存时只更新其中的脏字段
+        self._document = {}
+        self._writer = ConfigWriter(self._write_config_file, delay=self.system_config.get("config_save_delay", 0.3))
+
         # 确保配置目录存在并加载配置文件
         self._ensure_directories()
         self.load_config()
@@ -65,28 +119,15 @@ class ConfigManager:
         Returns:
             dict: 合并后的配置
         """
+        if deep:
+            # 深度合并会复制嵌套字典，不会修改基础配置
+            return merge_dicts(base_config, custom_config)
+
         result = base_config.copy()
         if custom_config:
-            if deep:
-                self._deep_update(result, custom_config)
-            else:
-                result.update(custom_config)
+            result.update(custom_config)
         return result
 
-    def _deep_update(self, d, u):
-        """
-        递归更新嵌套字典
-
-        Args:
-            d (dict): 要更新的目标字典
-            u (dict): 包含更新值的字典
-        """
-        for k, v in u.items():
-            if isinstance(v, dict) and k in d and isinstance(d[k], dict):
-                self._deep_update(d[k], v)
-            else:
-                d[k] = v
-
     def _setup_paths(self):
         """设置配置相关路径"""
         # 获取项目根目录（脚本所在目录的上级目录）
@@ -100,51 +141,155 @@ class ConfigManager:
             self.config_dir = project_root
 
         self.log_dir = self.config_dir / self.system_config["log_dir_name"]
-        self.config_file = self.config_dir / self.system_config["config_file_name"]
+
+        # 配置存储后端（文件型后端带文件锁和变更戳，防止多个进程同时读写时互相覆盖）
+        backend_name = self.system_config.get("config_backend", "yaml")
+        if backend_name not in BACKENDS:
+            logger.error(f"未知的配置存储后端: {backend_name}，将使用 yaml 后端")
+            backend_name = "yaml"
+        self.config_file = self._get_backend_path(backend_name)
+        self._backend = create_backend(
+            backend_name, self.config_file, self.system_config.get("config_lock_timeout", 5.0)
+        )
+
+        # 解析结果快照，配置文件未变化时跳过解析
+        snapshot_file = self.config_dir / f".{self.config_file.name}.snapshot"
+        self._snapshot = ConfigSnapshot(snapshot_file, self._get_schema_fingerprint())
+
+        # 追加式变更日志（可选）：每次保存只追加修改的配置项，超过阈值或退出时再合并回配置文件
+        self._journal = None
+        if self.system_config.get("config_journal"):
+            self._journal = ConfigJournal(self.config_dir / f".{self.config_file.name}.journal")
+
+    def _get_backend_path(self, backend_name):
+        """
+        获取存储后端对应的配置文件路径
+
+        yaml 后端沿用 config_file_name，其他后端将扩展名替换为后端自身的扩展名。
+
+        Args:
+            backend_name (str): 后端名称
+
+        Returns:
+            Path: 配置文件路径
+        """
+        file_name = self.system_config["config_file_name"]
+        if backend_name == "yaml":
+            return self.config_dir / file_name
+        return self.config_dir / (Path(file_name).stem + BACKENDS[backend_name].suffix)
+
+    def _migrate_backend(self):
+        """
+        首次使用某个存储后端时，从其他后端已有的配置文件迁移数据
+
+        迁移完成后旧文件重命名为 *.migrated 保留备份。
+
+        Returns:
+            bool: 是否完成了迁移
+        """
+        if self._backend.exists():
+            return False
+
+        for backend_name in BACKENDS:
+            if backend_name == self._backend.name:
+                continue
+
+            legacy_path = self._get_backend_path(backend_name)
+            if not legacy_path.exists():
+                continue
+
+            legacy = create_backend(backend_name, legacy_path, self._backend.lock_timeout)
+            try:
+                config_data = legacy.load()
+            except Exception as e:
+                logger.error(f"读取旧配置文件 {legacy_path.name} 失败，跳过迁移: {str(e)}")
+                continue
+            finally:
+                legacy.close()
+
+            if not config_data:
+                continue
+
+            try:
+                self._backend.save(config_data)
+                legacy_path.replace(legacy_path.with_name(legacy_path.name + ".migrated"))
+            except Exception as e:
+                logger.error(f"迁移配置文件失败: {str(e)}")
+                return False
+
+            log.debug("已将配置从 {} 后端迁移到 {} 后端", backend_name, self._backend.name)
+            return True
+
+        return False
+
+    def _get_schema_fingerprint(self):
+        """
+        获取配置结构指纹，配置映射变化后旧快照自动失效
+
+        Returns:
+            str: 配置结构指纹
+        """
+        return repr(
+            [
+                (attr_name, field.path, field.type_func.__name__, field.validator is not None)
+                for attr_name, field in self._config_fields.items()
+            ]
+        )
 
     def _init_config_attributes(self):
         """初始化配置属性为默认值"""
-        for attr_name, (config_path, type_func, _) in self.CONFIG_MAPPING.items():
-            default_value = self._get_nested_value(self.default_config, config_path)
-            setattr(self, attr_name, default_value)
+        for attr_name, value in self._get_default_values().items():
+            setattr(self, attr_name, value)
 
-    def _get_nested_value(self, data, path, default=None):
+    def _get_default_values(self):
         """
-        从嵌套字典中获取值
-
-        Args:
-            data (dict): 数据字典
-            path (str): 点分隔的路径，如 'application.theme'
-            default: 默认值
+        获取所有配置属性的默认值
 
         Returns:
-            获取到的值或默认值
+            dict: 属性名到默认值的映射
         """
-        keys = path.split(".")
-        current = data
-        try:
-            for key in keys:
-                current = current[key]
-            return current
-        except (KeyError, TypeError):
-            return default
+        return {attr_name: field.read(self.default_config) for attr_name, field in self._config_fields.items()}
+
+    def _mark_clean(self):
+        """以当前属性值作为已保存状态，并清除所有脏标记"""
+        self._document = self._build_config_data()
+        self._cfg_dirty = 0
+        self.layers.set_layer("user", self._document)
 
-    def _set_nested_value(self, data, path, value):
+    def _apply_overrides(self):
         """
-        在嵌套字典中设置值
+        应用环境变量和命令行覆盖项
 
-        Args:
-            data (dict): 数据字典
-            path (str): 点分隔的路径
-            value: 要设置的值
-        """
-        keys = path.split(".")
-        current = data
-        for key in keys[:-1]:
-            if key not in current:
-                current[key] = {}
-            current = current[key]
-        current[keys[-1]] = value
+        覆盖值直接写入字段而不标记为脏，因此不会被保存到配置文件中。
+        """
+        overrides = self.layers.merged("env", "cli")
+        self._override_values = {}
+        if not overrides:
+            return
+
+        for attr_name, field in self._config_fields.items():
+            value = field.read(overrides)
+            if value is None:
+                continue
+
+            try:
+                value = field.convert(value)
+            except ValueError as e:
+                logger.warning(f"{e}，已忽略该覆盖项")
+                continue
+
+            field.assign(self, value)
+            self._override_values[attr_name] = value
+            log.debug("配置项 {} 已被{}层覆盖为: {}", attr_name, self.layers.source_of(field.path), value)
+
+    def get_overridden_keys(self):
+        """
+        获取被环境变量或命令行覆盖的配置项
+
+        Returns:
+            list: 配置属性名列表
+        """
+        return list(self._override_values)
 
     def _ensure_directories(self):
         """确保配置和日志目录存在"""
@@ -157,7 +302,7 @@ class ConfigManager:
         # 确保日志目录存在
         try:
             self.log_dir.mkdir(parents=True, exist_ok=True)
-            logger.debug(f"已创建日志目录: {self.log_dir}")
+            log.debug("已创建日志目录: {}", self.log_dir)
         except Exception as e:
             logger.error(f"创建日志目录失败: {str(e)}")
 
@@ -168,23 +313,34 @@ class ConfigManager:
         Returns:
             bool: 是否加载成功
         """
-        if not self.config_file.exists():
-            logger.debug("配置文件不存在，将创建默认配置文件")
+        self._migrate_backend()
+
+        if not self._backend.exists():
+            log.debug("配置文件不存在，将创建默认配置文件")
             return self._create_default_config()
 
         try:
-            with self.config_file.open("r", encoding="utf-8") as f:
-                config_data = yaml.safe_load(f)
-
-            if not config_data:
+            result = self._read_config_attributes()
+            if result is None:
                 logger.warning("配置文件为空或无效，将使用默认配置")
                 return self._create_default_config()
 
             # 使用统一的方法加载所有配置
-            self._load_config_attributes(config_data)
-
-            # 处理特殊的开机自启逻辑
-            self._handle_auto_start_config(config_data)
+            attributes, present = result
+            self._apply_config_attributes(attributes)
+
+            # 重放尚未合并回配置文件的变更日志（如上次异常退出），然后立即合并
+            replayed = self._replay_journal()
+            self._mark_clean()
+            if replayed:
+                self._compact_journal()
+            self._apply_overrides()
+
+            # 处理特殊的开机自启逻辑（读写注册表，可以推迟到启动完成后）
+            if self._defer_auto_start:
+                self._pending_auto_start_sync = "auto_start" in present
+            else:
+                self._handle_auto_start_config("auto_start" in present)
 
             return True
 
@@ -192,44 +348,106 @@ class ConfigManager:
             logger.error(f"加载配置文件失败: {str(e)}")
             return self._create_default_config()
 
-    def _load_config_attributes(self, config_data):
+    def _read_config_attributes(self):
+        """
+        读取配置文件并得到校验后的属性表
+
+        配置文件的修改时间、大小和内容哈希与快照一致时直接使用快照，
+        否则解析配置文件并刷新快照。
+
+        Returns:
+            tuple | None: (属性表, 配置文件中存在的配置项名称列表)，配置文件为空或无效时返回None
+        """
+        snapshot, config_data, stat_result, raw = self._load_config_data()
+        if snapshot is not None:
+            log.debug("配置文件未变化，使用配置快照")
+            return snapshot["attributes"], snapshot["present"]
+
+        if not config_data or not isinstance(config_data, dict):
+            return None
+
+        attributes, present = self._parse_config_attributes(config_data)
+        if stat_result is not None:
+            self._snapshot.store(stat_result, raw, attributes, present)
+        return attributes, present
+
+    def _load_config_data(self):
         """
-        从配置数据中加载所有配置属性
+        从存储后端读取配置数据
+
+        Returns:
+            tuple: (快照, 配置数据, stat 结果, 原始内容)。快照有效时配置数据为None；
+                不支持快照的后端只返回配置数据，其余各项为None
+        """
+        if not self._backend.cacheable:
+            return None, self._backend.load(), None, None
+
+        stat_result, raw = self._backend.read_raw()
+        snapshot = self._snapshot.lookup(stat_result, raw)
+        if snapshot is not None:
+            return snapshot, None, stat_result, raw
+        return None, self._backend.decode(raw), stat_result, raw
+
+    def _parse_config_attributes(self, config_data):
+        """
+        从配置数据中解析并校验所有配置属性
 
         Args:
             config_data (dict): 配置数据
+
+        Returns:
+            tuple: (属性表, 配置文件中存在的配置项名称列表)
         """
-        for attr_name, (config_path, type_func, validator) in self.CONFIG_MAPPING.items():
-            value = self._get_nested_value(config_data, config_path)
-            if value is not None:
-                try:
-                    # 类型转换
-                    converted_value = type_func(value)
+        attributes = {}
+        present = []
+        for attr_name, field in self._config_fields.items():
+            value = field.read(config_data)
+            if value is None:
+                continue
+
+            present.append(attr_name)
+            try:
+                attributes[attr_name] = field.convert(value)
+            except ValueError as e:
+                logger.warning(f"{e}，使用默认值")
+
+        return attributes, present
+
+    def _apply_config_attributes(self, attributes):
+        """
+        将属性表应用到配置属性
+
+        Args:
+            attributes (dict): 属性名到值的映射
+        """
+        for attr_name, value in attributes.items():
+            setattr(self, attr_name, value)
+            log.debug("已从配置文件加载 {}: {}", attr_name, value)
 
-                    # 验证
-                    if validator:
-                        validated_value = validator(converted_value)
-                        if validated_value is None:
-                            logger.warning(f"配置项 {config_path} 的值 {converted_value} 无效，使用默认值")
-                            continue
-                        converted_value = validated_value
+    def sync_auto_start(self):
+        """
+        执行加载配置时推迟的开机自启同步（见 defer_auto_start）
 
-                    setattr(self, attr_name, converted_value)
-                    logger.debug(f"已从配置文件加载 {attr_name}: {converted_value}")
+        同步后开机自启配置发生变化时发送变更通知
+        """
+        has_auto_start = self._pending_auto_start_sync
+        if has_auto_start is None:
+            return
+        self._pending_auto_start_sync = None
 
-                except (ValueError, TypeError) as e:
-                    logger.warning(f"配置项 {config_path} 类型转换失败: {e}，使用默认值")
+        previous = self.auto_start
+        self._handle_auto_start_config(has_auto_start)
+        if self.auto_start != previous:
+            self._notify_changes({"auto_start": self.auto_start})
 
-    def _handle_auto_start_config(self, config_data):
+    def _handle_auto_start_config(self, has_auto_start):
         """
         处理开机自启的特殊逻辑
 
         Args:
-            config_data (dict): 配置数据
+            has_auto_start (bool): 配置文件中是否包含开机自启设置
         """
-        auto_start_value = self._get_nested_value(config_data, "application.auto_start")
-
-        if auto_start_value is not None:
+        if has_auto_start:
             # 检查实际开机自启状态与配置是否一致
             actual_auto_start = check_auto_start(self.app_info["name"])
             if self.auto_start != actual_auto_start:
@@ -246,7 +464,147 @@ class ConfigManager:
             # 如果配置中没有自启设置，检查系统中是否已设置
             if check_auto_start(self.app_info["name"]):
                 self.auto_start = True
-                logger.debug("检测到系统中已设置开机自启，已更新配置")
+                log.debug("检测到系统中已设置开机自启，已更新配置")
+
+    def reload_changed(self):
+        """
+        增量重新加载配置文件（用于响应外部编辑）
+
+        与上次读取或写入时的文件内容逐项比较，只更新外部修改过的配置项，
+        并只为这些配置项发送变更通知。
+
+        Returns:
+            dict: 发生变化的配置项（属性名 -> 新值）
+        """
+        # 修改时间和变更戳都未变化（包括本程序自己的写入），无需读取文件
+        if not self._backend.is_stale():
+            return {}
+
+        try:
+            snapshot, config_data, stat_result, raw = self._load_config_data()
+
+            # 文件内容与上次读取或写入时一致（包括本程序自己的写入），无需处理
+            if snapshot is not None:
+                return {}
+
+            if not config_data or not isinstance(config_data, dict):
+                logger.warning("外部修改后的配置文件为空或无效，已忽略")
+                return {}
+
+            new_attributes, present = self._parse_config_attributes(config_data)
+            old_attributes = self._snapshot.get_last_attributes() if self._backend.cacheable else None
+            if old_attributes is None:
+                old_attributes = {
+                    attr_name: field.read(self._document) for attr_name, field in self._config_fields.items()
+                }
+            if stat_result is not None:
+                self._snapshot.store(stat_result, raw, new_attributes, present)
+
+        except Exception as e:
+            logger.error(f"重新加载配置文件失败: {str(e)}")
+            return {}
+
+        # 缺失的配置项视为默认值，再逐项比较文件前后的差异
+        defaults = self._get_default_values()
+        changes = {}
+        for attr_name, field in self._config_fields.items():
+            default_value = defaults[attr_name]
+            old_value = old_attributes.get(attr_name, default_value)
+            new_value = new_attributes.get(attr_name, default_value)
+            if old_value == new_value:
+                continue
+
+            # 外部修改的值即为已保存状态，不需要再写回
+            field.write(self._document, new_value)
+
+            # 被环境变量或命令行覆盖的配置项保持覆盖值
+            if attr_name in self._override_values:
+                continue
+            if getattr(self, attr_name) != new_value:
+                setattr(self, attr_name, new_value)
+                changes[attr_name] = new_value
+            self._cfg_dirty &= ~field.mask
+
+        self.layers.set_layer("user", self._document)
+        if not changes:
+            return {}
+
+        log.debug("检测到配置文件被外部修改，变更项: {}", ', '.join(changes))
+
+        # 开机自启需要与注册表保持一致
+        if "auto_start" in changes:
+            if self.auto_start:
+                enable_auto_start(self.app_info["name"])
+            else:
+                disable_auto_start(self.app_info["name"])
+
+        # 尚未写盘的数据基于旧值构建，需要用最新值重新提交，避免覆盖外部修改
+        if self._writer.has_pending():
+            self._writer.submit(copy.deepcopy(self._document))
+
+        self._notify_changes(changes)
+        return changes
+
+    # 配置变更通知
+    def subscribe(self, attr_name, callback):
+        """
+        订阅单个配置项的变更通知
+
+        Args:
+            attr_name (str): 配置属性名，如 "theme"
+            callback (callable): 回调函数，接收新值作为参数
+        """
+        if attr_name not in self._config_fields:
+            raise ValueError(f"未知的配置项: {attr_name}")
+        self._listeners.setdefault(attr_name, []).append(callback)
+
+    def subscribe_all(self, callback):
+        """
+        订阅所有配置项的变更通知
+
+        Args:
+            callback (callable): 回调函数，接收变更字典（属性名 -> 新值）作为参数
+        """
+        self._global_listeners.append(callback)
+
+    def unsubscribe(self, callback, attr_name=None):
+        """
+        取消订阅
+
+        Args:
+            callback (callable): 之前注册的回调函数
+            attr_name (str, optional): 配置属性名，为空时从全部订阅中移除
+        """
+        names = [attr_name] if attr_name else list(self._listeners)
+        for name in names:
+            callbacks = self._listeners.get(name, [])
+            if callback in callbacks:
+                callbacks.remove(callback)
+        if attr_name is None and callback in self._global_listeners:
+            self._global_listeners.remove(callback)
+
+    def _notify_changes(self, changes):
+        """
+        发送配置变更通知
+
+        Args:
+            changes (dict): 发生变化的配置项（属性名 -> 新值）
+        """
+        if not changes:
+            return
+
+        for attr_name, value in changes.items():
+            for callback in list(self._listeners.get(attr_name, ())):
+                try:
+                    callback(value)
+                except Exception as e:
+                    logger.error(f"配置项 {attr_name} 变更回调执行失败: {str(e)}")
+
+        for callback in list(self._global_listeners):
+            try:
+                callback(dict(changes))
+            except Exception as e:
+                logger.error(f"配置变更回调执行失败: {str(e)}")
 
     def _create_default_config(self):
         """
@@ -256,33 +614,290 @@ class ConfigManager:
             bool: 是否创建成功
         """
         try:
-            with self.config_file.open("w", encoding="utf-8") as f:
-                yaml.dump(self.default_config, f, default_flow_style=False, allow_unicode=True)
+            # 配置文件不存在时遗留的变更日志已没有可以依附的基础，直接丢弃
+            if self._journal is not None:
+                self._journal.reset()
+
+            self._write_config_file(self.default_config)
 
             # 重新初始化配置属性为默认值
             self._init_config_attributes()
+            self._mark_clean()
+            self._apply_overrides()
             return True
         except Exception as e:
             logger.error(f"创建默认配置文件失败: {str(e)}")
             return False
 
-    def save_config(self):
+    def save_config(self, sync=False):
         """
         保存配置到文件
 
+        只处理脏标记位被置位的配置项并提交给后台写入器，短时间内的多次保存会被合并为一次原子写入。
+
+        Args:
+            sync (bool): 是否立即同步写入磁盘
+
         Returns:
-            bool: 保存是否成功
+            bool: 保存请求是否成功（同步写入时表示写入是否成功）
         """
-        try:
-            config_data = self._build_config_data()
-            with self.config_file.open("w", encoding="utf-8") as f:
-                yaml.dump(config_data, f, default_flow_style=False, allow_unicode=True)
+        # 批量更新期间推迟到提交时统一保存
+        if self._batch_depth:
+            return True
 
+        try:
+            changes = {}
+            dirty = self._cfg_dirty
+            if dirty:
+                for attr_name, field in self._config_fields.items():
+                    if not dirty & field.mask:
+                        continue
+                    # 改动后又改回原值的字段不算变更
+                    value = getattr(self, attr_name)
+                    if field.read(self._document, _MISSING) != value:
+                        field.write(self._document, value)
+                        changes[attr_name] = value
+                self._cfg_dirty = 0
+
+            if changes or not self._backend.exists():
+                self.layers.set_layer("user", self._document)
+                if self._journal is not None and changes and self._backend.exists():
+                    self._append_journal(changes)
+                else:
+                    self._writer.submit(copy.deepcopy(self._document), list(changes))
+                self._notify_changes(changes)
+
+            if sync:
+                if self._journal is not None:
+                    self._journal.sync()
+                return self._writer.flush()
             return True
         except Exception as e:
             logger.error(f"保存配置文件失败: {str(e)}")
             return False
 
+    @contextmanager
+    def batch(self):
+        """
+        批量更新配置的事务上下文
+
+        上下文内对配置属性的修改和 save_config() 调用都会推迟到提交时执行：
+        提交时统一校验一次、写入一次，并发送一次合并的变更通知。
+        上下文内抛出异常或校验失败时，所有修改回滚到进入前的状态。
+        支持嵌套，只有最外层的上下文退出时才会提交。
+
+        用法:
+            with config_manager.batch():
+                config_manager.theme = "dark"
+                config_manager.window_width = 900
+
+        Raises:
+            ValueError: 提交时配置项校验失败
+        """
+        if self._batch_depth:
+            self._batch_depth += 1
+            try:
+                yield self
+            finally:
+                self._batch_depth -= 1
+            return
+
+        backup = self._get_attribute_values()
+        self._batch_depth = 1
+        try:
+            yield self
+            self._validate_attributes()
+        except BaseException:
+            self._batch_depth = 0
+            for attr_name, value in backup.items():
+                setattr(self, attr_name, value)
+            logger.warning("批量更新配置失败，已回滚所有修改")
+            raise
+
+        self._batch_depth = 0
+        self.save_config()
+
+    def _validate_attributes(self):
+        """
+        校验并规范化所有配置属性的当前值
+
+        Raises:
+            ValueError: 配置项类型转换或校验失败
+        """
+        dirty = self._cfg_dirty
+        for attr_name, field in self._config_fields.items():
+            # 只有被修改过的字段需要重新校验
+            if not dirty & field.mask:
+                continue
+
+            value = getattr(self, attr_name)
+            converted_value = field.convert(value)
+            if converted_value != value:
+                setattr(self, attr_name, converted_value)
+
+    def update_values(self, values):
+        """
+        批量更新多个配置项（如导入设置、恢复预设），只校验和写入一次
+
+        Args:
+            values (dict): 属性名到新值的映射
+
+        Raises:
+            ValueError: 包含未知配置项或校验失败，此时所有修改都会回滚
+        """
+        with self.batch():
+            for attr_name, value in values.items():
+                if attr_name not in self._config_fields:
+                    raise ValueError(f"未知的配置项: {attr_name}")
+                setattr(self, attr_name, value)
+
+    def restore_defaults(self):
+        """恢复所有配置项为默认值"""
+        self.update_values(self._get_default_values())
+
+    def _append_journal(self, changes):
+        """
+        将变更追加到变更日志，日志超过阈值时合并回配置文件
+
+        Args:
+            changes (dict): 发生变化的配置项（属性名 -> 新值）
+        """
+        self._journal.append({self._config_fields[attr_name].path: value for attr_name, value in changes.items()})
+        if self._journal.record_count >= self.system_config.get("config_journal_compact_threshold", 256):
+            self._compact_journal()
+
+    def _replay_journal(self):
+        """
+        将变更日志中的记录按顺序应用到配置属性
+
+        Returns:
+            int: 重放的记录数
+        """
+        if self._journal is None:
+            return 0
+
+        records = self._journal.replay()
+        if not records:
+            return 0
+
+        fields_by_path = {field.path: attr_name for attr_name, field in self._config_fields.items()}
+        for path, value in records:
+            attr_name = fields_by_path.get(path)
+            if attr_name is None:
+                continue
+            try:
+                setattr(self, attr_name, self._config_fields[attr_name].convert(value))
+            except ValueError as e:
+                logger.warning(f"{e}，已忽略该变更记录")
+
+        log.debug("已从配置变更日志恢复 {} 条记录", len(records))
+        return len(records)
+
+    def _compact_journal(self):
+        """
+        将变更日志合并回配置文件并清空日志
+
+        Returns:
+            bool: 合并是否成功
+        """
+        if self._journal is None or not self._journal.record_count:
+            return True
+
+        # 先写入后台写入器中尚未落盘的数据，再整体写入当前已保存状态
+        self._writer.flush()
+        try:
+            self._write_config_file(copy.deepcopy(self._document))
+        except Exception as e:
+            logger.error(f"合并配置变更日志失败: {str(e)}")
+            return False
+
+        self._journal.reset()
+        log.debug("配置变更日志已合并到配置文件")
+        return True
+
+    def flush(self):
+        """
+        立即写入所有尚未落盘的配置
+
+        Returns:
+            bool: 写入是否成功
+        """
+        if self._journal is not None:
+            self._journal.sync()
+        return self._writer.flush()
+
+    def close(self):
+        """
+        程序退出时调用：写入剩余配置并停止后台写入器
+
+        Returns:
+            bool: 写入是否成功
+        """
+        result = self._writer.close()
+        if self._journal is not None:
+            result = self._compact_journal() and result
+            self._journal.close()
+        self._backend.close()
+
+        stats = self.get_write_stats()
+        message = f"配置写入统计: 保存请求 {stats['requests']} 次，实际写入 {stats['writes']} 次，合并 {stats['coalesced']} 次"
+        if "journaled" in stats:
+            message += f"，追加变更日志 {stats['journaled']} 条"
+        log.debug(message)
+        return result
+
+    def get_write_stats(self):
+        """
+        获取配置写入统计信息
+
+        Returns:
+            dict: 包含保存请求数、实际写入数、合并数和失败数，启用变更日志时还包含追加的记录数
+        """
+        stats = self._writer.get_stats()
+        if self._journal is not None:
+            stats["journaled"] = self._journal.append_count
+        return stats
+
+    def _write_config_file(self, config_data, dirty_keys=None):
+        """
+        将配置数据原子地写入配置文件（在后台写入线程中执行）
+
+        上次读取后若有其他进程写入过配置文件，则以磁盘内容为基础，只写入本次变更的配置项。
+
+        Args:
+            config_data (dict): 配置数据
+            dirty_keys (iterable, optional): 本次变更的配置项名称，为None时整体覆盖
+        """
+        dirty_paths = None
+        if dirty_keys is not None:
+            dirty_paths = [self._config_fields[name].keys for name in dirty_keys if name in self._config_fields]
+
+        stat_result, raw, conflict = self._backend.save(config_data, dirty_paths)
+
+        if conflict and dirty_keys is not None:
+            # 其他进程的修改需要由 reload_changed 合并到内存中：
+            # 使快照失效并标记文件已过期，重新加载时以内存中的已保存状态为基准比较差异
+            logger.warning("检测到其他进程修改了配置文件，已按配置项合并写入")
+            self._snapshot.invalidate()
+            self._backend.mark_stale()
+            return
+
+        if stat_result is None:
+            return
+
+        # 刷新快照，下次启动无需重新解析刚写入的内容
+        attributes, present = self._parse_config_attributes(config_data)
+        self._snapshot.store(stat_result, raw, attributes, present)
+
+    def _get_attribute_values(self):
+        """
+        获取所有配置属性的当前值
+
+        Returns:
+            dict: 属性名到值的映射
+        """
+        return {attr_name: getattr(self, attr_name) for attr_name in self._config_fields}
+
     def _build_config_data(self):
         """
         构建配置数据字典
@@ -291,9 +906,8 @@ class ConfigManager:
             dict: 配置数据
         """
         config_data = {}
-        for attr_name, (config_path, _, _) in self.CONFIG_MAPPING.items():
-            value = getattr(self, attr_name)
-            self._set_nested_value(config_data, config_path, value)
+        for attr_name, field in self._config_fields.items():
+            field.write(config_data, getattr(self, attr_name))
         return config_data
 
     # 应用信息获取方法
@@ -342,15 +956,12 @@ class ConfigManager:
             bool: 保存是否成功
         """
         try:
-            self.window_width = width
-            self.window_height = height
-            success = self.save_config()
+            with self.batch():
+                self.window_width = width
+                self.window_height = height
 
-            if success:
-                logger.debug(f"窗口尺寸已保存: {width}x{height}")
-            else:
-                logger.error("保存窗口尺寸失败")
-            return success
+            log.debug("窗口尺寸已保存: {}x{}", width, height)
+            return True
         except Exception as e:
             logger.error(f"保存窗口尺寸时发生错误: {str(e)}")
             return False
@@ -0,0 +1,144 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+配置快照缓存模块
+
+将校验后的配置属性表以二进制（marshal）形式缓存到磁盘，
+以配置文件的修改时间、大小和内容哈希作为键。启动时若快照仍然有效，
+则完全跳过 YAML 解析。
+"""
+
+import hashlib
+import marshal
+import os
+from pathlib import Path
+from utils.logger import get_logger
+from config.config_writer import atomic_write_bytes
+
+log = get_logger(__name__)
+
+# 快照格式版本号，格式变化时递增以使旧快照失效
+SNAPSHOT_VERSION = 1
+
+
+def compute_digest(raw):
+    """
+    计算配置文件内容的哈希值
+
+    Args:
+        raw (bytes): 文件原始内容
+
+    Returns:
+        str: 十六进制哈希字符串
+    """
+    return hashlib.blake2b(raw, digest_size=16).hexdigest()
+
+
+class ConfigSnapshot:
+    """配置属性表的磁盘快照"""
+
+    def __init__(self, snapshot_file, schema):
+        """
+        初始化配置快照
+
+        Args:
+            snapshot_file (str | Path): 快照文件路径
+            schema (str): 配置结构指纹，配置映射变化时快照自动失效
+        """
+        self.snapshot_file = Path(snapshot_file)
+        self.schema = schema
+        self._cached = None
+
+    def _read(self):
+        """读取快照文件内容，失败时返回None"""
+        if self._cached is not None:
+            return self._cached
+
+        try:
+            with self.snapshot_file.open("rb") as f:
+                data = marshal.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            log.debug("读取配置快照失败，将重新解析配置文件: {}", e)
+            return None
+
+        if (
+            not isinstance(data, dict)
+            or data.get("version") != SNAPSHOT_VERSION
+            or data.get("schema") != self.schema
+        ):
+            return None
+
+        self._cached = data
+        return data
+
+    def lookup(self, stat_result, raw):
+        """
+        查找与配置文件当前内容匹配的快照
+
+        Args:
+            stat_result (os.stat_result): 配置文件的 stat 结果
+            raw (bytes): 配置文件原始内容
+
+        Returns:
+            dict | None: 快照有效时返回快照数据，否则返回None
+        """
+        data = self._read()
+        if data is None:
+            return None
+
+        if data["mtime_ns"] != stat_result.st_mtime_ns or data["size"] != stat_result.st_size:
+            return None
+
+        if data["digest"] != compute_digest(raw):
+            return None
+
+        return data
+
+    def store(self, stat_result, raw, attributes, present):
+        """
+        保存快照
+
+        Args:
+            stat_result (os.stat_result): 配置文件的 stat 结果
+            raw (bytes): 配置文件原始内容
+            attributes (dict): 校验后的配置属性表
+            present (list): 配置文件中实际存在的配置项名称
+        """
+        data = {
+            "version": SNAPSHOT_VERSION,
+            "schema": self.schema,
+            "mtime_ns": stat_result.st_mtime_ns,
+            "size": stat_result.st_size,
+            "digest": compute_digest(raw),
+            "attributes": dict(attributes),
+            "present": list(present),
+        }
+        # 内存中的快照始终更新，磁盘写入失败只影响下次启动
+        self._cached = data
+        try:
+            atomic_write_bytes(self.snapshot_file, marshal.dumps(data), sync=False)
+        except Exception as e:
+            log.debug("写入配置快照失败: {}", e)
+
+    def get_last_attributes(self):
+        """
+        获取最近一次读取或写入时的属性表（不校验是否过期）
+
+        Returns:
+            dict | None: 属性表，没有快照时返回None
+        """
+        data = self._read()
+        return dict(data["attributes"]) if data is not None else None
+
+    def invalidate(self):
+        """删除快照"""
+        self._cached = None
+        try:
+            os.unlink(self.snapshot_file)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            log.debug("删除配置快照失败: {}", e)
@@ -0,0 +1,291 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+多进程安全的配置文件存储模块
+
+在配置文件旁的锁文件上加建议性文件锁（POSIX 使用 fcntl.flock，Windows 使用 msvcrt.locking），
+并在配置文件首行记录单调递增的变更戳（YAML 示例）：
+
+    # change-stamp: 42
+
+写入前比较磁盘上的变更戳、修改时间和大小，检测到其他进程在此期间写入过时，
+交由调用方按字段合并，避免"最后写入者覆盖一切"。判断文件是否过期时只需 stat，
+无需读取文件。
+"""
+
+import os
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from utils.logger import logger, get_logger
+from config.config_writer import atomic_write_bytes
+
+log = get_logger(__name__)
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+class StampFormat:
+    """变更戳在文件首行中的写法"""
+
+    def __init__(self, prefix, suffix=b"", body_prefix=b""):
+        """
+        初始化变更戳格式
+
+        Args:
+            prefix (bytes): 首行中变更戳数字之前的内容
+            suffix (bytes): 首行中变更戳数字之后的内容
+            body_prefix (bytes): 正文开头被首行取代的内容（如 JSON 的左花括号）
+        """
+        self.prefix = prefix
+        self.suffix = suffix
+        self.body_prefix = body_prefix
+
+    def parse(self, raw):
+        """
+        从文件内容（或只包含首行的内容）中解析变更戳
+
+        Args:
+            raw (bytes | None): 文件内容
+
+        Returns:
+            int: 变更戳，文件不存在或没有变更戳时返回0
+        """
+        if not raw or not raw.startswith(self.prefix):
+            return 0
+        line = raw[len(self.prefix):].split(b"\n", 1)[0].strip()
+        if self.suffix and line.endswith(self.suffix):
+            line = line[: -len(self.suffix)]
+        try:
+            return int(line)
+        except ValueError:
+            return 0
+
+    def strip(self, raw):
+        """
+        去掉文件内容中的变更戳行
+
+        Args:
+            raw (bytes): 文件内容
+
+        Returns:
+            bytes: 不含变更戳行的正文
+        """
+        if not raw.startswith(self.prefix):
+            return raw
+        rest = raw.split(b"\n", 1)[1] if b"\n" in raw else b""
+        return self.body_prefix + rest
+
+    def add(self, body, stamp):
+        """
+        在正文前加上变更戳行
+
+        Args:
+            body (bytes): 正文
+            stamp (int): 变更戳
+
+        Returns:
+            bytes: 文件内容
+        """
+        if self.body_prefix and body.startswith(self.body_prefix):
+            body = body[len(self.body_prefix):].lstrip(b"\n")
+        return self.prefix + str(stamp).encode("ascii") + self.suffix + b"\n" + body
+
+
+# YAML 使用注释行记录变更戳：# change-stamp: 42
+YAML_STAMP = StampFormat(b"# change-stamp: ")
+
+# JSON 不支持注释，将变更戳作为首行的第一个键：{"_change_stamp": 42,
+JSON_STAMP = StampFormat(b'{"_change_stamp": ', b",", b"{")
+
+
+class FileLock:
+    """基于锁文件的跨进程建议性文件锁"""
+
+    def __init__(self, lock_file, timeout=5.0):
+        """
+        初始化文件锁
+
+        Args:
+            lock_file (str | Path): 锁文件路径
+            timeout (float): 获取锁的超时时间（秒）
+        """
+        self.lock_file = Path(lock_file)
+        self.timeout = timeout
+
+    @contextmanager
+    def acquire(self, shared=False):
+        """
+        获取文件锁的上下文
+
+        超时后记录警告并在无锁状态下继续执行，避免另一个进程异常持锁时程序无法读写配置。
+
+        Args:
+            shared (bool): 是否获取共享锁（Windows 不支持共享锁，始终为独占锁）
+        """
+        try:
+            fd = os.open(str(self.lock_file), os.O_RDWR | os.O_CREAT, 0o644)
+        except OSError as e:
+            logger.warning(f"打开配置锁文件失败，将在无锁状态下继续: {str(e)}")
+            yield False
+            return
+
+        try:
+            locked = self._lock(fd, shared)
+            if not locked:
+                logger.warning(f"获取配置文件锁超时（{self.timeout}秒），将在无锁状态下继续")
+            try:
+                yield locked
+            finally:
+                if locked:
+                    self._unlock(fd)
+        finally:
+            os.close(fd)
+
+    def _lock(self, fd, shared):
+        """
+        在超时时间内反复尝试加锁
+
+        Returns:
+            bool: 是否加锁成功
+        """
+        deadline = time.monotonic() + self.timeout
+        while True:
+            try:
+                if fcntl is not None:
+                    fcntl.flock(fd, (fcntl.LOCK_SH if shared else fcntl.LOCK_EX) | fcntl.LOCK_NB)
+                else:
+                    os.lseek(fd, 0, os.SEEK_SET)
+                    msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+                return True
+            except OSError:
+                if time.monotonic() >= deadline:
+                    return False
+                time.sleep(0.01)
+
+    def _unlock(self, fd):
+        """释放锁"""
+        try:
+            if fcntl is not None:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+            else:
+                os.lseek(fd, 0, os.SEEK_SET)
+                msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+        except OSError as e:
+            log.debug("释放配置文件锁失败: {}", e)
+
+
+class ConfigStore:
+    """带文件锁和变更戳的配置文件读写"""
+
+    def __init__(self, config_file, lock_timeout=5.0, stamp_format=YAML_STAMP):
+        """
+        初始化配置存储
+
+        Args:
+            config_file (str | Path): 配置文件路径
+            lock_timeout (float): 获取文件锁的超时时间（秒）
+            stamp_format (StampFormat): 变更戳的写法
+        """
+        self.config_file = Path(config_file)
+        self.stamp_format = stamp_format
+        self.lock = FileLock(self.config_file.with_name(f".{self.config_file.name}.lock"), lock_timeout)
+
+        # 最近一次读取或写入时文件的状态
+        self._stamp = 0
+        self._mtime_ns = None
+        self._size = None
+
+    @property
+    def stamp(self):
+        """最近一次读取或写入的变更戳"""
+        return self._stamp
+
+    def _remember(self, stat_result, stamp):
+        """记录最近一次读取或写入时的文件状态"""
+        self._stamp = stamp
+        self._mtime_ns = stat_result.st_mtime_ns
+        self._size = stat_result.st_size
+
+    def exists(self):
+        """配置文件是否存在"""
+        return self.config_file.exists()
+
+    def read(self):
+        """
+        在共享锁下读取配置文件
+
+        Returns:
+            tuple: (stat 结果, 文件原始内容)
+
+        Raises:
+            OSError: 文件不存在或读取失败
+        """
+        with self.lock.acquire(shared=True):
+            stat_result = self.config_file.stat()
+            raw = self.config_file.read_bytes()
+        self._remember(stat_result, self.stamp_format.parse(raw))
+        return stat_result, raw
+
+    def is_stale(self):
+        """
+        判断最近一次读取后文件是否可能被其他写入者修改过
+
+        只比较修改时间和大小，不读取文件。手动编辑通常会保留变更戳所在的首行，
+        因此任何变化都视为过期，由调用方重新读取后用内容摘要判断内容是否真的改变。
+
+        Returns:
+            bool: 文件是否已过期
+        """
+        try:
+            stat_result = self.config_file.stat()
+        except FileNotFoundError:
+            return False
+
+        return stat_result.st_mtime_ns != self._mtime_ns or stat_result.st_size != self._size
+
+    def mark_stale(self):
+        """强制下次 is_stale() 返回True"""
+        self._stamp = -1
+        self._mtime_ns = None
+        self._size = None
+
+    def write(self, render):
+        """
+        在独占锁下写入配置文件
+
+        Args:
+            render (callable): 生成文件内容（不含变更戳行）的函数。参数为磁盘上其他写入者的内容
+                （不含变更戳行）；上次读取后文件未被其他写入者修改时参数为None
+
+        Returns:
+            tuple: (stat 结果, 写入的原始内容, 是否与其他写入者的修改发生冲突)
+        """
+        with self.lock.acquire():
+            try:
+                disk_stat = self.config_file.stat()
+                disk_raw = self.config_file.read_bytes()
+            except FileNotFoundError:
+                disk_stat = None
+                disk_raw = None
+
+            disk_stamp = self.stamp_format.parse(disk_raw)
+            conflict = disk_stat is not None and (
+                disk_stamp != self._stamp
+                or disk_stat.st_mtime_ns != self._mtime_ns
+                or disk_stat.st_size != self._size
+            )
+
+            stamp = max(disk_stamp, self._stamp) + 1
+            body = render(self.stamp_format.strip(disk_raw) if conflict else None)
+            raw = self.stamp_format.add(body, stamp)
+            atomic_write_bytes(self.config_file, raw)
+            stat_result = self.config_file.stat()
+
+        self._remember(stat_result, stamp)
+        return stat_result, raw, conflict
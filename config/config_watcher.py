@@ -0,0 +1,72 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+配置文件监视模块
+
+监视配置文件的外部修改，防抖后触发 ConfigManager 增量重新加载，
+只有发生变化的配置项会收到变更通知。
+"""
+
+import os
+from PyQt5.QtCore import QObject, QFileSystemWatcher, QTimer, pyqtSignal
+from utils.logger import logger
+
+
+class ConfigFileWatcher(QObject):
+    """配置文件监视器"""
+
+    # 外部修改导致配置变化时发送，参数为变更的配置项名称列表
+    config_changed = pyqtSignal(list)
+
+    def __init__(self, config_manager, parent=None, debounce_ms=200):
+        """
+        初始化配置文件监视器
+
+        Args:
+            config_manager: 配置管理器实例
+            parent (QObject, optional): 父对象
+            debounce_ms (int): 防抖时间（毫秒），编辑器保存时可能连续触发多次文件事件
+        """
+        super().__init__(parent)
+        self.config_manager = config_manager
+        self._config_path = str(config_manager.config_file)
+
+        self._reload_timer = QTimer(self)
+        self._reload_timer.setSingleShot(True)
+        self._reload_timer.setInterval(debounce_ms)
+        self._reload_timer.timeout.connect(self._reload)
+
+        self._watcher = QFileSystemWatcher(self)
+        self._watcher.fileChanged.connect(self._on_path_changed)
+        self._watcher.directoryChanged.connect(self._on_path_changed)
+
+        # 同时监视所在目录：原子替换写入会让文件监视失效，需要在文件重新出现时补上
+        self._watcher.addPath(str(config_manager.config_dir))
+        self._watch_config_file()
+
+    def _watch_config_file(self):
+        """将配置文件加入监视列表"""
+        if os.path.exists(self._config_path) and self._config_path not in self._watcher.files():
+            self._watcher.addPath(self._config_path)
+
+    def _on_path_changed(self, path):
+        """文件或目录变化时启动防抖定时器"""
+        self._watch_config_file()
+        self._reload_timer.start()
+
+    def _reload(self):
+        """执行增量重新加载"""
+        try:
+            changes = self.config_manager.reload_changed()
+            if changes:
+                self.config_changed.emit(list(changes))
+        except Exception as e:
+            logger.error(f"处理配置文件变化失败: {str(e)}")
+
+    def stop(self):
+        """停止监视"""
+        self._reload_timer.stop()
+        paths = self._watcher.files() + self._watcher.directories()
+        if paths:
+            self._watcher.removePaths(paths)
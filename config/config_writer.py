@@ -0,0 +1,279 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+配置文件后台写入模块
+
+将频繁的保存请求合并为一次写入：在静默期内收集脏配置项，
+静默期结束后在后台线程中通过"临时文件 + 重命名"原子地写入磁盘。
+"""
+
+import os
+import secrets
+import threading
+import time
+from pathlib import Path
+from utils.logger import logger, get_logger
+
+log = get_logger(__name__)
+
+# 写入失败后重试前等待的时间（秒）
+RETRY_DELAY = 5.0
+
+# 创建临时文件的标志（Windows 上需要 O_BINARY，避免换行符被转换）
+_TEMP_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+
+
+def _create_temp_file(file_path):
+    """
+    在目标文件所在目录创建临时文件
+
+    以 0666 权限创建，由系统按 umask 计算实际权限（与直接新建目标文件相同），
+    而不是 mkstemp 的 0600。
+
+    Returns:
+        tuple: (文件描述符, 临时文件路径)
+    """
+    while True:
+        temp_path = file_path.with_name(f".{file_path.name}.{secrets.token_hex(4)}.tmp")
+        try:
+            return os.open(str(temp_path), _TEMP_FLAGS, 0o666), str(temp_path)
+        except FileExistsError:
+            continue
+
+
+def atomic_write_bytes(file_path, data, sync=True):
+    """
+    原子地写入二进制文件
+
+    先写入同目录下的临时文件并刷新到磁盘，再通过 os.replace 替换目标文件，
+    保证其他读取者只会看到完整的旧文件或完整的新文件。
+    目标文件已存在时，替换前把临时文件改为目标文件原有的权限；新文件的权限由系统按 umask 决定。
+
+    Args:
+        file_path (str | Path): 目标文件路径
+        data (bytes): 文件内容
+        sync (bool): 替换前是否调用 fsync 确保数据落盘
+    """
+    file_path = Path(file_path)
+    try:
+        mode = file_path.stat().st_mode & 0o7777
+    except FileNotFoundError:
+        mode = None
+
+    fd, temp_path = _create_temp_file(file_path)
+    try:
+        if mode is not None:
+            os.chmod(temp_path, mode)
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            if sync:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(temp_path, file_path)
+    except BaseException:
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+        raise
+
+
+def atomic_write_text(file_path, text, encoding="utf-8"):
+    """
+    原子地写入文本文件
+
+    Args:
+        file_path (str | Path): 目标文件路径
+        text (str): 文件内容
+        encoding (str): 文件编码
+    """
+    atomic_write_bytes(file_path, text.encode(encoding))
+
+
+class ConfigWriter:
+    """合并写入的后台配置写入器"""
+
+    def __init__(self, write_func, delay=0.3, name="config-writer"):
+        """
+        初始化后台写入器
+
+        Args:
+            write_func (callable): 实际执行写入的函数，接收配置数据字典和变更项集合
+            delay (float): 静默期（秒），最后一次保存请求后等待该时长再写入
+            name (str): 后台线程名称
+        """
+        self._write_func = write_func
+        self._delay = delay
+        self._name = name
+
+        self._cond = threading.Condition()
+        self._write_lock = threading.Lock()
+        self._thread = None
+        self._closed = False
+
+        # 待写入状态
+        self._pending_data = None
+        self._dirty_keys = set()
+        self._deadline = 0.0
+
+        # 统计信息
+        self._request_count = 0
+        self._write_count = 0
+        self._failed_count = 0
+
+    def submit(self, data, dirty_keys=()):
+        """
+        提交一次保存请求
+
+        只保留最新一次提交的数据，静默期内的多次请求会被合并为一次写入。
+
+        Args:
+            data (dict): 需要写入的完整配置数据
+            dirty_keys (iterable): 本次变更的配置项名称
+        """
+        with self._cond:
+            self._pending_data = data
+            self._dirty_keys.update(dirty_keys)
+            self._request_count += 1
+            closed = self._closed
+            if not closed:
+                self._deadline = time.monotonic() + self._delay
+                self._ensure_thread()
+                self._cond.notify()
+
+        # 写入器已关闭（程序退出阶段），直接同步写入
+        if closed:
+            self.flush()
+
+    def _ensure_thread(self):
+        """按需启动后台写入线程（需在持有锁时调用）"""
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name=self._name, daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        """后台线程主循环：等待静默期结束后写入"""
+        while True:
+            with self._cond:
+                while self._pending_data is None and not self._closed:
+                    self._cond.wait()
+
+                if self._pending_data is None and self._closed:
+                    return
+
+                # 等待静默期结束，期间若有新请求则顺延
+                remaining = self._deadline - time.monotonic()
+                while remaining > 0 and not self._closed:
+                    self._cond.wait(remaining)
+                    remaining = self._deadline - time.monotonic()
+
+                # 已关闭：剩余数据由 close() 写入（只尝试一次），后台线程直接退出
+                if self._closed:
+                    return
+
+            self.flush()
+
+    def flush(self):
+        """
+        立即写入所有待写入的数据
+
+        Returns:
+            bool: 写入是否成功（没有待写入数据时返回True）
+        """
+        with self._write_lock:
+            with self._cond:
+                data = self._pending_data
+                dirty_keys = self._dirty_keys
+                self._pending_data = None
+                self._dirty_keys = set()
+
+            if data is None:
+                return True
+
+            try:
+                self._write_func(data, dirty_keys)
+                self._write_count += 1
+                log.debug("配置已写入磁盘，变更项: {}", ', '.join(sorted(dirty_keys)) or '无')
+                return True
+            except Exception as e:
+                self._failed_count += 1
+                if self._requeue(data, dirty_keys):
+                    logger.error(f"后台保存配置文件失败，将在 {RETRY_DELAY:g} 秒后重试: {str(e)}")
+                else:
+                    logger.error(f"保存配置文件失败，修改未能写入磁盘: {str(e)}")
+                return False
+
+    def _requeue(self, data, dirty_keys):
+        """
+        写入失败后重新排队，避免暂时的 I/O 错误丢失修改
+
+        期间已有新的保存请求时保留较新的数据（完整配置数据已包含这次的修改），只合并变更项。
+        写入器已关闭时只保留数据（has_pending() 返回True），不再安排重试。
+
+        Returns:
+            bool: 是否安排了重试
+        """
+        with self._cond:
+            if self._pending_data is None:
+                self._pending_data = data
+            self._dirty_keys |= dirty_keys
+            if self._closed:
+                return False
+            self._deadline = max(self._deadline, time.monotonic() + RETRY_DELAY)
+            self._ensure_thread()
+            self._cond.notify()
+            return True
+
+    def close(self):
+        """
+        写入剩余数据并停止后台线程
+
+        Returns:
+            bool: 剩余数据是否写入成功
+        """
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+            thread = self._thread
+
+        result = self.flush()
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=2)
+        return result
+
+    def has_pending(self):
+        """是否存在尚未写入的数据"""
+        with self._cond:
+            return self._pending_data is not None
+
+    @property
+    def request_count(self):
+        """保存请求总数"""
+        return self._request_count
+
+    @property
+    def write_count(self):
+        """实际写入磁盘的次数"""
+        return self._write_count
+
+    @property
+    def coalesced_count(self):
+        """被合并掉（未单独写盘）的保存请求数"""
+        with self._cond:
+            pending = 1 if self._pending_data is not None else 0
+        return max(0, self._request_count - self._write_count - self._failed_count - pending)
+
+    def get_stats(self):
+        """
+        获取写入统计信息
+
+        Returns:
+            dict: 包含请求数、写入数、合并数和失败数
+        """
+        return {
+            "requests": self.request_count,
+            "writes": self.write_count,
+            "coalesced": self.coalesced_count,
+            "failed": self._failed_count,
+        }
@@ -0,0 +1,206 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+单实例代理
+
+首个实例持有实例锁（Windows 上为命名互斥体，其他系统为文件锁），并通过 QLocalServer 监听本地连接
+（Windows 上为命名管道，其他系统为 Unix 域套接字）。重复启动时只用标准库连接该地址，
+把命令行参数转发给正在运行的实例后立即退出，由正在运行的实例恢复显示主窗口。
+
+重复启动时只需要本模块，因此模块级只导入标准库，放在包外，导入时不会执行 utils、config 包的初始化
+（loguru、yaml 和配置模块）；日志和 Qt 只在首个实例开始监听后才用到，在相应方法中导入。
+"""
+
+import getpass
+import json
+import os
+import re
+import socket
+import sys
+import tempfile
+import time
+
+# Windows 命名互斥体已存在时的错误码（ERROR_ALREADY_EXISTS）
+ERROR_ALREADY_EXISTS = 183
+
+
+class InstanceBroker:
+    """单实例代理：判断是否为首个实例，首个实例接收后续启动转发的参数，后续启动转发参数"""
+
+    def __init__(self, app_name):
+        """
+        初始化代理
+
+        Args:
+            app_name (str): 应用名称，用于生成互斥体、锁文件和本地连接的名称
+        """
+        if not app_name:
+            raise ValueError("app_name 参数不能为空")
+
+        # 名称中只保留安全字符，并区分用户，避免不同用户的实例互相干扰
+        try:
+            user = getpass.getuser()
+        except Exception:
+            user = str(os.getpid())
+        self.key = re.sub(r"[^0-9A-Za-z_.-]", "_", f"{app_name}-{user}")
+
+        if sys.platform == "win32":
+            self.server_name = self.key
+            self.lock_path = None
+        else:
+            runtime_dir = os.environ.get("XDG_RUNTIME_DIR") or tempfile.gettempdir()
+            self.server_name = os.path.join(runtime_dir, f"{self.key}.sock")
+            self.lock_path = os.path.join(runtime_dir, f"{self.key}.lock")
+
+        self._lock_handle = None
+        self._server = None
+        self._connections = []
+
+    def acquire(self):
+        """
+        尝试成为首个实例（持有实例锁直到进程退出）
+
+        Returns:
+            bool: 是否为首个实例
+        """
+        if sys.platform == "win32":
+            import ctypes
+
+            handle = ctypes.windll.kernel32.CreateMutexW(None, False, f"Global\\{self.key}_MUTEX")
+            if ctypes.windll.kernel32.GetLastError() == ERROR_ALREADY_EXISTS:
+                return False
+            self._lock_handle = handle
+            return True
+
+        import fcntl
+
+        lock_file = open(self.lock_path, "a")
+        try:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            lock_file.close()
+            return False
+        self._lock_handle = lock_file
+        return True
+
+    def forward(self, argv, timeout=5.0):
+        """
+        把命令行参数转发给正在运行的实例
+
+        正在运行的实例可能仍在启动中、尚未开始监听，连接失败时在超时前重试。
+
+        Args:
+            argv (list): 命令行参数（不含程序名）
+            timeout (float): 超时时间（秒）
+
+        Returns:
+            bool: 是否转发成功
+        """
+        payload = (json.dumps({"argv": list(argv)}, ensure_ascii=False) + "\n").encode("utf-8")
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                self._send(payload, max(0.1, deadline - time.monotonic()))
+                return True
+            except OSError:
+                if time.monotonic() >= deadline:
+                    return False
+                time.sleep(0.05)
+
+    def _send(self, payload, timeout):
+        """向正在运行的实例发送一条消息"""
+        if sys.platform == "win32":
+            # QLocalServer 在 Windows 上使用同名的命名管道
+            with open(rf"\\.\pipe\{self.server_name}", "wb", buffering=0) as pipe:
+                pipe.write(payload)
+            return
+
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(timeout)
+            sock.connect(self.server_name)
+            sock.sendall(payload)
+
+    def listen(self, callback, parent=None):
+        """
+        开始接收后续启动转发的参数（需要在 QApplication 创建之后、以首个实例身份调用）
+
+        Args:
+            callback (callable): 收到参数时在主线程中调用，参数为命令行参数列表
+            parent (QObject, optional): 本地服务器的父对象
+
+        Returns:
+            bool: 是否开始监听
+        """
+        from PyQt5.QtNetwork import QLocalServer
+
+        from utils.logger import logger, get_logger
+
+        log = get_logger(__name__)
+
+        # 已持有实例锁，残留的套接字文件只可能来自异常退出的旧实例
+        QLocalServer.removeServer(self.server_name)
+
+        self._server = QLocalServer(parent)
+        self._server.setSocketOptions(QLocalServer.UserAccessOption)
+        if not self._server.listen(self.server_name):
+            logger.warning(f"单实例代理监听失败: {self._server.errorString()}")
+            return False
+
+        self._server.newConnection.connect(lambda: self._accept(callback))
+        log.debug("单实例代理开始监听: {}", self.server_name)
+        return True
+
+    def _accept(self, callback):
+        """接受新的连接，读取完整的一行消息后交给回调处理"""
+        while self._server.hasPendingConnections():
+            connection = self._server.nextPendingConnection()
+            buffer = bytearray()
+            self._connections.append(connection)
+
+            def on_ready_read(connection=connection, buffer=buffer):
+                buffer.extend(bytes(connection.readAll()))
+                if not buffer.endswith(b"\n"):
+                    return
+                connection.disconnectFromServer()
+                self._dispatch(bytes(buffer), callback)
+                buffer.clear()
+
+            def on_disconnected(connection=connection):
+                if connection in self._connections:
+                    self._connections.remove(connection)
+                connection.deleteLater()
+
+            connection.readyRead.connect(on_ready_read)
+            connection.disconnected.connect(on_disconnected)
+            if connection.bytesAvailable():
+                on_ready_read()
+
+    @staticmethod
+    def _dispatch(data, callback):
+        """解析消息并调用回调"""
+        from utils.logger import logger, get_logger
+
+        log = get_logger(__name__)
+
+        try:
+            message = json.loads(data.decode("utf-8"))
+            argv = [str(arg) for arg in message.get("argv", [])]
+        except (ValueError, AttributeError) as e:
+            logger.warning(f"收到无效的实例消息: {str(e)}")
+            return
+
+        log.debug("收到重复启动转发的参数: {}", argv)
+        try:
+            callback(argv)
+        except Exception as e:
+            logger.error(f"处理重复启动转发的参数失败: {str(e)}")
+
+    def close(self):
+        """停止监听并释放实例锁"""
+        if self._server is not None:
+            self._server.close()
+            self._server = None
+        if self._lock_handle is not None and sys.platform != "win32":
+            self._lock_handle.close()
+        self._lock_handle = None
@@ -8,19 +8,14 @@
 import os
 import sys
 import queue
+import time
 
-from config import ConfigManager, APP_INFO, DEFAULT_CONFIG, SYSTEM_CONFIG
-from utils import (
-    run_as_admin,
-    check_single_instance,
-    logger,
-    setup_logger,
-    find_icon_path,
-    send_notification,
-    create_notification_thread,
-    check_for_update,
-)
-from ui import create_gui
+# 启动计时起点，在导入其余模块之前记录，--profile-startup 时用于统计导入耗时
+STARTUP_TIME = time.perf_counter()
+
+# 重复启动时只需要应用信息和单实例代理（都只依赖标准库），其余模块确认是首个实例后再导入
+from config import APP_INFO, SYSTEM_CONFIG  # noqa: E402
+from instance_broker import InstanceBroker  # noqa: E402
 
 
 def main(custom_app_info=None, custom_default_config=None, custom_system_config=None):
@@ -32,35 +27,65 @@ def main(custom_app_info=None, custom_default_config=None, custom_system_config=
         custom_default_config (dict, optional): 自定义默认配置，用于覆盖默认值
         custom_system_config (dict, optional): 自定义系统配置，用于覆盖默认值
     """
-    # 检查是否以最小化模式启动（通过命令行参数）
-    start_minimized = "--minimized" in sys.argv
-
     # 合并应用信息
     final_app_info = APP_INFO.copy()
     if custom_app_info:
         final_app_info.update(custom_app_info)
 
+    # 检查单实例运行：程序已在运行时把命令行参数转发给它（由它显示主窗口）后直接退出，
+    # 在导入其余模块和请求管理员权限之前检查，重复启动时不加载日志、配置和 Qt，也不会弹出权限提示
+    instance_broker = InstanceBroker(final_app_info["name"])
+    if not instance_broker.acquire():
+        if not instance_broker.forward(sys.argv[1:]):
+            print("程序已经在运行中，无法启动多个实例！", file=sys.stderr)
+        return
+
+    from config import ConfigManager, parse_cli_overrides
+    from utils import (
+        run_as_admin,
+        get_logger,
+        setup_logger,
+        startup_profiler,
+        find_icon_path,
+        create_notification_thread,
+    )
+    from utils.startup_profiler import PROFILE_FLAG
+
+    log = get_logger(__name__)
+
+    # 检查是否以最小化模式启动（通过命令行参数）
+    start_minimized = "--minimized" in sys.argv
+
+    # 以 --profile-startup 启动时记录各阶段耗时
+    if PROFILE_FLAG in sys.argv:
+        startup_profiler.start(STARTUP_TIME, minimized=start_minimized)
+        startup_profiler.mark("imports")
+
     # 合并系统配置
     final_system_config = SYSTEM_CONFIG.copy()
     if custom_system_config:
         final_system_config.update(custom_system_config)
 
-    # 检查管理员权限
+    # 检查管理员权限（以管理员身份重新启动前释放实例锁，由新进程重新获取）
     if final_system_config.get("require_admin_privileges", True):
-        if not run_as_admin():
+        if not run_as_admin(before_restart=instance_broker.close):
             return
 
-    # 检查单实例运行
-    mutex_name = f"Global\\{final_app_info['name'].replace(' ', '_')}_MUTEX"
-    if not check_single_instance(mutex_name):
-        return
+    # Qt 相关模块
+    from ui import create_gui
+    from utils import check_for_update, get_startup_scheduler, PRIORITY_HIGH, PRIORITY_NORMAL, PRIORITY_LOW
+    startup_profiler.mark("ui_imports")
 
-    # 创建配置管理器
+    # 创建配置管理器（命令行 --set key=value 覆盖项优先级最高）
     config_manager = ConfigManager(
         custom_app_info=final_app_info,
         custom_default_config=custom_default_config,
         custom_system_config=final_system_config,
+        cli_overrides=parse_cli_overrides(sys.argv[1:]),
+        defer_auto_start=True,
     )
+    startup_profiler.set_history_file(config_manager.config_dir / ".startup_profile.jsonl")
+    startup_profiler.mark("config")
 
     # 初始化日志系统
     setup_logger(
@@ -68,26 +93,49 @@ def main(custom_app_info=None, custom_default_config=None, custom_system_config=
         log_retention_days=config_manager.log_retention_days,
         log_rotation=config_manager.log_rotation,
         debug_mode=config_manager.debug_mode,
+        structured=config_manager.log_structured,
+        compression_level=config_manager.log_compression_level,
+        max_total_size_mb=config_manager.log_max_total_size_mb,
+        ring_buffer_size=config_manager.log_ring_buffer_size,
+        flood_rate=config_manager.log_flood_rate,
+        flood_burst=config_manager.log_flood_burst,
+        flood_dedup=config_manager.log_flood_dedup,
     )
 
-    logger.debug("🟩 程序已启动！")
+    startup_profiler.mark("logger")
+
+    log.debug("🟩 程序已启动！")
 
     icon_path = find_icon_path()
+    startup_profiler.mark("icon")
 
-    # 通知线程
-    notification_thread_obj, stop_event = create_notification_thread(queue.Queue(), icon_path)
+    # 通知线程（先创建，在主窗口首次绘制后再启动）
+    notification_queue = queue.Queue()
+    notification_thread_obj, stop_event = create_notification_thread(notification_queue, icon_path, start=False)
 
     # 创建并运行PyQt5图形界面
     app, window = create_gui(config_manager, icon_path, start_minimized)
 
+    # 接收之后重复启动时转发的参数
+    instance_broker.listen(window.event_handler.handle_instance_message, window)
+
+    # 不影响主窗口显示的启动工作在首次绘制后（最小化启动时为托盘图标显示后）按优先级分批执行
+    scheduler = get_startup_scheduler()
+    scheduler.schedule(notification_thread_obj.start, PRIORITY_HIGH, "notification_thread")
+
     app_name = config_manager.get_app_name()
     app_author = config_manager.get_app_author()
     github_repo = config_manager.get_github_repo()
     github_releases = config_manager.get_github_releases_url()
 
     if config_manager.check_update_on_start:
-        logger.debug("启动时检查更新已开启，执行静默检查更新...")
-        check_for_update(config_manager, silent_mode=True)
+        log.debug("启动时检查更新已开启，首次绘制后执行静默检查更新...")
+        scheduler.schedule(
+            lambda: check_for_update(config_manager, silent_mode=True), PRIORITY_NORMAL, "check_for_update"
+        )
+
+    # 检查并同步开机自启注册表
+    scheduler.schedule(config_manager.sync_auto_start, PRIORITY_LOW, "sync_auto_start")
 
     buttons = [
         {"text": "访问项目官网", "action": "open_url", "launch": f"https://github.com/{github_repo}"},
@@ -95,13 +143,20 @@ def main(custom_app_info=None, custom_default_config=None, custom_system_config=
     ]
 
     # 不受Windows通知选项限制，每次开启都显示通知
-    send_notification(
-        title=app_name,
-        message=f"🚀 欢迎使用 {app_name} ！\n🐶 作者: {app_author}",
-        icon_path=icon_path,
-        buttons=buttons,
-        silent=True,  # 通知是否静音
+    # 先放入队列，通知线程启动后发送，通知库的导入和初始化不阻塞主窗口的首次绘制
+    notification_queue.put(
+        {
+            "title": app_name,
+            "message": f"🚀 欢迎使用 {app_name} ！\n🐶 作者: {app_author}",
+            "icon_path": icon_path,
+            "buttons": buttons,
+            "silent": True,  # 通知是否静音
+        }
     )
+    scheduler.release_after_first_paint(window, start_minimized)
+
+    # 首次绘制完成（最小化启动时为事件循环开始运行）后输出各阶段耗时并与历史比较
+    startup_profiler.watch_first_paint(window)
 
     try:
         # 运行应用（这会阻塞主线程直到应用程序退出）
@@ -114,7 +169,13 @@ def main(custom_app_info=None, custom_default_config=None, custom_system_config=
         if stop_event:
             stop_event.set()
 
-        logger.debug("🔴 程序已终止！")
+        # 写入尚未落盘的配置
+        config_manager.close()
+
+        # 停止接收重复启动的参数并释放实例锁
+        instance_broker.close()
+
+        log.debug("🔴 程序已终止！")
 
 
 if __name__ == "__main__":
@@ -1,5 +1,20 @@
 """用户界面模块"""
 
-from ui.main_window import create_gui, MainWindow
+# create_gui 和 MainWindow 在首次访问时才导入（PEP 562），
+# 只导入 ui 包或其中的子模块（如 ui.styles）时不会连带加载主窗口和全部管理器、组件
 
-__all__ = ["create_gui", "MainWindow"] 
\ No newline at end of file
+__all__ = ["create_gui", "MainWindow"]
+
+
+def __getattr__(name):
+    if name in __all__:
+        from ui import main_window
+
+        value = getattr(main_window, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,14 +1,12 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
-"""UI组件模块"""
+"""
+UI组件模块
 
-from .circle_button import CircleButton
-from .custom_titlebar import CustomTitleBar
-from .modern_switch import ModernSwitch
-from .navigation_tabs import NavigationTabs, NavigationTabWidget
-from .card_group_box import CardGroupBox
-from .custom_grips import CustomGrip
+各组件在首次访问时才导入所在的子模块（PEP 562），
+导入某一个组件（如 ui.components.modern_switch）时不会连带加载其余组件。
+"""
 
 __all__ = [
     "CircleButton",
@@ -18,4 +16,37 @@ __all__ = [
     "NavigationTabWidget",
     "CardGroupBox",
     "CustomGrip",
+    "LogViewer",
 ]
+
+
+def _import_submodule(name):
+    """导入名称所在的子模块（使用静态 import 语句，Nuitka 打包时才能发现这些模块）"""
+    if name == "CircleButton":
+        from . import circle_button as module
+    elif name == "CustomTitleBar":
+        from . import custom_titlebar as module
+    elif name == "ModernSwitch":
+        from . import modern_switch as module
+    elif name in ("NavigationTabs", "NavigationTabWidget"):
+        from . import navigation_tabs as module
+    elif name == "CardGroupBox":
+        from . import card_group_box as module
+    elif name == "CustomGrip":
+        from . import custom_grips as module
+    else:
+        from . import log_viewer as module
+    return module
+
+
+def __getattr__(name):
+    if name not in __all__:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(_import_submodule(name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
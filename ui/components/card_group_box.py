@@ -3,15 +3,39 @@
 
 """QGroupBox组件"""
 
-from PyQt5.QtWidgets import QGroupBox, QVBoxLayout, QHBoxLayout, QLabel, QWidget, QGraphicsDropShadowEffect
+from PyQt5.QtWidgets import QGroupBox, QVBoxLayout, QHBoxLayout, QLabel, QWidget
 from PyQt5.QtCore import Qt, pyqtSignal, QPropertyAnimation, QEasingCurve, pyqtProperty, QRectF
 from PyQt5.QtGui import QPainter, QPainterPath, QColor, QBrush, QPen
 from ui.styles import theme_manager, AntColors, AntColorsDark
+from ui.components.shadow_renderer import ShadowRenderer
 from utils import logger
 
+# 卡片自身的样式表（与主题和悬停状态无关，只在创建时设置一次），背景和边框在 paintEvent 中绘制
+CARD_STYLESHEET = """
+CardGroupBox {
+    background-color: transparent;
+    border: none;
+    margin: 0px;
+    padding: 0px;
+}
+
+/* 主容器和布局容器背景透明，不影响特定UI控件 */
+CardGroupBox > QWidget, CardGroupBox QWidget[objectName=""] {
+    background-color: transparent;
+}
+"""
+
 
 class CardGroupBox(QGroupBox):
 
+    # 各主题的绘制颜色和画笔 {主题: {名称: QColor | QPen}}，所有卡片共享
+    _palettes = {}
+
+    # 阴影参数（阴影图由 ShadowRenderer 预渲染并缓存）
+    SHADOW_BLUR = 12
+    SHADOW_OFFSET = (0, 4)
+    SHADOW_COLOR = QColor(0, 0, 0, 40)
+
     # 信号
     clicked = pyqtSignal()
     hovered = pyqtSignal(bool)  # True: 进入悬停, False: 离开悬停
@@ -30,9 +54,10 @@ class CardGroupBox(QGroupBox):
         # 主题相关属性
         self._current_theme = theme_manager.get_current_theme()
         self._colors = self._get_theme_colors()
+        self._palette = self._get_palette(self._current_theme)
 
-        # 动画属性
-        self._hover_opacity = 1.0
+        # 动画属性：悬停进度，0 为普通状态，1 为悬停状态
+        self._hover_progress = 0.0
         self._animation = None
 
         # 初始化组件
@@ -41,13 +66,45 @@ class CardGroupBox(QGroupBox):
         self._setup_shadow()
         self._connect_signals()
 
-        # 设置初始样式
-        self._update_style()
-
     def _get_theme_colors(self):
         """获取当前主题的颜色配置"""
         return AntColorsDark if self._current_theme == "dark" else AntColors
 
+    @classmethod
+    def _get_palette(cls, theme):
+        """
+        获取主题的绘制颜色和画笔（每个主题只创建一次）
+
+        Args:
+            theme (str): 主题名称
+
+        Returns:
+            dict: 普通和悬停状态的背景色、边框色及边框画笔
+        """
+        palette = cls._palettes.get(theme)
+        if palette is None:
+            colors = AntColorsDark if theme == "dark" else AntColors
+            palette = {
+                "background": QColor(colors.GRAY_1),
+                "hover_background": QColor(colors.GRAY_2),
+                "border": QColor(colors.GRAY_4),
+                "hover_border": QColor(colors.PRIMARY_4),
+            }
+            palette["border_pen"] = QPen(palette["border"], 1)
+            palette["hover_border_pen"] = QPen(palette["hover_border"], 1)
+            cls._palettes[theme] = palette
+        return palette
+
+    @staticmethod
+    def _blend(start, end, progress):
+        """按进度混合两种颜色"""
+        return QColor(
+            round(start.red() + (end.red() - start.red()) * progress),
+            round(start.green() + (end.green() - start.green()) * progress),
+            round(start.blue() + (end.blue() - start.blue()) * progress),
+            round(start.alpha() + (end.alpha() - start.alpha()) * progress),
+        )
+
     def _setup_ui(self):
         """设置UI结构"""
         # 移除默认标题显示
@@ -56,6 +113,7 @@ class CardGroupBox(QGroupBox):
         # 设置基础属性
         self.setMouseTracking(True)
         self.setAttribute(Qt.WidgetAttribute.WA_Hover, True)
+        self.setStyleSheet(CARD_STYLESHEET)
 
         # 创建主容器
         self._main_widget = QWidget(self)
@@ -63,31 +121,35 @@ class CardGroupBox(QGroupBox):
         self._main_layout.setContentsMargins(self._padding, self._padding, self._padding, self._padding)
         self._main_layout.setSpacing(12)
 
-        # 设置主布局 - 直接使用卡片主体
-        main_layout = QVBoxLayout(self)
-        main_layout.setContentsMargins(0, 0, 0, 0)
-        main_layout.setSpacing(0)
-        main_layout.addWidget(self._main_widget)
+        # 设置主布局 - 直接使用卡片主体，外边距留给阴影（见 _setup_shadow）
+        self._card_layout = QVBoxLayout(self)
+        self._card_layout.setContentsMargins(0, 0, 0, 0)
+        self._card_layout.setSpacing(0)
+        self._card_layout.addWidget(self._main_widget)
 
     def _setup_animations(self):
         """设置动画效果"""
-        self._animation = QPropertyAnimation(self, b"hover_opacity")
+        self._animation = QPropertyAnimation(self, b"hover_progress")
         self._animation.setDuration(200)
         self._animation.setEasingCurve(QEasingCurve.Type.OutCubic)
 
     def _setup_shadow(self):
-        """设置阴影效果"""
+        """
+        设置阴影效果
+
+        阴影在 paintEvent 中用预渲染的阴影图绘制在卡片主体周围的外边距内，
+        不使用 QGraphicsDropShadowEffect（每次重绘都要离屏渲染并模糊整个卡片）
+        """
         if self._shadow_enabled:
-            try:
-                shadow = QGraphicsDropShadowEffect()
-                shadow.setBlurRadius(12)
-                shadow.setColor(QColor(0, 0, 0, 40))
-                shadow.setOffset(0, 4)
-                # 将阴影应用到整个CardGroupBox而不是内部widget
-                self.setGraphicsEffect(shadow)
-            except Exception as e:
-                logger.warning(f"设置阴影效果失败: {e}")
-                self._shadow_enabled = False
+            margins = ShadowRenderer.margins(self.SHADOW_BLUR, *self.SHADOW_OFFSET)
+        else:
+            margins = (0, 0, 0, 0)
+        self._card_layout.setContentsMargins(*margins)
+        self.update()
+
+    def _card_rect(self):
+        """卡片主体区域（去掉阴影外边距）"""
+        return QRectF(self._main_widget.geometry())
 
     def _connect_signals(self):
         """连接信号"""
@@ -95,68 +157,66 @@ class CardGroupBox(QGroupBox):
         theme_manager.theme_changed.connect(self._on_theme_changed)
 
     def _on_theme_changed(self, theme):
-        """主题变化处理"""
+        """主题变化处理：切换到该主题缓存的颜色后重绘"""
         self._current_theme = theme
         self._colors = self._get_theme_colors()
-        self._update_style()
+        self._palette = self._get_palette(theme)
         self.update()
 
-    def _update_style(self):
-        """更新样式"""
-        # 卡片主体样式
-        card_bg = self._colors.GRAY_1
-        card_border = self._colors.GRAY_4
-        hover_bg = self._colors.GRAY_2 if self._is_hoverable else card_bg
-
-        # 根据悬停状态动态设置背景色
-        current_bg = hover_bg if (self._is_hoverable and self._hover_state) else card_bg
-        current_border = self._colors.PRIMARY_4 if (self._is_hoverable and self._hover_state) else card_border
-
-        style = f"""
-        CardGroupBox {{
-            background-color: transparent;
-            border: none;
-            margin: 0px;
-            padding: 0px;
-        }}
-
-        CardGroupBox > QWidget {{
-            background-color: {current_bg};
-            border: 1px solid {current_border};
-            border-radius: {self._border_radius}px;
-        }}
-
-        /* 只有主容器有背景，不影响特定UI组件 */
-        CardGroupBox > QWidget {{
-            background-color: {current_bg};
-            border: 1px solid {current_border};
-            border-radius: {self._border_radius}px;
-        }}
-
-        /* 确保容器内的布局容器背景透明，但不影响UI控件 */
-        CardGroupBox QWidget[objectName=""] {{
-            background-color: transparent;
-        }}
-        """
+    def paintEvent(self, event):
+        """绘制卡片背景和边框，悬停效果按悬停进度在普通和悬停颜色之间过渡"""
+        palette = self._palette
+        progress = self._hover_progress if self._is_hoverable else 0.0
+        if progress <= 0.0:
+            background, pen = palette["background"], palette["border_pen"]
+        elif progress >= 1.0:
+            background, pen = palette["hover_background"], palette["hover_border_pen"]
+        else:
+            background = self._blend(palette["background"], palette["hover_background"], progress)
+            pen = QPen(self._blend(palette["border"], palette["hover_border"], progress), 1)
 
-        self.setStyleSheet(style)
+        card_rect = self._card_rect()
+        painter = QPainter(self)
 
-    def paintEvent(self, event):
-        """自定义绘制事件"""
-        # 让父类处理基础绘制
-        super().paintEvent(event)
+        if self._shadow_enabled:
+            try:
+                ShadowRenderer.paint(
+                    painter,
+                    card_rect.translated(*self.SHADOW_OFFSET),
+                    self._border_radius,
+                    self.SHADOW_BLUR,
+                    self.SHADOW_COLOR,
+                    self.devicePixelRatioF(),
+                )
+            except Exception as e:
+                logger.warning(f"绘制阴影失败: {e}")
+                self._shadow_enabled = False
+                # 收回为阴影预留的外边距
+                self._setup_shadow()
+
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(pen)
+        painter.setBrush(background)
+        # 边框宽度为1，向内偏移半个像素使边框落在像素上
+        painter.drawRoundedRect(card_rect.adjusted(0.5, 0.5, -0.5, -0.5), self._border_radius, self._border_radius)
+        painter.end()
+
+    def _animate_hover(self, end_value):
+        """悬停进度动画，动画过程中只触发重绘"""
+        if self._animation:
+            self._animation.stop()
+            self._animation.setStartValue(self._hover_progress)
+            self._animation.setEndValue(end_value)
+            self._animation.start()
+        else:
+            self.set_hover_progress(end_value)
 
     def enterEvent(self, event):
         """鼠标进入事件"""
         if self._is_hoverable:
             self._hover_state = True
             self.hovered.emit(True)
-            self._update_style()  # 重新应用样式以显示悬停效果
-
-            if self._animation:
-                self._animation.setStartValue(self._hover_opacity)
-                self._animation.setEndValue(0.9)
-                self._animation.start()
+            self._animate_hover(1.0)
 
         super().enterEvent(event)
 
@@ -165,12 +225,7 @@ class CardGroupBox(QGroupBox):
         if self._is_hoverable:
             self._hover_state = False
             self.hovered.emit(False)
-            self._update_style()  # 重新应用样式以移除悬停效果
-
-            if self._animation:
-                self._animation.setStartValue(self._hover_opacity)
-                self._animation.setEndValue(1.0)
-                self._animation.start()
+            self._animate_hover(0.0)
 
         super().leaveEvent(event)
 
@@ -181,20 +236,25 @@ class CardGroupBox(QGroupBox):
         super().mousePressEvent(event)
 
     # 属性访问器
-    def get_hover_opacity(self):
-        return self._hover_opacity
+    def get_hover_progress(self):
+        return self._hover_progress
 
-    def set_hover_opacity(self, value):
-        self._hover_opacity = value
+    def set_hover_progress(self, value):
+        self._hover_progress = value
         self.update()
 
-    hover_opacity = pyqtProperty(float, get_hover_opacity, set_hover_opacity)
+    hover_progress = pyqtProperty(float, get_hover_progress, set_hover_progress)
 
     # 公共方法
     def setHoverable(self, hoverable):
         """设置是否启用悬停效果"""
         self._is_hoverable = hoverable
-        self._update_style()
+        if not hoverable:
+            if self._animation:
+                self._animation.stop()
+            self._hover_state = False
+            self._hover_progress = 0.0
+        self.update()
 
     def isHoverable(self):
         """获取是否启用悬停效果"""
@@ -215,7 +275,7 @@ class CardGroupBox(QGroupBox):
     def setBorderRadius(self, radius):
         """设置圆角半径"""
         self._border_radius = radius
-        self._update_style()
+        self.update()
 
     def borderRadius(self):
         """获取圆角半径"""
@@ -234,11 +294,7 @@ class CardGroupBox(QGroupBox):
     def setShadowEnabled(self, enabled):
         """设置是否启用阴影"""
         self._shadow_enabled = enabled
-        if enabled:
-            self._setup_shadow()
-        else:
-            # 移除阴影效果
-            self.setGraphicsEffect(None)
+        self._setup_shadow()
 
     def isShadowEnabled(self):
         """获取是否启用阴影"""
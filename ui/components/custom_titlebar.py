@@ -18,7 +18,9 @@ from PyQt5.QtCore import (
 from PyQt5.QtGui import QIcon, QPainter, QBrush, QColor, QPen, QPainterPath, QRegion
 from .circle_button import CircleButton
 from ui.styles import AntColors, AntColorsDark, theme_manager
-from utils import logger
+from utils import logger, get_logger
+
+log = get_logger(__name__)
 
 
 @dataclass
@@ -349,7 +351,7 @@ class CustomTitleBar(QWidget):
             if hasattr(self.parent_widget, "update_tray_menu_text"):
                 self.parent_widget.update_tray_menu_text()
 
-            logger.debug("窗口已通过自定义标题栏最小化到托盘")
+            log.debug("窗口已通过自定义标题栏最小化到托盘")
 
         except Exception as e:
             logger.error(f"托盘最小化完成处理错误: {str(e)}")
@@ -416,7 +418,7 @@ class CustomTitleBar(QWidget):
             # 启动动画
             restore_animations.start()
 
-            logger.debug("窗口正在从托盘恢复，带动画效果")
+            log.debug("窗口正在从托盘恢复，带动画效果")
 
         except Exception as e:
             logger.error(f"安全恢复窗口失败: {str(e)}")
@@ -436,7 +438,7 @@ class CustomTitleBar(QWidget):
             # 清理动画资源
             animation_group.deleteLater()
 
-            logger.debug("窗口从托盘恢复动画完成")
+            log.debug("窗口从托盘恢复动画完成")
 
         except Exception as e:
             logger.error(f"恢复动画完成处理错误: {str(e)}")
@@ -0,0 +1,507 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+日志查看器组件
+
+LogViewer 结构:
+├── 文件选择、级别、模块、搜索和跟随控件
+├── QListView        # 虚拟列表，只为可见行读取内容
+│   └── LogLineModel # 通过行索引从内存映射中读取行
+└── LogIndexWorker   # 后台线程：跟随文件追加内容、增量建立行索引和过滤结果
+
+日志内容不会被整体读入内存或控件，数百 MB 的日志文件也只占用索引数组的内存。
+"""
+
+import json
+import queue
+import threading
+from array import array
+from datetime import date
+from pathlib import Path
+
+from PyQt5.QtWidgets import (
+    QWidget,
+    QVBoxLayout,
+    QHBoxLayout,
+    QLabel,
+    QPushButton,
+    QComboBox,
+    QLineEdit,
+    QCheckBox,
+    QListView,
+    QAbstractItemView,
+    QApplication,
+)
+from PyQt5.QtCore import Qt, QObject, QAbstractListModel, QModelIndex, QTimer, pyqtSignal
+from PyQt5.QtGui import QColor, QFontDatabase
+from ui.styles import ColorScheme
+from utils import logger
+from utils.log_reader import LogDocument, LogIndex, LogFilter, LEVEL_NUMBERS, list_log_files
+
+# 过滤时每次处理的最大行数，处理完一段就发布一次结果
+FILTER_CHUNK_LINES = 200000
+
+
+class LogIndexWorker(QObject):
+    """日志索引后台线程，通过信号把结果发布给界面线程"""
+
+    # 打开了新的日志内容 - (LogDocument, LogIndex)
+    opened = pyqtSignal(object, object)
+    # 已建立索引的行数
+    indexed = pyqtSignal(int)
+    # 过滤结果 - (过滤代数, 匹配的行号数组, 已发布的匹配行数)
+    filtered = pyqtSignal(int, object, int)
+    # 打开或读取失败 - 错误信息
+    failed = pyqtSignal(str)
+
+    def __init__(self, poll_interval=0.5):
+        """
+        初始化后台线程
+
+        Args:
+            poll_interval (float): 空闲时检查文件新增内容的间隔（秒）
+        """
+        super().__init__()
+        self.poll_interval = poll_interval
+        self._commands = queue.Queue()
+        self._thread = None
+
+    def start(self):
+        """启动后台线程"""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="log-viewer-index", daemon=True)
+            self._thread.start()
+
+    def open_file(self, path):
+        """打开日志文件或归档"""
+        self._commands.put(("open", path))
+
+    def set_filter(self, generation, log_filter):
+        """
+        设置过滤条件
+
+        Args:
+            generation (int): 过滤代数，界面只接受最新一代的结果
+            log_filter (LogFilter): 过滤条件
+        """
+        self._commands.put(("filter", generation, log_filter))
+
+    def stop(self):
+        """停止后台线程"""
+        if self._thread is not None:
+            self._commands.put(("stop",))
+            self._thread.join(timeout=2)
+            self._thread = None
+
+    def _run(self):
+        """后台线程主循环：处理命令，空闲时跟随文件新增内容"""
+        document = None
+        index = None
+        log_filter = None
+        generation = 0
+        rows = None
+        filtered_upto = 0
+        busy = False
+
+        while True:
+            try:
+                command = self._commands.get(timeout=0 if busy else self.poll_interval)
+            except queue.Empty:
+                command = None
+
+            if command is not None:
+                if command[0] == "stop":
+                    if document is not None:
+                        document.close()
+                    return
+                if command[0] == "open":
+                    document, index = self._open(document, command[1])
+                    filtered_upto = 0
+                    rows = array("I") if log_filter is not None else None
+                elif command[0] == "filter":
+                    generation, log_filter = command[1], command[2]
+                    log_filter = None if log_filter.is_empty else log_filter
+                    rows = array("I") if log_filter is not None else None
+                    filtered_upto = 0
+                    if rows is not None:
+                        self.filtered.emit(generation, rows, 0)
+
+            busy = False
+            if document is None:
+                continue
+
+            try:
+                # 当前日志被轮转替换或截断时重新打开同一路径
+                if document.is_replaced() or document.refresh():
+                    document, index = self._open(document, document.path)
+                    filtered_upto = 0
+                    rows = array("I") if log_filter is not None else None
+                    if document is None:
+                        continue
+                    document.refresh()
+
+                if index.update(document.buffer, document.size):
+                    self.indexed.emit(len(index))
+                    busy = True
+                if document.is_archive and not document.complete:
+                    busy = True
+
+                if log_filter is not None and filtered_upto < len(index):
+                    last = min(len(index), filtered_upto + FILTER_CHUNK_LINES)
+                    rows.extend(log_filter.apply(index, document.buffer, filtered_upto, last))
+                    filtered_upto = last
+                    self.filtered.emit(generation, rows, len(rows))
+                    busy = busy or filtered_upto < len(index)
+            except (OSError, ValueError) as e:
+                self.failed.emit(f"读取日志失败: {e}")
+                document.close()
+                document = None
+
+    def _open(self, document, path):
+        """关闭旧内容并打开新文件，返回 (LogDocument, LogIndex)，失败时返回 (None, None)"""
+        if document is not None:
+            document.close()
+
+        document = LogDocument(path)
+        try:
+            document.open()
+        except (OSError, RuntimeError) as e:
+            self.failed.emit(f"打开日志失败: {e}")
+            return None, None
+
+        index = LogIndex()
+        self.opened.emit(document, index)
+        return document, index
+
+
+class LogLineModel(QAbstractListModel):
+    """按需读取日志行的虚拟列表模型"""
+
+    # 单行最多显示的字符数
+    MAX_LINE_LENGTH = 2000
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._document = None
+        self._index = None
+        self._rows = None
+        self._generation = 0
+        self._line_count = 0
+        self._row_count = 0
+
+    @property
+    def line_count(self):
+        """已建立索引的总行数"""
+        return self._line_count
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._row_count
+
+    def data(self, model_index, role=Qt.ItemDataRole.DisplayRole):
+        if not model_index.isValid() or self._index is None:
+            return None
+
+        row = model_index.row()
+        line_no = self._rows[row] if self._rows is not None else row
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._line_text(line_no)
+        if role == Qt.ItemDataRole.ForegroundRole:
+            return self._level_color(self._index.levels[line_no])
+        return None
+
+    def _line_text(self, line_no):
+        """读取并解码一行（结构化日志转换为与文本日志相同的格式）"""
+        start, end = self._index.line_range(line_no)
+        raw = self._document.read(start, min(end, start + self.MAX_LINE_LENGTH * 4))
+        text = raw.decode("utf-8", "replace").rstrip("\r")
+
+        if text.startswith("{"):
+            try:
+                entry = json.loads(text)
+                text = (
+                    f"{entry['time'][:23].replace('T', ' ')} | {entry['level']: <8} | "
+                    f"{entry['module']}:{entry['function']}:{entry['line']} | {entry['message']}"
+                )
+            except (ValueError, KeyError, TypeError):
+                pass
+
+        if len(text) > self.MAX_LINE_LENGTH:
+            text = text[: self.MAX_LINE_LENGTH] + " …"
+        return text
+
+    @staticmethod
+    def _level_color(level_no):
+        """根据级别返回文字颜色（INFO 使用默认颜色）"""
+        if level_no >= LEVEL_NUMBERS["ERROR"]:
+            return QColor(ColorScheme.ERROR())
+        if level_no >= LEVEL_NUMBERS["WARNING"]:
+            return QColor(ColorScheme.WARNING())
+        if 0 < level_no < LEVEL_NUMBERS["INFO"]:
+            return QColor(ColorScheme.DISABLED())
+        return None
+
+    def set_source(self, document, index):
+        """切换到新的日志内容"""
+        self.beginResetModel()
+        self._document = document
+        self._index = index
+        self._line_count = 0
+        self._row_count = 0
+        if self._rows is not None:
+            self._rows = array("I")
+        self.endResetModel()
+
+    def set_line_count(self, count):
+        """索引新增行后追加显示（未过滤时）"""
+        previous = self._line_count
+        self._line_count = count
+        if self._rows is None and count > previous:
+            self.beginInsertRows(QModelIndex(), previous, count - 1)
+            self._row_count = count
+            self.endInsertRows()
+
+    def set_filter_generation(self, generation, active):
+        """
+        开始新一代过滤
+
+        Args:
+            generation (int): 过滤代数
+            active (bool): 是否有过滤条件，没有时显示全部行
+        """
+        self.beginResetModel()
+        self._generation = generation
+        self._rows = array("I") if active else None
+        self._row_count = 0 if active else self._line_count
+        self.endResetModel()
+
+    def set_rows(self, generation, rows, count):
+        """接收后台线程的过滤结果（忽略过期代数的结果）"""
+        if generation != self._generation or self._rows is None:
+            return
+
+        if rows is not self._rows:
+            self.beginResetModel()
+            self._rows = rows
+            self._row_count = count
+            self.endResetModel()
+        elif count > self._row_count:
+            self.beginInsertRows(QModelIndex(), self._row_count, count - 1)
+            self._row_count = count
+            self.endInsertRows()
+
+
+class LogViewer(QWidget):
+    """日志查看器"""
+
+    LEVEL_OPTIONS = [
+        ("全部级别", 0),
+        ("DEBUG 及以上", LEVEL_NUMBERS["DEBUG"]),
+        ("INFO 及以上", LEVEL_NUMBERS["INFO"]),
+        ("WARNING 及以上", LEVEL_NUMBERS["WARNING"]),
+        ("ERROR 及以上", LEVEL_NUMBERS["ERROR"]),
+    ]
+
+    def __init__(self, log_dir, structured=False, parent=None):
+        """
+        初始化日志查看器
+
+        Args:
+            log_dir (str | Path): 日志目录
+            structured (bool): 当前日志是否为结构化 JSON Lines 格式
+            parent: 父组件
+        """
+        super().__init__(parent)
+        self.log_dir = Path(log_dir)
+        self.structured = structured
+
+        self._started = False
+        self._current_path = None
+        self._following_current = False
+        self._filter_generation = 0
+
+        self.model = LogLineModel(self)
+        self.worker = LogIndexWorker()
+
+        self._setup_ui()
+        self._connect_signals()
+
+    def _setup_ui(self):
+        """设置UI"""
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(8)
+
+        # 文件选择
+        file_layout = QHBoxLayout()
+        self.file_combo = QComboBox()
+        self.file_combo.setSizeAdjustPolicy(QComboBox.SizeAdjustPolicy.AdjustToMinimumContentsLength)
+        file_layout.addWidget(self.file_combo, 1)
+
+        self.refresh_btn = QPushButton("刷新")
+        file_layout.addWidget(self.refresh_btn)
+        layout.addLayout(file_layout)
+
+        # 过滤条件
+        filter_layout = QHBoxLayout()
+        self.level_combo = QComboBox()
+        for text, level_no in self.LEVEL_OPTIONS:
+            self.level_combo.addItem(text, level_no)
+        filter_layout.addWidget(self.level_combo)
+
+        self.module_edit = QLineEdit()
+        self.module_edit.setPlaceholderText("模块，如 ui.managers")
+        filter_layout.addWidget(self.module_edit)
+
+        self.search_edit = QLineEdit()
+        self.search_edit.setPlaceholderText("搜索内容")
+        self.search_edit.setClearButtonEnabled(True)
+        filter_layout.addWidget(self.search_edit, 1)
+
+        self.follow_checkbox = QCheckBox("跟随最新")
+        self.follow_checkbox.setChecked(True)
+        filter_layout.addWidget(self.follow_checkbox)
+        layout.addLayout(filter_layout)
+
+        # 日志列表：统一行高时只需为可见行读取内容
+        self.list_view = QListView()
+        self.list_view.setModel(self.model)
+        self.list_view.setUniformItemSizes(True)
+        self.list_view.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.list_view.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
+        self.list_view.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
+        self.list_view.setFont(QFontDatabase.systemFont(QFontDatabase.SystemFont.FixedFont))
+        self.list_view.setMinimumHeight(420)
+        layout.addWidget(self.list_view, 1)
+
+        self.status_label = QLabel()
+        layout.addWidget(self.status_label)
+
+        # 过滤条件输入防抖
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(300)
+
+        # 跨天后切换到新的当天日志
+        self._day_timer = QTimer(self)
+        self._day_timer.setInterval(60000)
+
+    def _connect_signals(self):
+        """连接信号"""
+        self.file_combo.currentIndexChanged.connect(self._on_file_selected)
+        self.refresh_btn.clicked.connect(self.refresh_files)
+        self.level_combo.currentIndexChanged.connect(self._filter_timer.start)
+        self.module_edit.textChanged.connect(self._filter_timer.start)
+        self.search_edit.textChanged.connect(self._filter_timer.start)
+        self._filter_timer.timeout.connect(self._apply_filter)
+        self._day_timer.timeout.connect(self._check_day_changed)
+
+        self.worker.opened.connect(self._on_opened)
+        self.worker.indexed.connect(self._on_indexed)
+        self.worker.filtered.connect(self._on_filtered)
+        self.worker.failed.connect(self._on_failed)
+
+    def showEvent(self, event):
+        """首次显示时才启动后台线程并打开日志"""
+        super().showEvent(event)
+        if not self._started:
+            self._started = True
+            self.worker.start()
+            self.refresh_files()
+            self._day_timer.start()
+            QApplication.instance().aboutToQuit.connect(self.shutdown)
+
+    def current_log_path(self):
+        """当天日志文件的路径"""
+        suffix = ".jsonl" if self.structured else ".log"
+        return self.log_dir / f"{date.today().isoformat()}{suffix}"
+
+    def refresh_files(self):
+        """重新列出日志文件，保留当前选择"""
+        selected = self._current_path
+        files = list_log_files(self.log_dir)
+        current = self.current_log_path()
+        if current not in files and current.exists():
+            files.insert(0, current)
+
+        self.file_combo.blockSignals(True)
+        self.file_combo.clear()
+        for path in files:
+            label = f"{path.name}（当前）" if path == current else path.name
+            self.file_combo.addItem(label, str(path))
+        self.file_combo.blockSignals(False)
+
+        if not files:
+            self.status_label.setText(f"日志目录中没有日志文件: {self.log_dir}")
+            return
+
+        position = self.file_combo.findData(str(selected)) if selected else -1
+        if position < 0:
+            position = self.file_combo.findData(str(current))
+        self.file_combo.setCurrentIndex(max(position, 0))
+        if self._current_path is None or str(self._current_path) != self.file_combo.currentData():
+            self._on_file_selected(self.file_combo.currentIndex())
+
+    def _on_file_selected(self, position):
+        """打开选中的日志文件"""
+        path = self.file_combo.itemData(position)
+        if not path:
+            return
+        self._current_path = Path(path)
+        self._following_current = self._current_path == self.current_log_path()
+        self.status_label.setText(f"正在读取 {self._current_path.name}...")
+        self.worker.open_file(self._current_path)
+
+    def _check_day_changed(self):
+        """正在查看当天日志时，跨天后切换到新一天的日志"""
+        current = self.current_log_path()
+        if self._following_current and self._current_path != current and current.exists():
+            self._current_path = None
+            self.refresh_files()
+
+    def _apply_filter(self):
+        """把当前的过滤条件交给后台线程"""
+        log_filter = LogFilter(self.level_combo.currentData(), self.module_edit.text(), self.search_edit.text())
+        self._filter_generation += 1
+        self.model.set_filter_generation(self._filter_generation, not log_filter.is_empty)
+        self.worker.set_filter(self._filter_generation, log_filter)
+        self._update_status()
+
+    def _on_opened(self, document, index):
+        self.model.set_source(document, index)
+        self._update_status()
+
+    def _on_indexed(self, count):
+        self.model.set_line_count(count)
+        self._update_status()
+        self._follow()
+
+    def _on_filtered(self, generation, rows, count):
+        self.model.set_rows(generation, rows, count)
+        self._update_status()
+        self._follow()
+
+    def _on_failed(self, message):
+        logger.warning(message)
+        self.status_label.setText(message)
+
+    def _follow(self):
+        """开启跟随时滚动到最新一行"""
+        if self.follow_checkbox.isChecked():
+            self.list_view.scrollToBottom()
+
+    def _update_status(self):
+        """更新状态栏中的行数"""
+        name = self._current_path.name if self._current_path else ""
+        shown = self.model.rowCount()
+        total = self.model.line_count
+        if shown == total:
+            self.status_label.setText(f"{name}：共 {total} 行")
+        else:
+            self.status_label.setText(f"{name}：共 {total} 行，匹配 {shown} 行")
+
+    def shutdown(self):
+        """停止后台线程"""
+        self._day_timer.stop()
+        self.worker.stop()
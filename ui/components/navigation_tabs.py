@@ -18,6 +18,8 @@ NavigationTabWidget 结构:
 - 水平滚动条始终隐藏
 - 保持现有布局和样式
 - 支持主题切换
+- 支持按需创建页面：addTab 传入页面工厂函数时立即创建导航按钮，
+  页面在首次切换到该选项卡时或窗口显示后的空闲时间才创建
 
 """
 
@@ -34,6 +36,7 @@ from PyQt5.QtWidgets import (
 )
 from PyQt5.QtCore import (
     Qt,
+    QTimer,
     pyqtSignal,
     QSize,
     QPropertyAnimation,
@@ -197,8 +200,7 @@ class NavigationButton(QPushButton):
             self.setProperty("buttonState", "inactive")
 
         # 刷新样式以应用新的属性
-        self.style().unpolish(self)
-        self.style().polish(self)
+        theme_manager.repolish(self)
 
         # 更新内部标签的颜色（这些不在全局样式中定义）
         colors = AntColorsDark if theme_manager.is_dark_theme() else AntColors
@@ -321,8 +323,7 @@ class NavigationTabs(QWidget):
         self.setProperty("navType", "vertical")
 
         # 刷新样式
-        self.style().unpolish(self)
-        self.style().polish(self)
+        theme_manager.repolish(self)
 
     def _setup_logo_containers(self):
         """设置独立的Logo图标和文字容器"""
@@ -500,12 +501,7 @@ class NavigationTabs(QWidget):
     def _on_theme_changed(self, theme):
         """主题变化时刷新样式"""
         # 刷新容器样式
-        self.style().unpolish(self)
-        self.style().polish(self)
-
-        # 刷新所有按钮的样式（按钮有自己的主题变化处理）
-        for button in self.buttons:
-            button._update_style()
+        theme_manager.repolish(self)
 
         # 更新Logo样式
         self._update_logo_theme()
@@ -523,9 +519,23 @@ class NavigationTabWidget(QWidget):
     # 信号：当前选项卡改变
     currentChanged = pyqtSignal(int)
 
+    # 信号：按需创建的页面已创建 - (索引, 页面)
+    pageCreated = pyqtSignal(int, QWidget)
+
+    # 窗口显示后，空闲时创建剩余页面的间隔（毫秒），每次只创建一个页面以免阻塞输入
+    IDLE_BUILD_INTERVAL = 50
+
     def __init__(self, parent=None):
         super().__init__(parent)
 
+        # 尚未创建的页面 {索引: 页面工厂函数}
+        self._page_factories = {}
+
+        # 空闲时逐个创建页面的定时器（首次显示后启动）
+        self._idle_build_timer = QTimer(self)
+        self._idle_build_timer.setInterval(self.IDLE_BUILD_INTERVAL)
+        self._idle_build_timer.timeout.connect(self._build_next_pending_page)
+
         # 内容切换动画属性
         self._content_opacity = 1.0
         self._content_animation = None
@@ -554,8 +564,7 @@ class NavigationTabWidget(QWidget):
         self.content_stack.setProperty("contentType", "navigation")
 
         # 刷新样式
-        self.content_stack.style().unpolish(self.content_stack)
-        self.content_stack.style().polish(self.content_stack)
+        theme_manager.repolish(self.content_stack)
 
         layout.addWidget(self.nav_tabs)
         layout.addWidget(self.content_stack, 1)
@@ -596,6 +605,9 @@ class NavigationTabWidget(QWidget):
         if index == self.content_stack.currentIndex():
             return  # 相同索引，不需要切换
 
+        # 页面尚未创建时先创建，淡出结束后直接切换
+        self.ensurePage(index)
+
         # 保存待切换的索引
         self._pending_index = index
 
@@ -621,9 +633,18 @@ class NavigationTabWidget(QWidget):
 
             self._pending_index = -1
 
-    def addTab(self, widget: QWidget, text: str, icon_text: str = ""):
-        """添加选项卡"""
-        self.nav_tabs.addTab(text, icon_text)
+    def addTab(self, widget, text: str, icon_text: str = ""):
+        """
+        添加选项卡
+
+        Args:
+            widget: 页面组件，或无参数、返回页面组件的工厂函数（页面按需创建）
+            text: 选项卡文本
+            icon_text: 选项卡图标
+        """
+        # 先添加内容区域再添加导航按钮：第一个按钮添加时会立即激活，
+        # 此时内容区域已经位于该页面，不会触发切换（也就不会提前创建按需页面）
+        index = self.content_stack.count()
 
         # 创建滚动区域包装器
         scroll_area = QScrollArea()
@@ -631,16 +652,68 @@ class NavigationTabWidget(QWidget):
         scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
         scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
         scroll_area.setFrameShape(QFrame.Shape.NoFrame)
-        scroll_area.setWidget(widget)
+        if isinstance(widget, QWidget):
+            scroll_area.setWidget(widget)
+        else:
+            self._page_factories[index] = widget
 
         # 设置滚动区域属性，让 styles.py 中的样式自动应用
         scroll_area.setProperty("contentType", "navigation")
 
         # 刷新样式
-        scroll_area.style().unpolish(scroll_area)
-        scroll_area.style().polish(scroll_area)
+        theme_manager.repolish(scroll_area)
 
         self.content_stack.addWidget(scroll_area)
+        self.nav_tabs.addTab(text, icon_text)
+
+        # 窗口已显示时添加的按需页面同样在空闲时创建
+        if self._page_factories and self.isVisible() and not self._idle_build_timer.isActive():
+            self._idle_build_timer.start()
+
+    def ensurePage(self, index: int):
+        """
+        确保指定索引的页面已创建
+
+        Args:
+            index: 选项卡索引
+
+        Returns:
+            QWidget: 页面组件，索引无效时返回 None
+        """
+        scroll_area = self.content_stack.widget(index)
+        if scroll_area is None:
+            return None
+
+        factory = self._page_factories.pop(index, None)
+        if factory is not None and isinstance(scroll_area, QScrollArea):
+            page = factory()
+            scroll_area.setWidget(page)
+            self.pageCreated.emit(index, page)
+
+        if not self._page_factories:
+            self._idle_build_timer.stop()
+
+        if isinstance(scroll_area, QScrollArea):
+            return scroll_area.widget()
+        return scroll_area
+
+    def hasPendingPages(self) -> bool:
+        """是否还有尚未创建的页面"""
+        return bool(self._page_factories)
+
+    def _build_next_pending_page(self):
+        """空闲时创建下一个尚未创建的页面（按选项卡顺序）"""
+        if self._page_factories:
+            self.ensurePage(min(self._page_factories))
+        else:
+            self._idle_build_timer.stop()
+
+    def showEvent(self, event):
+        """首次显示时在绘制前创建当前页面，其余页面之后在空闲时逐个创建"""
+        self.ensurePage(self.content_stack.currentIndex())
+        super().showEvent(event)
+        if self._page_factories and not self._idle_build_timer.isActive():
+            self._idle_build_timer.start()
 
     def setCurrentIndex(self, index: int):
         """设置当前选中的索引"""
@@ -651,11 +724,8 @@ class NavigationTabWidget(QWidget):
         return self.nav_tabs.currentIndex()
 
     def widget(self, index: int) -> QWidget:
-        """获取指定索引的内容组件"""
-        scroll_area = self.content_stack.widget(index)
-        if isinstance(scroll_area, QScrollArea):
-            return scroll_area.widget()
-        return scroll_area
+        """获取指定索引的内容组件（页面尚未创建时立即创建）"""
+        return self.ensurePage(index)
 
     def count(self) -> int:
         """获取选项卡数量"""
@@ -674,12 +744,10 @@ class NavigationTabWidget(QWidget):
     def _on_theme_changed(self, theme):
         """主题变化时刷新样式"""
         # 刷新内容区域样式
-        self.content_stack.style().unpolish(self.content_stack)
-        self.content_stack.style().polish(self.content_stack)
+        theme_manager.repolish(self.content_stack)
 
         # 刷新所有滚动区域的样式
         for i in range(self.content_stack.count()):
             scroll_area = self.content_stack.widget(i)
             if isinstance(scroll_area, QScrollArea):
-                scroll_area.style().unpolish(scroll_area)
-                scroll_area.style().polish(scroll_area)
+                theme_manager.repolish(scroll_area)
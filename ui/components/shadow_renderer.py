@@ -0,0 +1,166 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+预渲染阴影
+
+QGraphicsDropShadowEffect 在每次重绘时都要把控件及其所有子控件渲染到离屏图像再做模糊，
+滚动和切换页面时开销随卡片数量线性增长。这里改为对每组（圆角半径、模糊半径、颜色、设备像素比）
+只用 QGraphicsDropShadowEffect 渲染一次圆角矩形的阴影，得到九宫格阴影图，之后绘制任意大小的阴影时只需把四个角、四条边和中心贴到对应位置。
+"""
+
+from PyQt5.QtCore import QRectF, Qt
+from PyQt5.QtGui import QImage, QPainter, QPainterPath, QPen, QPixmap
+from PyQt5.QtWidgets import QGraphicsDropShadowEffect, QGraphicsPathItem, QGraphicsScene
+
+
+class ShadowRenderer:
+    """九宫格阴影渲染器，阴影图按（圆角半径、模糊半径、颜色、设备像素比）缓存，所有控件共享"""
+
+    # {(圆角半径, 模糊半径, 颜色 RGBA, 设备像素比): QPixmap}
+    _cache = {}
+
+    @staticmethod
+    def margins(blur, offset_x=0, offset_y=0):
+        """
+        计算阴影在控件内需要预留的边距
+
+        Args:
+            blur (int): 模糊半径
+            offset_x (int): 阴影水平偏移
+            offset_y (int): 阴影垂直偏移
+
+        Returns:
+            tuple: (左, 上, 右, 下)
+        """
+        return (
+            max(0, blur - offset_x),
+            max(0, blur - offset_y),
+            max(0, blur + offset_x),
+            max(0, blur + offset_y),
+        )
+
+    @classmethod
+    def get_pixmap(cls, radius, blur, color, dpr=1.0):
+        """
+        获取九宫格阴影图（首次使用时生成）
+
+        阴影图为边长 2 * 角的边长 + 1 的正方形，角的边长为圆角半径 + 2 * 模糊半径
+        （阴影向外和向内各扩展一个模糊半径），四角之间的一行一列是直边的模糊轮廓，用于拉伸。
+
+        Args:
+            radius (int): 圆角半径
+            blur (int): 模糊半径
+            color (QColor): 阴影颜色
+            dpr (float): 设备像素比
+
+        Returns:
+            QPixmap: 阴影图
+        """
+        key = (radius, blur, color.rgba(), dpr)
+        pixmap = cls._cache.get(key)
+        if pixmap is None:
+            pixmap = cls._render(radius, blur, color, dpr)
+            cls._cache[key] = pixmap
+        return pixmap
+
+    @staticmethod
+    def _corner_size(radius, blur):
+        """九宫格四角的边长（逻辑像素）"""
+        return radius + 2 * blur
+
+    @staticmethod
+    def _render(radius, blur, color, dpr):
+        """模糊圆角矩形生成阴影图"""
+        corner = ShadowRenderer._corner_size(radius, blur)
+        size = 2 * corner + 1
+        # 圆角矩形边长为 2 * (圆角半径 + 模糊半径) + 1，中间一行一列不受圆角和另一侧边的模糊影响，
+        # 拉伸后与同样大小的卡片直接模糊得到的阴影一致
+        core = size - 2 * blur
+
+        # 阴影源：与卡片同样圆角的圆角矩形
+        path = QPainterPath()
+        path.addRoundedRect(QRectF(0, 0, core, core), radius, radius)
+        item = QGraphicsPathItem(path)
+        item.setPen(QPen(Qt.PenStyle.NoPen))
+        item.setBrush(Qt.GlobalColor.black)
+
+        # 使用与原来相同的 QGraphicsDropShadowEffect（偏移为0，偏移在绘制时处理），只在生成时执行一次
+        shadow = QGraphicsDropShadowEffect()
+        shadow.setBlurRadius(blur)
+        shadow.setColor(color)
+        shadow.setOffset(0, 0)
+        item.setGraphicsEffect(shadow)
+        scene = QGraphicsScene()
+        scene.addItem(item)
+
+        image = QImage(round(size * dpr), round(size * dpr), QImage.Format_ARGB32_Premultiplied)
+        image.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(image)
+        scene.render(painter, QRectF(image.rect()), QRectF(-blur, -blur, size, size))
+
+        # 去掉阴影源本身，只保留阴影（内部会被卡片背景覆盖）
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setCompositionMode(QPainter.CompositionMode_Clear)
+        painter.scale(dpr, dpr)
+        painter.translate(blur, blur)
+        painter.fillPath(path, Qt.GlobalColor.black)
+        painter.end()
+        scene.clear()
+
+        pixmap = QPixmap.fromImage(image)
+        pixmap.setDevicePixelRatio(dpr)
+        return pixmap
+
+    @classmethod
+    def paint(cls, painter, rect, radius, blur, color, dpr=1.0):
+        """
+        在指定区域绘制阴影
+
+        Args:
+            painter (QPainter): 画笔
+            rect (QRectF): 投下阴影的圆角矩形区域（已包含偏移），阴影向外扩展模糊半径
+            radius (int): 圆角半径
+            blur (int): 模糊半径
+            color (QColor): 阴影颜色
+            dpr (float): 设备像素比
+        """
+        pixmap = cls.get_pixmap(radius, blur, color, dpr)
+        corner = cls._corner_size(radius, blur)
+        target = QRectF(rect).adjusted(-blur, -blur, blur, blur)
+
+        # 区域小于两个角时直接缩放整张阴影图
+        if target.width() < 2 * corner or target.height() < 2 * corner:
+            painter.drawPixmap(target, pixmap, QRectF(pixmap.rect()))
+            return
+
+        # 源矩形以设备像素为单位
+        s_corner = corner * dpr
+        s_size = pixmap.width()
+        s_mid = s_size - 2 * s_corner
+
+        left, top = target.left(), target.top()
+        right, bottom = target.right() - corner, target.bottom() - corner
+        mid_w, mid_h = target.width() - 2 * corner, target.height() - 2 * corner
+
+        s_far = s_size - s_corner
+        for dest, source in (
+            # 四个角
+            (QRectF(left, top, corner, corner), QRectF(0, 0, s_corner, s_corner)),
+            (QRectF(right, top, corner, corner), QRectF(s_far, 0, s_corner, s_corner)),
+            (QRectF(left, bottom, corner, corner), QRectF(0, s_far, s_corner, s_corner)),
+            (QRectF(right, bottom, corner, corner), QRectF(s_far, s_far, s_corner, s_corner)),
+            # 四条边
+            (QRectF(left + corner, top, mid_w, corner), QRectF(s_corner, 0, s_mid, s_corner)),
+            (QRectF(left + corner, bottom, mid_w, corner), QRectF(s_corner, s_far, s_mid, s_corner)),
+            (QRectF(left, top + corner, corner, mid_h), QRectF(0, s_corner, s_corner, s_mid)),
+            (QRectF(right, top + corner, corner, mid_h), QRectF(s_far, s_corner, s_corner, s_mid)),
+            # 中心
+            (QRectF(left + corner, top + corner, mid_w, mid_h), QRectF(s_corner, s_corner, s_mid, s_mid)),
+        ):
+            painter.drawPixmap(dest, pixmap, source)
+
+    @classmethod
+    def clear_cache(cls):
+        """清空阴影图缓存"""
+        cls._cache.clear()
@@ -8,7 +8,9 @@ import sys
 import subprocess
 from PyQt5.QtWidgets import QApplication, QSystemTrayIcon
 from PyQt5.QtCore import QTimer
-from utils import logger
+from utils import logger, get_logger
+
+log = get_logger(__name__)
 
 
 class EventHandler:
@@ -48,14 +50,14 @@ class EventHandler:
                     os.startfile(self.config_manager.config_dir)
                 else:
                     subprocess.Popen(["xdg-open", self.config_manager.config_dir])
-                logger.debug(f"已打开配置目录: {self.config_manager.config_dir}")
+                log.debug("已打开配置目录: {}", self.config_manager.config_dir)
             else:
                 os.makedirs(self.config_manager.config_dir, exist_ok=True)
                 if sys.platform == "win32":
                     os.startfile(self.config_manager.config_dir)
                 else:
                     subprocess.Popen(["xdg-open", self.config_manager.config_dir])
-                logger.debug(f"已创建并打开配置目录: {self.config_manager.config_dir}")
+                log.debug("已创建并打开配置目录: {}", self.config_manager.config_dir)
         except Exception as e:
             logger.error(f"打开配置目录失败: {str(e)}")
             if hasattr(self.main_window, "dialog_manager"):
@@ -65,7 +67,7 @@ class EventHandler:
         """从自定义标题栏最小化状态恢复窗口"""
         if hasattr(self.main_window, "custom_titlebar") and self.main_window.custom_titlebar:
             self.main_window.custom_titlebar.safe_restore_window()
-            logger.debug("使用safe_restore_window()方法恢复窗口")
+            log.debug("使用safe_restore_window()方法恢复窗口")
         else:
             # 否则使用简单恢复
             self.main_window.setWindowOpacity(1.0)
@@ -73,7 +75,27 @@ class EventHandler:
             self.main_window.showNormal()
             self.main_window.activateWindow()
             self.main_window.is_custom_minimized = False
-            logger.debug("主窗口已恢复")
+            log.debug("主窗口已恢复")
+
+    def handle_instance_message(self, argv):
+        """
+        处理重复启动时转发过来的命令行参数
+
+        Args:
+            argv (list): 重复启动时的命令行参数（不含程序名）
+        """
+        # 带 --minimized 的启动（如开机自启）不打扰正在运行的实例
+        if "--minimized" in argv:
+            log.debug("重复启动带有 --minimized 参数，保持当前窗口状态")
+            return
+
+        if self.main_window.is_custom_minimized or self.main_window.isHidden() or self.main_window.isMinimized():
+            self.restore_from_custom_minimize()
+        else:
+            self.main_window.showNormal()
+            self.main_window.raise_()
+            self.main_window.activateWindow()
+        log.debug("重复启动，已显示正在运行的实例的主窗口")
 
     def confirm_exit(self):
         """确认退出程序"""
@@ -14,8 +14,8 @@ from PyQt5.QtWidgets import (
 from PyQt5.QtCore import Qt
 from PyQt5.QtGui import QIcon
 
-from utils import logger
-from ui.styles import StyleApplier
+from utils import get_logger, startup_profiler
+from ui.styles import StyleApplier, theme_manager
 
 from ui.managers import (
     UIManager,
@@ -27,6 +27,8 @@ from ui.managers import (
 )
 from ui.handlers import EventHandler
 
+log = get_logger(__name__)
+
 
 class MainWindow(QWidget):
     """作为各个管理器的协调者"""
@@ -55,27 +57,35 @@ class MainWindow(QWidget):
 
         # 初始化管理器
         self._initialize_managers()
+        startup_profiler.mark("window.managers")
 
         # 设置UI
         self._setup_ui()
+        startup_profiler.mark("window.ui")
 
         # 设置托盘
         self._setup_tray()
+        startup_profiler.mark("window.tray")
 
         # 初始化主题系统
         self._initialize_theme()
+        startup_profiler.mark("window.theme")
 
         # 加载设置
         self._load_settings()
+        startup_profiler.mark("window.settings")
 
         # 连接信号
         self._connect_signals()
+        startup_profiler.mark("window.signals")
 
         # 设置定时器
         self._setup_timer()
+        startup_profiler.mark("window.timer")
 
         # 初始应用组件属性
         self.theme_manager.apply_component_properties()
+        startup_profiler.mark("window.properties")
 
     def _initialize_managers(self):
         """初始化所有管理器"""
@@ -124,15 +134,35 @@ class MainWindow(QWidget):
 
     def _connect_signals(self):
         """连接信号"""
+        # 按需创建的页面创建后再加载其中控件的设置并连接信号
+        self.tabs.pageCreated.connect(self._on_tab_page_created)
+
         # 连接设置相关信号
         self.settings_manager.connect_signals()
 
+        # 订阅配置变更并监视配置文件的外部修改
+        self.settings_manager.connect_config_signals()
+
         # 连接事件处理器信号
         self.event_handler.setup_signals()
 
         # 初始化版本检查器
         self.version_manager.initialize_version_checker()
 
+    def _on_tab_page_created(self, index, page):
+        """
+        选项卡页面创建完成
+
+        下面的方法只处理已存在的控件，初始化时通用设置页面尚未创建，
+        因此在页面创建后再调用一次，同步设置、连接信号并应用按钮样式
+        """
+        if page is getattr(self, "settings_page", None):
+            self.settings_manager.load_settings()
+            self.settings_manager.connect_signals()
+            self.event_handler.setup_signals()
+            self.version_manager.refresh_version_label()
+            self.theme_manager.apply_component_properties()
+
     def _setup_timer(self):
         """设置定时器"""
         self.event_handler.setup_timer()
@@ -163,16 +193,23 @@ def create_gui(config_manager, icon_path=None, start_minimized=False):
     app = QApplication.instance()
     if app is None:
         app = QApplication(sys.argv)
+    startup_profiler.mark("qapplication")
+
+    # 先切换到配置中的主题，只生成（或从缓存读取）实际使用的主题的样式表
+    theme_manager.set_cache_dir(config_manager.config_dir / ".stylesheet_cache")
+    theme_manager.set_theme(config_manager.theme)
 
     # 应用Ant Design全局主题样式
     StyleApplier.apply_ant_design_theme(app)
+    startup_profiler.mark("stylesheet")
 
     window = MainWindow(config_manager, icon_path, start_minimized)
 
     # 如果设置了最小化启动，则不显示主窗口
     if not start_minimized:
         window.show()
+        startup_profiler.mark("window.show")
     else:
-        logger.debug("程序以最小化模式启动，隐藏主窗口")
+        log.debug("程序以最小化模式启动，隐藏主窗口")
 
     return app, window
@@ -1,20 +1,47 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
-"""UI管理器模块"""
+"""
+UI管理器模块
 
-from .ui_manager import UIManager
-from .theme_manager import WindowThemeManager
-from .tray_manager import TrayManager
-from .settings_manager import SettingsManager
-from .version_manager import VersionManager
-from .dialog_manager import DialogManager
+各管理器在首次访问时才导入所在的子模块（PEP 562）。
+"""
 
 __all__ = [
     "UIManager",
-    "WindowThemeManager", 
+    "WindowThemeManager",
     "TrayManager",
-    "SettingsManager", 
+    "SettingsManager",
     "VersionManager",
     "DialogManager",
-]
\ No newline at end of file
+]
+
+
+def _import_submodule(name):
+    """导入名称所在的子模块（使用静态 import 语句，Nuitka 打包时才能发现这些模块）"""
+    if name == "UIManager":
+        from . import ui_manager as module
+    elif name == "WindowThemeManager":
+        from . import theme_manager as module
+    elif name == "TrayManager":
+        from . import tray_manager as module
+    elif name == "SettingsManager":
+        from . import settings_manager as module
+    elif name == "VersionManager":
+        from . import version_manager as module
+    else:
+        from . import dialog_manager as module
+    return module
+
+
+def __getattr__(name):
+    if name not in __all__:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(_import_submodule(name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
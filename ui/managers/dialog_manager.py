@@ -5,7 +5,9 @@
 
 import webbrowser
 from PyQt5.QtWidgets import QMessageBox
-from utils import logger
+from utils import get_logger
+
+log = get_logger(__name__)
 
 
 class DialogManager:
@@ -52,7 +54,7 @@ class DialogManager:
         if clicked_button == visit_btn:
             github_url = f"https://github.com/{self.github_repo}"
             webbrowser.open(github_url)
-            logger.debug("用户通过关于对话框访问了项目官网")
+            log.debug("用户通过关于对话框访问了项目官网")
 
     def show_update_error_dialog(self, title, message, extra_data):
         """显示更新错误对话框"""
@@ -5,6 +5,7 @@
 
 from PyQt5.QtWidgets import QMessageBox
 from utils import logger, enable_auto_start, disable_auto_start
+from config.config_watcher import ConfigFileWatcher
 
 
 class SettingsManager:
@@ -13,6 +14,7 @@ class SettingsManager:
     def __init__(self, main_window):
         self.main_window = main_window
         self.config_manager = main_window.config_manager
+        self.config_watcher = None
 
     def load_settings(self):
         """加载设置到界面"""
@@ -61,6 +63,79 @@ class SettingsManager:
         if hasattr(self.main_window, "close_behavior_combo"):
             self.main_window.close_behavior_combo.currentIndexChanged.connect(self.on_close_behavior_changed)
 
+    def connect_config_signals(self):
+        """订阅配置项变更并监视配置文件的外部修改，只刷新受影响的控件"""
+        handlers = {
+            "show_notifications": self._on_show_notifications_changed,
+            "auto_start": self._on_auto_start_changed,
+            "check_update_on_start": self._on_check_update_on_start_changed,
+            "debug_mode": self._on_debug_mode_changed,
+            "close_to_tray": self._on_close_to_tray_changed,
+            "theme": self._on_theme_changed,
+            "window_width": self._on_window_size_changed,
+            "window_height": self._on_window_size_changed,
+        }
+        for attr_name, handler in handlers.items():
+            self.config_manager.subscribe(attr_name, handler)
+
+        self.config_watcher = ConfigFileWatcher(self.config_manager, self.main_window)
+
+    @staticmethod
+    def _set_checked_silently(widget, checked):
+        """在不触发信号的情况下设置选中状态"""
+        if widget is None or widget.isChecked() == checked:
+            return
+        widget.blockSignals(True)
+        widget.setChecked(checked)
+        widget.blockSignals(False)
+
+    def _on_show_notifications_changed(self, enabled):
+        """通知开关配置变化"""
+        self._set_checked_silently(getattr(self.main_window, "notify_checkbox", None), enabled)
+        if hasattr(self.main_window, "tray_manager"):
+            self._set_checked_silently(self.main_window.tray_manager.notify_action, enabled)
+
+    def _on_auto_start_changed(self, enabled):
+        """开机自启配置变化"""
+        self._set_checked_silently(getattr(self.main_window, "startup_checkbox", None), enabled)
+        if hasattr(self.main_window, "tray_manager"):
+            self._set_checked_silently(self.main_window.tray_manager.startup_action, enabled)
+
+    def _on_check_update_on_start_changed(self, enabled):
+        """启动时检查更新配置变化"""
+        self._set_checked_silently(getattr(self.main_window, "check_update_on_start_checkbox", None), enabled)
+
+    def _on_debug_mode_changed(self, enabled):
+        """调试模式配置变化：同步复选框并切换日志级别（不重建日志输出器）"""
+        self._set_checked_silently(getattr(self.main_window, "debug_checkbox", None), enabled)
+
+        from utils.logger import log_controller
+
+        log_controller.set_debug_mode(enabled)
+
+    def _on_close_to_tray_changed(self, close_to_tray):
+        """关闭行为配置变化"""
+        if not hasattr(self.main_window, "close_behavior_combo"):
+            return
+
+        combo = self.main_window.close_behavior_combo
+        index = combo.findData(close_to_tray)
+        if index >= 0 and index != combo.currentIndex():
+            combo.blockSignals(True)
+            combo.setCurrentIndex(index)
+            combo.blockSignals(False)
+
+    def _on_theme_changed(self, theme):
+        """主题配置变化"""
+        if hasattr(self.main_window, "theme_manager"):
+            self.main_window.theme_manager.switch_theme(theme)
+
+    def _on_window_size_changed(self, _value):
+        """窗口尺寸配置变化"""
+        width, height = self.config_manager.get_window_size()
+        if (self.main_window.width(), self.main_window.height()) != (width, height):
+            self.main_window.resize(width, height)
+
     def toggle_notifications(self):
         """切换通知开关"""
         self._toggle_notifications(from_tray=False)
@@ -137,20 +212,10 @@ class SettingsManager:
         new_debug_mode = self.main_window.debug_checkbox.isChecked()
         self.config_manager.debug_mode = new_debug_mode
 
-        # 保存配置
+        # 保存配置（日志系统由调试模式的配置变更通知统一重新配置）
         if not self.config_manager.save_config():
             logger.warning(f"调试模式已更改但保存失败: {'开启' if new_debug_mode else '关闭'}")
 
-        # 重新初始化日志系统
-        from utils.logger import setup_logger
-
-        setup_logger(
-            log_dir=self.config_manager.log_dir,
-            log_retention_days=self.config_manager.log_retention_days,
-            log_rotation=self.config_manager.log_rotation,
-            debug_mode=new_debug_mode,
-        )
-
     def on_close_behavior_changed(self):
         """关闭行为选项变化时的处理"""
         if not hasattr(self.main_window, "close_behavior_combo"):
@@ -3,9 +3,13 @@
 
 """窗口主题管理器"""
 
+import time
+
 from PyQt5.QtCore import pyqtSlot
 from ui.styles import StyleHelper, theme_manager
-from utils import logger
+from utils import logger, get_logger
+
+log = get_logger(__name__)
 
 
 class WindowThemeManager:
@@ -39,16 +43,16 @@ class WindowThemeManager:
             # 保存主题设置到配置文件
             self.config_manager.theme = theme
             if self.config_manager.save_config():
-                logger.debug(f"主题设置已保存到配置文件: {theme}")
+                log.debug("主题设置已保存到配置文件: {}", theme)
             else:
                 logger.warning(f"主题设置保存失败: {theme}")
 
-            # 使用指定主题
-            theme_manager.set_theme(theme)
-            logger.debug(f"主题已设置为: {theme}")
-
-            # 应用组件属性
-            self.apply_component_properties()
+            # 在主题切换事务中使用指定主题：暂停主窗口绘制，各组件的样式刷新合并为一次，
+            # 组件属性由 theme_changed 信号触发 apply_component_properties 应用
+            start = time.perf_counter()
+            with theme_manager.switch_transaction(self.main_window):
+                theme_manager.set_theme(theme)
+            log.debug("主题已设置为: {}，耗时 {:.1f} ms", theme, (time.perf_counter() - start) * 1000)
 
     def apply_component_properties(self):
         """应用组件属性"""
@@ -62,7 +66,7 @@ class WindowThemeManager:
             # 设置标签类型属性
             self.setup_label_properties()
 
-            # 重新绘制窗口以应用新主题
+            # 重新绘制窗口以应用新主题（在主题切换事务中由事务结束时统一重绘）
             self.main_window.update()
 
         except Exception as e:
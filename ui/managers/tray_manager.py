@@ -7,7 +7,9 @@ import os
 from PyQt5.QtWidgets import QSystemTrayIcon, QMenu, QApplication,QAction
 from PyQt5.QtGui import QIcon
 from PyQt5.QtCore import pyqtSlot
-from utils import logger, send_notification
+from utils import get_logger, send_notification, log_controller
+
+log = get_logger(__name__)
 
 
 class TrayManager:
@@ -83,6 +85,11 @@ class TrayManager:
         config_dir_action.triggered.connect(self._on_open_config_dir)
         tray_menu.addAction(config_dir_action)
 
+        # 导出诊断日志动作
+        dump_logs_action = QAction("导出诊断日志", self.main_window)
+        dump_logs_action.triggered.connect(self._on_dump_diagnostic_logs)
+        tray_menu.addAction(dump_logs_action)
+
         # 检查更新动作
         check_update_action = QAction("检查更新", self.main_window)
         check_update_action.triggered.connect(self._on_check_update)
@@ -122,15 +129,15 @@ class TrayManager:
             else:
                 self.main_window.showNormal()
                 self.main_window.activateWindow()
-            logger.debug("从托盘菜单显示主窗口")
+            log.debug("从托盘菜单显示主窗口")
         else:
             # 如果窗口已显示，则最小化到托盘
             if hasattr(self.main_window, "custom_titlebar") and self.main_window.custom_titlebar:
                 self.main_window.custom_titlebar.minimize_to_tray()
-                logger.debug("从托盘菜单隐藏主窗口到托盘")
+                log.debug("从托盘菜单隐藏主窗口到托盘")
             else:
                 self.main_window.hide()
-                logger.debug("从托盘菜单隐藏主窗口")
+                log.debug("从托盘菜单隐藏主窗口")
 
         self.update_tray_menu_text()
 
@@ -169,7 +176,7 @@ class TrayManager:
                 if reason == QSystemTrayIcon.ActivationReason.DoubleClick:
                     self.toggle_main_window()
         except Exception as e:
-            logger.debug(f"托盘图标激活事件处理失败: {e}")
+            log.debug("托盘图标激活事件处理失败: {}", e)
 
     def show_tray_message(self, title, message, icon=QSystemTrayIcon.MessageIcon.Information, timeout=3000):
         """显示托盘通知消息"""
@@ -202,6 +209,16 @@ class TrayManager:
         if hasattr(self.main_window, "event_handler"):
             self.main_window.event_handler.open_config_dir()
 
+    def _on_dump_diagnostic_logs(self):
+        """导出内存中最近的调试日志的回调"""
+        path = log_controller.dump_ring_buffer("snapshot")
+        if path is None:
+            self.show_tray_message(
+                "导出诊断日志", "未启用诊断日志缓冲或写入失败", QSystemTrayIcon.MessageIcon.Warning
+            )
+        else:
+            self.show_tray_message("导出诊断日志", f"已保存到: {path}")
+
     def _on_check_update(self):
         """检查更新的回调"""
         if hasattr(self.main_window, "version_manager"):
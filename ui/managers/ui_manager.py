@@ -116,7 +116,12 @@ class UIManager:
             self.main_window._original_resize_event(self.main_window, event)
 
     def create_all_tabs(self):
-        """创建所有选项卡"""
+        """
+        创建所有选项卡
+
+        导航按钮立即创建，页面内容在首次切换到该选项卡或窗口显示后的空闲时间才创建，
+        最小化启动时不会创建任何页面
+        """
         # 创建猫咪设置选项卡
         self.create_cat_settings_tab()
 
@@ -126,8 +131,15 @@ class UIManager:
         # 创建模型管理选项卡
         self.create_model_management_tab()
 
+        # 创建日志查看选项卡
+        self.create_log_viewer_tab()
+
     def create_cat_settings_tab(self):
         """创建猫咪设置选项卡"""
+        self.main_window.tabs.addTab(self._build_cat_settings_page, "猫咪设置", "🐱")
+
+    def _build_cat_settings_page(self):
+        """创建猫咪设置页面"""
         cat_tab = QWidget()
         cat_layout = QVBoxLayout(cat_tab)
 
@@ -158,11 +170,14 @@ class UIManager:
 
         cat_layout.addStretch()
 
-        # 添加选项卡
-        self.main_window.tabs.addTab(cat_tab, "猫咪设置", "🐱")
+        return cat_tab
 
     def create_general_settings_tab(self):
         """创建通用设置选项卡"""
+        self.main_window.tabs.addTab(self._build_general_settings_page, "通用设置", "⚙️")
+
+    def _build_general_settings_page(self):
+        """创建通用设置页面（创建后由主窗口加载设置并连接控件信号）"""
         settings_tab = QWidget()
         settings_layout = QVBoxLayout(settings_tab)
 
@@ -182,11 +197,15 @@ class UIManager:
         # 添加空白占位
         settings_layout.addStretch()
 
-        # 添加选项卡
-        self.main_window.tabs.addTab(settings_tab, "通用设置", "⚙️")
+        self.main_window.settings_page = settings_tab
+        return settings_tab
 
     def create_model_management_tab(self):
         """创建模型管理选项卡"""
+        self.main_window.tabs.addTab(self._build_model_management_page, "模型管理", "🔧")
+
+    def _build_model_management_page(self):
+        """创建模型管理页面"""
         model_tab = QWidget()
         model_layout = QVBoxLayout(model_tab)
 
@@ -260,8 +279,32 @@ class UIManager:
 
         model_layout.addStretch()
 
-        # 添加选项卡
-        self.main_window.tabs.addTab(model_tab, "模型管理", "🔧")
+        return model_tab
+
+    def create_log_viewer_tab(self):
+        """创建日志查看选项卡"""
+        self.main_window.tabs.addTab(self._build_log_viewer_page, "日志查看", "📜")
+
+    def _build_log_viewer_page(self):
+        """创建日志查看页面"""
+        log_tab = QWidget()
+        log_layout = QVBoxLayout(log_tab)
+
+        # 设置布局间距和边距，与其他选项卡保持一致
+        log_layout.setContentsMargins(16, 16, 16, 16)
+        log_layout.setSpacing(12)
+
+        # 标题 - 使用TitleHelper创建
+        title_label = TitleHelper.create_section_title("📜 日志查看")
+        log_layout.addWidget(title_label)
+
+        # 日志查看器在选项卡首次显示时才开始读取日志
+        from ui.components.log_viewer import LogViewer
+
+        self.main_window.log_viewer = LogViewer(self.config_manager.log_dir, self.config_manager.log_structured)
+        log_layout.addWidget(self.main_window.log_viewer, 1)
+
+        return log_tab
 
     def _create_notification_group(self, parent_layout):
         """创建通知设置组"""
@@ -8,7 +8,9 @@ import os
 from PyQt5.QtCore import pyqtSlot, Qt
 from PyQt5.QtWidgets import QSystemTrayIcon
 from ui.styles import StyleHelper
-from utils import logger, get_version_checker, create_update_message
+from utils import logger, get_logger, get_version_checker, create_update_message
+
+log = get_logger(__name__)
 
 
 class VersionManager:
@@ -23,6 +25,9 @@ class VersionManager:
         # 版本检查器
         self.version_checker = get_version_checker(self.config_manager)
         self.download_url = None
+
+        # 最近一次检查的结果 (有更新, 当前版本, 最新版本)，用于版本标签创建后补上显示
+        self._version_state = None
         
     def initialize_version_checker(self):
         """初始化版本检查器"""
@@ -63,11 +68,12 @@ class VersionManager:
                 self.download_url = self.github_releases_url
                 
         # 更新版本显示标签
+        self._version_state = (has_update, current_ver, latest_ver)
         self._update_version_label(has_update, current_ver, latest_ver)
         
         # 如果是静默模式，只更新界面不显示弹窗
         if silent_mode:
-            logger.debug(f"静默检查更新中，有更新: {has_update}")
+            log.debug("静默检查更新中，有更新: {}", has_update)
             # 如果有更新，在托盘图标中显示简短提示
             if has_update and self.config_manager.show_notifications:
                 if hasattr(self.main_window, 'tray_manager') and self.main_window.tray_manager.tray_icon:
@@ -82,6 +88,11 @@ class VersionManager:
         # 显示更新对话框
         self._show_update_dialog(has_update, current_ver, latest_ver, update_info_str, error_msg)
         
+    def refresh_version_label(self):
+        """按最近一次检查的结果刷新版本标签（设置页面按需创建，检查可能先于标签完成）"""
+        if self._version_state is not None:
+            self._update_version_label(*self._version_state)
+
     def _update_version_label(self, has_update, current_ver, latest_ver):
         """更新版本显示标签"""
         if not hasattr(self.main_window, 'version_label'):
@@ -138,11 +149,11 @@ class VersionManager:
                     os.startfile(final_url)
                 else:
                     webbrowser.open(final_url)
-                logger.debug(f"用户直接下载新版本: {final_url}")
+                log.debug("用户直接下载新版本: {}", final_url)
             else:
                 # 如果不是直接下载链接，打开网页
                 webbrowser.open(final_url)
-                logger.debug(f"用户访问下载页面: {final_url}")
+                log.debug("用户访问下载页面: {}", final_url)
                 
             return True
         except Exception as e:
@@ -5,8 +5,16 @@
 Ant Design风格UI样式定义
 """
 
+import hashlib
+import os
+import sys
+from contextlib import contextmanager
+from pathlib import Path
+
 from PyQt5.QtCore import QObject, pyqtSignal
-from utils.logger import logger
+from utils.logger import logger, get_logger
+
+log = get_logger(__name__)
 
 
 class AntColors:
@@ -149,20 +157,123 @@ class ThemeManager(QObject):
     # 主题切换信号
     theme_changed = pyqtSignal(str)  # 发送新主题名称
 
+    # 样式表缓存文件的扩展名
+    CACHE_SUFFIX = ".qss"
+
     def __init__(self):
         super().__init__()
         self._current_theme = "light"
-        self._light_stylesheet = None
-        self._dark_stylesheet = None
-        self._generate_stylesheets()
 
-    def _generate_stylesheets(self):
-        """预生成浅色和深色两套完整样式表"""
-        # 生成浅色主题样式表
-        self._light_stylesheet = self._build_complete_stylesheet(AntColors)
+        # 已生成的样式表 {主题: 样式表}，首次获取某个主题时才生成（或从磁盘缓存读取）
+        self._stylesheets = {}
+
+        # 样式表磁盘缓存目录，未设置时不使用磁盘缓存
+        self._cache_dir = None
+        self._template_fingerprint = None
+        self._prebuild_scheduled = False
+
+        # 应用全局样式表的 QApplication（见 StyleApplier）
+        self._app = None
+
+        # 主题切换事务：嵌套深度，以及事务期间推迟的控件样式刷新 {id(控件): 控件}
+        self._transaction_depth = 0
+        self._pending_repolish = {}
+        self._global_pass_pending = False
+
+    def set_cache_dir(self, cache_dir):
+        """
+        设置样式表磁盘缓存目录
 
-        # 生成深色主题样式表
-        self._dark_stylesheet = self._build_complete_stylesheet(AntColorsDark)
+        Args:
+            cache_dir (str | Path | None): 缓存目录，为 None 时不使用磁盘缓存
+        """
+        self._cache_dir = Path(cache_dir) if cache_dir else None
+
+    @staticmethod
+    def _get_colors(theme):
+        """获取主题对应的颜色表"""
+        return AntColorsDark if theme == "dark" else AntColors
+
+    def _get_template_fingerprint(self):
+        """
+        样式表模板的指纹
+
+        使用本模块源文件的大小和修改时间（比读取源代码快得多）；打包后没有源文件时使用可执行文件的，
+        升级程序后可执行文件随之改变，缓存自然失效
+        """
+        if self._template_fingerprint is None:
+            self._template_fingerprint = ""
+            for path in (__file__, sys.executable):
+                try:
+                    stat_result = os.stat(path)
+                except OSError:
+                    continue
+                self._template_fingerprint = f"{os.path.abspath(path)}:{stat_result.st_size}:{stat_result.st_mtime_ns}"
+                break
+        return self._template_fingerprint
+
+    def _get_cache_key(self, colors):
+        """根据颜色表和模板计算缓存键"""
+        digest = hashlib.sha256()
+        for name, value in sorted(vars(colors).items()):
+            if name.isupper():
+                digest.update(f"{name}={value}\n".encode("utf-8"))
+        digest.update(self._get_template_fingerprint().encode("utf-8"))
+        return digest.hexdigest()[:16]
+
+    def _load_stylesheet(self, theme):
+        """
+        获取主题的样式表：优先读取磁盘缓存，缓存不存在或已失效时生成并写入缓存
+
+        Args:
+            theme (str): 主题名称
+
+        Returns:
+            str: 样式表
+        """
+        colors = self._get_colors(theme)
+        if self._cache_dir is None:
+            return self._build_complete_stylesheet(colors)
+
+        cache_file = self._cache_dir / f"{theme}-{self._get_cache_key(colors)}{self.CACHE_SUFFIX}"
+        try:
+            stylesheet = cache_file.read_text(encoding="utf-8")
+            log.debug("已从缓存读取{}主题样式表: {}", theme, cache_file.name)
+            return stylesheet
+        except OSError:
+            pass
+
+        stylesheet = self._build_complete_stylesheet(colors)
+        self._write_cache(theme, cache_file, stylesheet)
+        return stylesheet
+
+    def _write_cache(self, theme, cache_file, stylesheet):
+        """写入样式表缓存（先写临时文件再替换），并删除该主题的旧缓存"""
+        try:
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
+            temp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+            temp_file.write_text(stylesheet, encoding="utf-8")
+            os.replace(temp_file, cache_file)
+
+            for old_file in self._cache_dir.glob(f"{theme}-*{self.CACHE_SUFFIX}"):
+                if old_file != cache_file:
+                    old_file.unlink()
+            log.debug("已生成并缓存{}主题样式表: {}", theme, cache_file.name)
+        except OSError as e:
+            logger.warning(f"写入样式表缓存失败: {str(e)}")
+
+    def _schedule_prebuild(self):
+        """在启动完成后的空闲时间准备其余主题的样式表，切换主题时无需再生成"""
+        if self._prebuild_scheduled:
+            return
+        self._prebuild_scheduled = True
+
+        from utils.idle_tasks import get_startup_scheduler, PRIORITY_LOW
+
+        scheduler = get_startup_scheduler()
+        for theme in ("light", "dark"):
+            if theme not in self._stylesheets:
+                scheduler.schedule(lambda theme=theme: self.get_stylesheet(theme), PRIORITY_LOW, f"stylesheet_{theme}")
 
     def _build_complete_stylesheet(self, colors):
         """构建完整的样式表"""
@@ -889,25 +1000,114 @@ class ThemeManager(QObject):
         }}
         """
 
+    def attach_application(self, app):
+        """
+        应用当前主题的全局样式表，并在之后切换主题时自动更新
+
+        Args:
+            app (QApplication): 应用程序对象
+        """
+        self._app = app
+        app.setStyleSheet(self.get_stylesheet())
+
     def set_theme(self, theme: str):
-        """设置主题并发送信号"""
+        """
+        设置主题并发送信号
+
+        不在主题切换事务中时先更新全局样式表再通知各组件；
+        在事务中时全局样式表推迟到事务结束时统一更新一次
+        """
         if theme != self._current_theme:
             self._current_theme = theme
+            if self._transaction_depth:
+                self._global_pass_pending = True
+            else:
+                self._apply_global_stylesheet()
             self.theme_changed.emit(theme)
 
+    def _apply_global_stylesheet(self):
+        """更新全局样式表（Qt 会重新应用所有控件的样式）"""
+        if self._app is not None:
+            self._app.setStyleSheet(self.get_stylesheet())
+
+    def repolish(self, widget):
+        """
+        重新应用控件样式（修改了影响样式的动态属性后调用）
+
+        在主题切换事务中推迟到事务结束时执行，同一控件只执行一次；
+        事务中更新了全局样式表时所有控件都会被重新应用样式，不再单独执行
+        """
+        if self._transaction_depth:
+            self._pending_repolish[id(widget)] = widget
+            return
+        style = widget.style()
+        style.unpolish(widget)
+        style.polish(widget)
+
+    @contextmanager
+    def switch_transaction(self, window=None):
+        """
+        主题切换事务
+
+        事务期间暂停顶层窗口的绘制，各组件的样式刷新推迟并去重，
+        结束时统一更新一次全局样式表（或执行剩余的样式刷新），最后恢复绘制并重绘一次。
+        可以嵌套，只有最外层事务结束时才会执行上述操作。
+
+        Args:
+            window (QWidget, optional): 需要暂停绘制的顶层窗口
+        """
+        suspend = window is not None and window.updatesEnabled()
+        if suspend:
+            window.setUpdatesEnabled(False)
+        self._transaction_depth += 1
+        try:
+            yield self
+        finally:
+            self._transaction_depth -= 1
+            if not self._transaction_depth:
+                self._finish_transaction()
+            if suspend:
+                window.setUpdatesEnabled(True)
+                window.update()
+
+    def _finish_transaction(self):
+        """执行事务中推迟的全局样式表更新和控件样式刷新"""
+        pending = self._pending_repolish
+        self._pending_repolish = {}
+
+        if self._global_pass_pending and self._app is not None:
+            # 更新全局样式表会重新应用所有控件的样式，推迟的单独刷新已被覆盖
+            self._global_pass_pending = False
+            self._apply_global_stylesheet()
+            return
+        self._global_pass_pending = False
+
+        for widget in pending.values():
+            try:
+                style = widget.style()
+                style.unpolish(widget)
+                style.polish(widget)
+            except RuntimeError:
+                # 控件已在事务期间被销毁
+                continue
+
     def get_current_theme(self) -> str:
         """获取当前主题"""
         return self._current_theme
 
     def get_stylesheet(self, theme: str = None) -> str:
-        """获取指定主题的样式表"""
+        """获取指定主题的样式表（首次获取时生成或从磁盘缓存读取）"""
         if theme is None:
             theme = self._current_theme
+        if theme != "dark":
+            theme = "light"
 
-        if theme == "dark":
-            return self._dark_stylesheet
-        else:
-            return self._light_stylesheet
+        stylesheet = self._stylesheets.get(theme)
+        if stylesheet is None:
+            stylesheet = self._load_stylesheet(theme)
+            self._stylesheets[theme] = stylesheet
+            self._schedule_prebuild()
+        return stylesheet
 
     def is_dark_theme(self, theme: str = None) -> bool:
         """判断是否为深色主题"""
@@ -923,6 +1123,20 @@ theme_manager = ThemeManager()
 class StyleHelper:
     """样式辅助类"""
 
+    @staticmethod
+    def set_style_property(widget, name: str, value):
+        """设置影响样式的动态属性，值未变化时不重新应用样式
+
+        Args:
+            widget: QWidget实例
+            name: 属性名称
+            value: 属性值
+        """
+        if widget.property(name) == value:
+            return
+        widget.setProperty(name, value)
+        theme_manager.repolish(widget)
+
     @staticmethod
     def set_frameless_window_properties(window):
         """设置无边框窗口属性
@@ -931,12 +1145,8 @@ class StyleHelper:
             window: QWidget实例
         """
         try:
-            # 设置主窗口属性
-            window.setProperty("windowType", "frameless")
-
-            # 刷新样式
-            window.style().unpolish(window)
-            window.style().polish(window)
+            # 设置主窗口属性并刷新样式
+            StyleHelper.set_style_property(window, "windowType", "frameless")
         except Exception as e:
             logger.error(f"设置无边框窗口属性失败: {e}")
 
@@ -948,9 +1158,7 @@ class StyleHelper:
             button: QPushButton实例
             button_type: 按钮类型 ('primary', 'success', 'warning', 'danger', 'default')
         """
-        button.setProperty("buttonType", button_type)
-        button.style().unpolish(button)
-        button.style().polish(button)
+        StyleHelper.set_style_property(button, "buttonType", button_type)
 
     @staticmethod
     def set_label_type(label, label_type: str):
@@ -960,9 +1168,7 @@ class StyleHelper:
             label: QLabel实例
             label_type: 标签类型 ('info', 'success', 'warning', 'error', 'secondary', 'small')
         """
-        label.setProperty("labelType", label_type)
-        label.style().unpolish(label)
-        label.style().polish(label)
+        StyleHelper.set_style_property(label, "labelType", label_type)
 
     @staticmethod
     def set_progress_type(progressbar, progress_type: str):
@@ -972,9 +1178,7 @@ class StyleHelper:
             progressbar: QProgressBar实例
             progress_type: 进度条类型 ('memory-low', 'memory-medium', 'memory-high')
         """
-        progressbar.setProperty("progressType", progress_type)
-        progressbar.style().unpolish(progressbar)
-        progressbar.style().polish(progressbar)
+        StyleHelper.set_style_property(progressbar, "progressType", progress_type)
 
     @staticmethod
     def set_checkbox_style(checkbox, check_style: str = "default"):
@@ -987,12 +1191,7 @@ class StyleHelper:
                 - unicode: 使用Unicode字符 ✓
                 - simple: 使用CSS绘制简单勾选标记
         """
-        if check_style != "default":
-            checkbox.setProperty("checkStyle", check_style)
-        else:
-            checkbox.setProperty("checkStyle", None)
-        checkbox.style().unpolish(checkbox)
-        checkbox.style().polish(checkbox)
+        StyleHelper.set_style_property(checkbox, "checkStyle", check_style if check_style != "default" else None)
 
 
 class StatusHTMLGenerator:
@@ -1184,11 +1383,8 @@ class StyleApplier:
     @staticmethod
     def apply_ant_design_theme(app):
         """应用Ant Design主题到整个应用"""
-        stylesheet = theme_manager.get_stylesheet()
-        app.setStyleSheet(stylesheet)
-
-        # 连接主题变化信号
-        theme_manager.theme_changed.connect(lambda theme: app.setStyleSheet(theme_manager.get_stylesheet(theme)))
+        # 切换主题时由主题管理器更新全局样式表（在主题切换事务中只更新一次）
+        theme_manager.attach_application(app)
 
 
 class TitleHelper:
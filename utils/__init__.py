@@ -1,12 +1,63 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
-"""工具类模块"""
+"""
+工具类模块
 
-from utils.system_utils import run_as_admin, check_single_instance, enable_auto_start, disable_auto_start
-from utils.logger import logger, setup_logger
-from utils.notification import send_notification, create_notification_thread, find_icon_path
-from utils.version_checker import get_version_checker, get_app_version, create_update_message, check_for_update
+日志和启动计时相关的名称在导入包时直接加载（启动时最先用到，且子模块与其中的对象同名，
+不能交给按需加载）；其余名称通过模块级 __getattr__（PEP 562）在首次访问时才导入所在的子模块，
+避免在主窗口显示前加载 winrt、windows_toasts、requests 等较重的依赖。
+"""
+
+from utils.logger import logger, setup_logger, log_controller, get_logger
+from utils.startup_profiler import startup_profiler
+
+# 按需加载的名称 -> 所在的子模块
+_LAZY_ATTRS = {
+    "run_as_admin": "system_utils",
+    "check_single_instance": "system_utils",
+    "enable_auto_start": "system_utils",
+    "disable_auto_start": "system_utils",
+    "send_notification": "notification",
+    "create_notification_thread": "notification",
+    "find_icon_path": "notification",
+    "get_version_checker": "version_checker",
+    "get_app_version": "version_checker",
+    "create_update_message": "version_checker",
+    "check_for_update": "version_checker",
+    "get_startup_scheduler": "idle_tasks",
+    "PRIORITY_HIGH": "idle_tasks",
+    "PRIORITY_NORMAL": "idle_tasks",
+    "PRIORITY_LOW": "idle_tasks",
+}
+
+
+def _import_submodule(module_name):
+    """导入子模块（使用静态 import 语句而不是 importlib，Nuitka 打包时才能发现这些模块）"""
+    if module_name == "system_utils":
+        from . import system_utils as module
+    elif module_name == "notification":
+        from . import notification as module
+    elif module_name == "idle_tasks":
+        from . import idle_tasks as module
+    else:
+        from . import version_checker as module
+    return module
+
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(_import_submodule(module_name), name)
+    # 缓存到模块命名空间，之后的访问不再经过 __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
 
 
 __all__ = [
@@ -16,6 +67,9 @@ __all__ = [
     "disable_auto_start",
     "logger",
     "setup_logger",
+    "log_controller",
+    "get_logger",
+    "startup_profiler",
     "send_notification",
     "create_notification_thread",
     "find_icon_path",
@@ -23,4 +77,8 @@ __all__ = [
     "get_app_version",
     "create_update_message",
     "check_for_update",
+    "get_startup_scheduler",
+    "PRIORITY_HIGH",
+    "PRIORITY_NORMAL",
+    "PRIORITY_LOW",
 ]
@@ -4,8 +4,7 @@ import subprocess
 import shutil
 import argparse
 import re
-from utils import get_app_version
-from config import ConfigManager
+from config.app_config import APP_INFO
 
 # 设置标准输出编码为UTF-8，解决Windows环境下中文输出问题
 if sys.stdout.encoding != 'utf-8':
@@ -16,9 +15,6 @@ if sys.stdout.encoding != 'utf-8':
         import io
         sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
 
-# 初始化配置管理器
-config_manager = ConfigManager()
-
 # 获取当前脚本所在目录
 current_dir = os.path.dirname(os.path.abspath(__file__))
 # 获取项目根目录
@@ -44,7 +40,8 @@ print(f"图标资源目录: {assets_icon_dir}")
 icon_files = [f for f in os.listdir(assets_icon_dir) if os.path.isfile(os.path.join(assets_icon_dir, f))]
 print(f"将包含的图标资源文件: {', '.join(icon_files)}")
 
-app_name = config_manager.get_app_name()
+# 打包只需要应用信息，无需创建配置管理器（避免读写用户配置和注册表）
+app_name = APP_INFO["name"]
 print(f"使用应用名称进行打包: {app_name}")
 
 def parse_arguments():
@@ -61,7 +58,7 @@ def parse_arguments():
 # 解析命令行参数
 args = parse_arguments()
 
-current_version = get_app_version(config_manager)
+current_version = APP_INFO["version"]
 print(f"使用版本号进行打包: {current_version}")
 
 # 确保nuitka已安装
@@ -171,5 +168,5 @@ def show_usage():
 # 仅在直接运行脚本时显示使用说明
 if __name__ == "__main__":
     if len(sys.argv) == 1:
-        print(f"\n当前项目版本: {get_app_version(config_manager)}")
+        print(f"\n当前项目版本: {APP_INFO['version']}")
         show_usage()
@@ -0,0 +1,41 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+窗口首次绘制监听
+
+启动计时和空闲任务调度都以主窗口首次绘制完成作为时间点，共用这里的事件过滤器。
+"""
+
+from PyQt5.QtCore import QEvent, QObject, QTimer
+
+
+class FirstPaintFilter(QObject):
+    """窗口第一次收到绘制事件后，在下一次事件循环迭代中调用回调"""
+
+    def __init__(self, callback, parent=None):
+        super().__init__(parent)
+        self._callback = callback
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Paint:
+            obj.removeEventFilter(self)
+            # 绘制事件在过滤器返回后才处理，在下一次事件循环中回调时绘制已经完成
+            QTimer.singleShot(0, self._callback)
+        return False
+
+
+def call_after_first_paint(window, callback):
+    """
+    在窗口首次绘制完成后调用回调
+
+    Args:
+        window (QWidget): 要监听的窗口，同时作为过滤器的父对象
+        callback (callable): 无参数的回调
+
+    Returns:
+        FirstPaintFilter: 已安装的事件过滤器
+    """
+    paint_filter = FirstPaintFilter(callback, window)
+    window.installEventFilter(paint_filter)
+    return paint_filter
@@ -0,0 +1,127 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+启动后的空闲任务调度
+
+启动时不影响主窗口显示的工作（检查更新、启动通知线程、同步开机自启注册表等）先登记到调度器，
+等主窗口首次绘制完成（最小化启动时为托盘图标显示后）再按优先级执行。
+任务在事件循环的各次迭代中分批执行，每批不超过一个时间片，期间的输入事件可以及时得到处理。
+"""
+
+import heapq
+import itertools
+import time
+
+from PyQt5.QtCore import QObject, QTimer
+
+from .first_paint import call_after_first_paint
+from .logger import logger, get_logger
+
+log = get_logger(__name__)
+
+# 任务优先级，数值越小越先执行
+PRIORITY_HIGH = 0
+PRIORITY_NORMAL = 50
+PRIORITY_LOW = 100
+
+# 每次事件循环迭代中执行任务的时间片（秒），至少执行一个任务
+TIME_SLICE = 0.008
+
+
+class StartupScheduler(QObject):
+    """
+    启动后的空闲任务调度器
+
+    release 之前登记的任务只排队不执行；release 之后登记的任务在之后的事件循环迭代中执行。
+    同一优先级的任务按登记顺序执行。
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._tasks = []
+        self._counter = itertools.count()
+        self._released = False
+        self._paint_filter = None
+
+        # 间隔为0的定时器在每次事件循环迭代处理完其他事件后触发
+        self._timer = QTimer(self)
+        self._timer.setInterval(0)
+        self._timer.timeout.connect(self._run_slice)
+
+    def schedule(self, func, priority=PRIORITY_NORMAL, name=None):
+        """
+        登记任务
+
+        Args:
+            func (callable): 无参数的任务函数
+            priority (int): 优先级，数值越小越先执行
+            name (str, optional): 任务名称（用于日志），默认为函数名
+        """
+        name = name or getattr(func, "__name__", repr(func))
+        heapq.heappush(self._tasks, (priority, next(self._counter), name, func))
+        if self._released and not self._timer.isActive():
+            self._timer.start()
+
+    def release(self):
+        """开始执行已登记的任务"""
+        if self._released:
+            return
+        self._released = True
+        log.debug("开始执行启动后的空闲任务，共 {} 个", len(self._tasks))
+        if self._tasks:
+            self._timer.start()
+
+    def release_after_first_paint(self, window, minimized=False):
+        """
+        在主窗口首次绘制完成后开始执行任务
+
+        Args:
+            window (QWidget): 主窗口
+            minimized (bool): 是否以最小化模式启动，此时窗口不会绘制，
+                事件循环开始运行（托盘图标已显示）后即开始执行
+        """
+        if minimized:
+            QTimer.singleShot(0, self.release)
+            return
+
+        self._paint_filter = call_after_first_paint(window, self.release)
+
+    @property
+    def pending_count(self):
+        """尚未执行的任务数"""
+        return len(self._tasks)
+
+    def _run_slice(self):
+        """执行一批任务，用完时间片或任务全部完成后返回事件循环"""
+        deadline = time.perf_counter() + TIME_SLICE
+        while self._tasks:
+            _, _, name, func = heapq.heappop(self._tasks)
+            start = time.perf_counter()
+            try:
+                func()
+            except Exception as e:
+                logger.error(f"启动任务 {name} 执行失败: {str(e)}")
+            finished = time.perf_counter()
+            log.debug("启动任务 {} 完成，耗时 {:.1f} ms", name, (finished - start) * 1000)
+            if finished >= deadline:
+                break
+
+        if not self._tasks:
+            self._timer.stop()
+
+
+_startup_scheduler_instance = None
+
+
+def get_startup_scheduler():
+    """
+    获取启动任务调度器实例（单例模式）
+
+    Returns:
+        StartupScheduler: 启动任务调度器实例
+    """
+    global _startup_scheduler_instance
+    if _startup_scheduler_instance is None:
+        _startup_scheduler_instance = StartupScheduler()
+    return _startup_scheduler_instance
@@ -0,0 +1,243 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+结构化 JSON Lines 日志输出器
+
+每条日志写为一行 JSON，包含时间、级别、模块、函数、行号、消息和附加上下文。
+调用方线程只把日志记录中需要的字段放入内存缓冲区，序列化和写文件由普通后台线程完成：
+缓冲区达到批量大小或距上次写入超过时间窗口时批量写入一次，
+不经过 loguru enqueue 的多进程队列，也不需要对每条记录进行 pickle。
+"""
+
+import json
+import sys
+import threading
+import time
+import traceback
+from pathlib import Path
+
+
+class JsonLinesSink:
+    """
+    批量写入的 JSON Lines 日志输出器
+
+    作为 loguru 的输出器使用（loguru 调用 write 接收日志，移除输出器时调用 stop）：
+
+        sink = JsonLinesSink(log_dir)
+        logger.add(sink, format="{message}")
+
+    日志按日期写入 log_dir 下的 YYYY-MM-DD.jsonl 文件，日期变化时关闭的旧文件交给 on_rotate 处理（如压缩归档）。
+    """
+
+    def __init__(
+        self,
+        log_dir,
+        on_rotate=None,
+        batch_size=512,
+        flush_interval=1.0,
+        max_buffered=65536,
+        encoding="utf-8",
+        name="jsonl-log-writer",
+    ):
+        """
+        初始化输出器
+
+        Args:
+            log_dir (str | Path): 日志文件目录
+            on_rotate (callable, optional): 切换到新日期文件后调用，接收已关闭的旧文件路径
+            batch_size (int): 缓冲的记录数达到该值时立即写入
+            flush_interval (float): 时间窗口（秒），缓冲区中最早的记录最多等待该时长就会被写入
+            max_buffered (int): 缓冲区上限，写入跟不上时调用方会等待后台线程写完一批
+            encoding (str): 文件编码
+            name (str): 后台线程名称
+        """
+        self.log_dir = Path(log_dir)
+        self.on_rotate = on_rotate
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self.max_buffered = max(self.batch_size, max_buffered)
+        self.encoding = encoding
+
+        self._cond = threading.Condition()
+        self._write_lock = threading.Lock()
+        self._buffer = []
+        self._deadline = None
+        self._closed = False
+
+        # 当前打开的文件
+        self._file = None
+        self._file_date = None
+
+        # 统计信息
+        self._record_count = 0
+        self._batch_count = 0
+        self._failed_count = 0
+
+        self.log_dir.mkdir(parents=True, exist_ok=True)
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def write(self, message):
+        """
+        接收一条日志（由 loguru 在调用方线程中调用）
+
+        Args:
+            message: loguru 的消息对象，record 属性中包含日志记录
+        """
+        record = message.record
+        entry = (
+            record["time"],
+            record["level"].name,
+            record["name"],
+            record["function"],
+            record["line"],
+            record["message"],
+            record["extra"],
+            record["exception"],
+        )
+
+        with self._cond:
+            if self._closed:
+                return
+            # 写入跟不上时等待后台线程写完一批，避免缓冲区无限增长
+            while len(self._buffer) >= self.max_buffered and not self._closed:
+                self._cond.wait()
+            self._buffer.append(entry)
+            if self._deadline is None:
+                self._deadline = time.monotonic() + self.flush_interval
+            if len(self._buffer) >= self.batch_size:
+                self._cond.notify_all()
+
+    def _run(self):
+        """后台线程主循环：缓冲区满一批或时间窗口到期时写入"""
+        while True:
+            with self._cond:
+                while not self._closed:
+                    if len(self._buffer) >= self.batch_size:
+                        break
+                    if self._deadline is None:
+                        self._cond.wait()
+                        continue
+                    remaining = self._deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+
+                if self._closed:
+                    return
+
+            self.flush_pending()
+
+    def flush_pending(self):
+        """
+        立即写入缓冲区中的所有日志
+
+        （不命名为 flush：loguru 会在每次 write 之后调用输出器的 flush 方法）
+
+        Returns:
+            int: 写入的记录数
+        """
+        with self._write_lock:
+            with self._cond:
+                entries = self._buffer
+                self._buffer = []
+                self._deadline = None
+                self._cond.notify_all()
+
+            if not entries:
+                return 0
+
+            try:
+                self._write_entries(entries)
+                self._record_count += len(entries)
+                self._batch_count += 1
+            except Exception as e:
+                # 不能通过 logger 报告，否则会再次进入本输出器
+                self._failed_count += len(entries)
+                sys.stderr.write(f"写入结构化日志失败: {e}\n")
+            return len(entries)
+
+    def _write_entries(self, entries):
+        """序列化并写入一批日志，日期变化时切换到新文件"""
+        lines = []
+        for entry in entries:
+            log_date = entry[0].date()
+            if log_date != self._file_date:
+                if lines:
+                    self._file.write("".join(lines))
+                    lines = []
+                self._open_file(log_date)
+            lines.append(self.serialize(entry))
+
+        self._file.write("".join(lines))
+        self._file.flush()
+
+    @staticmethod
+    def serialize(entry):
+        """
+        将一条日志序列化为一行 JSON
+
+        Args:
+            entry (tuple): write 中收集的日志字段
+
+        Returns:
+            str: 以换行结尾的 JSON 文本
+        """
+        log_time, level, module, function, line, message, extra, exception = entry
+        data = {
+            "time": log_time.isoformat(),
+            "level": level,
+            "module": module,
+            "function": function,
+            "line": line,
+            "message": message,
+        }
+        if extra:
+            data["extra"] = extra
+        if exception is not None:
+            data["exception"] = "".join(traceback.format_exception(exception.type, exception.value, exception.traceback))
+        return json.dumps(data, ensure_ascii=False, default=str) + "\n"
+
+    def _open_file(self, log_date):
+        """打开指定日期的日志文件，并把关闭的旧文件交给 on_rotate"""
+        closed_path = None
+        if self._file is not None:
+            self._file.close()
+            closed_path = self._file.name
+        self._file = open(self.log_dir / f"{log_date.isoformat()}.jsonl", "a", encoding=self.encoding)
+        self._file_date = log_date
+        if closed_path is not None and self.on_rotate is not None:
+            self.on_rotate(closed_path)
+
+    def stop(self):
+        """写入剩余日志并停止后台线程（由 loguru 在移除输出器时调用）"""
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._cond.notify_all()
+
+        self._thread.join(timeout=2)
+        self.flush_pending()
+        with self._write_lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+                self._file_date = None
+
+    def get_stats(self):
+        """
+        获取写入统计信息
+
+        Returns:
+            dict: 包含已写入记录数、批次数、失败记录数和缓冲中的记录数
+        """
+        with self._cond:
+            buffered = len(self._buffer)
+        return {
+            "records": self._record_count,
+            "batches": self._batch_count,
+            "failed": self._failed_count,
+            "buffered": buffered,
+        }
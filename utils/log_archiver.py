@@ -0,0 +1,286 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+轮转日志的后台压缩和清理
+
+loguru 自带的 compression 和 retention 在轮转时由写日志的线程同步执行，日志越忙越容易卡顿。
+这里把轮转下来的文件交给低优先级的后台线程：先用 zstd 压缩（未安装 zstandard 时退回 gzip），
+再按保留天数和日志目录总大小上限清理旧文件。
+"""
+
+import gzip
+import os
+import queue
+import re
+import shutil
+import sys
+import threading
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# 未压缩的日志文件和压缩后的归档文件扩展名
+LOG_SUFFIXES = (".log", ".jsonl")
+ARCHIVE_SUFFIXES = (".zst", ".gz", ".zip")
+
+# 文件和结构化输出器写出的按日期命名的日志文件（包括 loguru 轮转时加上时间后缀的文件）及其归档，
+# 如 2024-05-01.log、2024-05-01.2024-05-01_12-00-00_000000.log、2024-05-01.jsonl.zst；
+# 日志目录中的其他文件（如环形缓冲写出的 crash-*.log、snapshot-*.log）不由归档器处理
+SINK_FILE_PATTERN = re.compile(r"\d{4}-\d{2}-\d{2}[^/\\]*?\.(?:log|jsonl)(?:\.(?:zst|gz|zip))?")
+
+# 压缩时每次读取的字节数
+CHUNK_SIZE = 1024 * 1024
+
+
+def _lower_thread_priority():
+    """降低当前线程的调度优先级（仅 Windows 支持按线程设置，其他平台保持不变）"""
+    if sys.platform != "win32":
+        return
+    try:
+        import ctypes
+
+        # THREAD_PRIORITY_LOWEST
+        kernel32 = ctypes.windll.kernel32
+        kernel32.SetThreadPriority(kernel32.GetCurrentThread(), -2)
+    except Exception:
+        pass
+
+
+class LogArchiver:
+    """
+    轮转日志的后台压缩器和清理器
+
+    submit 可直接作为 loguru 文件输出器的 compression 参数：轮转时只把关闭的文件路径放入队列，
+    立即返回，压缩和清理都在后台线程中完成。
+    """
+
+    def __init__(self, log_dir, retention_days=7, max_total_size_mb=0, compression_level=3, name="log-archiver"):
+        """
+        初始化归档器并启动后台线程
+
+        启动后会先压缩上次运行遗留的、今天之前的未压缩日志，再执行一次清理。
+
+        Args:
+            log_dir (str | Path): 日志目录
+            retention_days (int): 日志保留天数，为0时不按时间清理
+            max_total_size_mb (int): 日志目录总大小上限（MB），为0时不限制
+            compression_level (int): zstd 压缩级别（1-22）
+            name (str): 后台线程名称
+        """
+        self.log_dir = Path(log_dir)
+        self.retention_days = retention_days
+        self.max_total_bytes = max(0, max_total_size_mb) * 1024 * 1024
+        self.compression_level = max(1, min(22, compression_level))
+
+        self._queue = queue.Queue()
+        self._stopped = threading.Event()
+
+        # 统计信息
+        self._compressed_count = 0
+        self._removed_count = 0
+        self._failed_count = 0
+
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    @property
+    def archive_suffix(self):
+        """压缩文件的扩展名"""
+        return ".zst" if zstandard is not None else ".gz"
+
+    def submit(self, path):
+        """
+        提交一个已关闭的日志文件进行压缩
+
+        Args:
+            path (str | Path): 日志文件路径
+        """
+        if not self._stopped.is_set():
+            self._queue.put(Path(path))
+
+    def _run(self):
+        """后台线程主循环：压缩队列中的文件，每批压缩后清理一次"""
+        _lower_thread_priority()
+
+        for path in self._find_leftovers():
+            self._queue.put(path)
+        self.sweep()
+
+        while not self._stopped.is_set():
+            try:
+                path = self._queue.get(timeout=1.0)
+            except queue.Empty:
+                continue
+            try:
+                if path is None:
+                    break
+                self._compress_file(path)
+                # 同一次轮转可能提交多个文件，全部压缩完再清理
+                if self._queue.empty():
+                    self.sweep()
+            finally:
+                self._queue.task_done()
+
+    def _find_leftovers(self):
+        """查找今天之前修改、尚未压缩的日志文件（上次运行退出时未来得及压缩的）"""
+        today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0).timestamp()
+        leftovers = []
+        for path in self._list_files(LOG_SUFFIXES):
+            try:
+                if path.stat().st_mtime < today:
+                    leftovers.append(path)
+            except OSError:
+                continue
+        return leftovers
+
+    def _list_files(self, suffixes):
+        """列出日志目录中由日志输出器写出的、指定扩展名的文件"""
+        try:
+            return [
+                path
+                for path in self.log_dir.iterdir()
+                if path.suffix in suffixes and SINK_FILE_PATTERN.fullmatch(path.name) and path.is_file()
+            ]
+        except OSError:
+            return []
+
+    def _compress_file(self, path):
+        """
+        压缩单个文件：先写入临时文件再重命名，成功后删除原文件
+
+        Args:
+            path (Path): 日志文件路径
+
+        Returns:
+            bool: 是否压缩成功
+        """
+        target = path.with_name(path.name + self.archive_suffix)
+        temp_target = target.with_name(target.name + ".tmp")
+        try:
+            stat = path.stat()
+            with open(path, "rb") as src, open(temp_target, "wb") as dst:
+                if zstandard is not None:
+                    compressor = zstandard.ZstdCompressor(level=self.compression_level)
+                    compressor.copy_stream(src, dst, read_size=CHUNK_SIZE, write_size=CHUNK_SIZE)
+                else:
+                    with gzip.GzipFile(fileobj=dst, mode="wb", compresslevel=min(9, self.compression_level)) as gz:
+                        shutil.copyfileobj(src, gz, CHUNK_SIZE)
+            os.replace(temp_target, target)
+            # 保留原文件的修改时间，清理时按日志实际时间判断
+            os.utime(target, (stat.st_atime, stat.st_mtime))
+            path.unlink()
+            self._compressed_count += 1
+            return True
+        except FileNotFoundError:
+            # 文件已被其他进程压缩或删除
+            return False
+        except OSError as e:
+            # 不能通过 logger 报告，否则可能在轮转过程中再次写日志
+            self._failed_count += 1
+            sys.stderr.write(f"压缩日志文件失败 {path}: {e}\n")
+            try:
+                temp_target.unlink()
+            except OSError:
+                pass
+            return False
+
+    def sweep(self):
+        """
+        按保留天数和总大小上限清理日志目录
+
+        超过保留天数的文件都会被删除；总大小超过上限时再从最旧的归档文件开始删除，
+        正在写入或等待压缩的未压缩日志不会因为总大小上限被删除。
+
+        Returns:
+            int: 删除的文件数
+        """
+        files = []
+        for path in self._list_files(LOG_SUFFIXES + ARCHIVE_SUFFIXES):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, path))
+        files.sort()
+
+        removed = 0
+        if self.retention_days:
+            oldest = (datetime.now() - timedelta(days=self.retention_days)).timestamp()
+            kept = []
+            for entry in files:
+                if entry[0] < oldest and self._remove(entry[2]):
+                    removed += 1
+                else:
+                    kept.append(entry)
+            files = kept
+
+        if self.max_total_bytes:
+            total = sum(size for _, size, _ in files)
+            for _, size, path in files:
+                if total <= self.max_total_bytes:
+                    break
+                if path.suffix in ARCHIVE_SUFFIXES and self._remove(path):
+                    total -= size
+                    removed += 1
+
+        return removed
+
+    def _remove(self, path):
+        """删除文件，返回是否成功"""
+        try:
+            path.unlink()
+            self._removed_count += 1
+            return True
+        except OSError:
+            return False
+
+    def stop(self, timeout=2.0):
+        """
+        停止后台线程
+
+        正在压缩的文件会被压缩完，队列中剩余的文件留到下次启动时作为遗留文件处理。
+
+        Args:
+            timeout (float): 等待后台线程结束的最长时间（秒）
+        """
+        self._stopped.set()
+        self._queue.put(None)
+        if self._thread is not threading.current_thread():
+            self._thread.join(timeout=timeout)
+
+    def wait_idle(self, timeout=None):
+        """
+        等待队列中的文件全部压缩完
+
+        Args:
+            timeout (float, optional): 最长等待时间（秒），为None时一直等待
+
+        Returns:
+            bool: 是否已全部完成
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self._queue.unfinished_tasks and self._thread.is_alive():
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            time.sleep(0.01)
+        return True
+
+    def get_stats(self):
+        """
+        获取归档统计信息
+
+        Returns:
+            dict: 包含已压缩、已删除、失败和等待压缩的文件数
+        """
+        return {
+            "compressed": self._compressed_count,
+            "removed": self._removed_count,
+            "failed": self._failed_count,
+            "pending": self._queue.qsize(),
+        }
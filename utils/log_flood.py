@@ -0,0 +1,277 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+日志洪泛过滤
+
+循环中出错时同一处代码会在短时间内写出成千上万条相同的日志。这里按调用点（模块、函数、行号）：
+- 合并重复消息：同一调用点在 DEDUP_IDLE 秒内连续写出相同的消息时只保留第一条，之后汇总为"重复了 N 次"
+- 令牌桶限流：同一调用点的日志速率超过限制时丢弃多出的部分，之后汇总丢弃的条数
+
+汇总日志由后台线程写出：过滤器在 loguru 输出器内部执行，不能在其中再写日志。
+"""
+
+import threading
+import time
+
+from loguru import logger
+
+# 重复消息在这段时间（秒）内没有再出现时写出汇总；间隔超过这段时间的相同消息不视为重复
+DEDUP_IDLE = 1.0
+
+# 持续重复或持续限流时，每隔这段时间（秒）写出一次汇总
+SUMMARY_INTERVAL = 10.0
+
+# 汇总日志附带的标记，带有该标记的日志不再经过洪泛过滤
+SUMMARY_MARK = "flood_summary"
+
+# 该级别及以上的日志不会被丢弃
+CRITICAL_NO = 50
+
+
+class _SiteState:
+    """单个调用点的状态"""
+
+    __slots__ = (
+        "site",
+        "level",
+        "tokens",
+        "updated",
+        "last_message",
+        "repeats",
+        "last_seen",
+        "dropped",
+        "last_dropped",
+        "summarized",
+        "suppressed",
+    )
+
+    def __init__(self, site, level, burst, now):
+        self.site = site
+        self.level = level
+        self.tokens = burst
+        self.updated = now
+        self.last_message = None
+        self.repeats = 0
+        self.last_seen = now
+        self.dropped = 0
+        self.last_dropped = now
+        self.summarized = now
+        self.suppressed = 0
+
+
+class FloodFilter:
+    """
+    按调用点限流和合并重复消息的过滤器
+
+    作为 loguru 输出器的过滤条件使用。同一条日志会依次经过各个输出器的过滤器，
+    判断结果保存在日志记录中，保证每条日志只被计数一次、各输出器的取舍一致。
+    """
+
+    # 保存判断结果的记录字段
+    RECORD_KEY = "flood_passed"
+
+    def __init__(self, rate=20.0, burst=100, dedup=True):
+        """
+        初始化过滤器
+
+        Args:
+            rate (float): 每个调用点每秒允许的日志条数，为0时不限流
+            burst (int): 令牌桶容量，即允许的突发条数
+            dedup (bool): 是否合并连续的重复消息
+        """
+        self.rate = rate
+        self.burst = burst
+        self.dedup = dedup
+
+        self._lock = threading.Lock()
+        self._sites = {}
+        self._ready = []
+        self._thread = None
+
+        # 统计信息
+        self._passed_count = 0
+        self._duplicate_count = 0
+        self._rate_limited_count = 0
+
+    @property
+    def enabled(self):
+        """是否启用了限流或去重"""
+        return self.dedup or self.rate > 0
+
+    def configure(self, rate=None, burst=None, dedup=None):
+        """
+        运行时修改设置（不需要重建输出器）
+
+        Args:
+            rate (float, optional): 每个调用点每秒允许的日志条数，为0时不限流
+            burst (int, optional): 令牌桶容量
+            dedup (bool, optional): 是否合并连续的重复消息
+        """
+        with self._lock:
+            if rate is not None:
+                self.rate = rate
+            if burst is not None:
+                self.burst = burst
+            if dedup is not None:
+                self.dedup = dedup
+
+    def __call__(self, record):
+        passed = record.get(self.RECORD_KEY)
+        if passed is None:
+            passed = self._decide(record)
+            record[self.RECORD_KEY] = passed
+        return passed
+
+    def _decide(self, record):
+        """判断一条日志是否保留"""
+        if not self.enabled or record["level"].no >= CRITICAL_NO or record["extra"].get(SUMMARY_MARK):
+            return True
+
+        site = (record["name"], record["function"], record["line"])
+        message = record["message"]
+        now = time.monotonic()
+
+        with self._lock:
+            state = self._sites.get(site)
+            if state is None:
+                state = _SiteState(site, record["level"].name, self.burst, now)
+                self._sites[site] = state
+
+            # 与该调用点上一条消息相同且间隔不超过 DEDUP_IDLE：只计数，由后台线程写出汇总
+            if self.dedup and message == state.last_message and now - state.last_seen < DEDUP_IDLE:
+                if state.repeats == 0:
+                    state.summarized = now
+                state.repeats += 1
+                state.suppressed += 1
+                state.last_seen = now
+                self._duplicate_count += 1
+                self._ensure_thread()
+                return False
+
+            if self.rate > 0:
+                state.tokens = min(self.burst, state.tokens + (now - state.updated) * self.rate)
+                state.updated = now
+                if state.tokens < 1:
+                    if state.dropped == 0:
+                        state.summarized = now
+                    state.dropped += 1
+                    state.suppressed += 1
+                    state.last_dropped = now
+                    self._rate_limited_count += 1
+                    self._ensure_thread()
+                    return False
+                state.tokens -= 1
+
+            # 新消息打断了上一段重复，把上一段的汇总交给后台线程写出
+            if state.repeats:
+                self._ready.append((site, state.level, self._repeat_text(state)))
+                state.repeats = 0
+            state.last_message = message
+            state.last_seen = now
+            state.level = record["level"].name
+            self._passed_count += 1
+            return True
+
+    def _ensure_thread(self):
+        """按需启动写出汇总的后台线程（需在持有锁时调用）"""
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name="log-flood-summary", daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        """后台线程主循环：定期写出汇总，没有待汇总的内容时退出"""
+        while True:
+            time.sleep(0.5)
+            summaries, pending = self._collect_summaries(time.monotonic())
+            for site, level, text in summaries:
+                self._emit_summary(site, level, text)
+            if not pending:
+                with self._lock:
+                    if not self._ready and not any(state.repeats or state.dropped for state in self._sites.values()):
+                        self._thread = None
+                        return
+
+    @staticmethod
+    def _repeat_text(state):
+        """重复消息的汇总文本"""
+        return f"上一条消息重复了 {state.repeats} 次: {state.last_message}"
+
+    def _collect_summaries(self, now, force=False):
+        """
+        收集需要写出的汇总
+
+        Args:
+            now (float): 当前时间（time.monotonic）
+            force (bool): 是否不论时间间隔写出所有汇总
+
+        Returns:
+            tuple: (汇总列表 [(调用点, 级别, 文本)], 是否仍有未写出汇总的计数)
+        """
+        pending = False
+        with self._lock:
+            summaries = self._ready
+            self._ready = []
+            for state in self._sites.values():
+                if state.repeats:
+                    idle = now - state.last_seen >= DEDUP_IDLE
+                    if force or idle or now - state.summarized >= SUMMARY_INTERVAL:
+                        summaries.append((state.site, state.level, self._repeat_text(state)))
+                        state.repeats = 0
+                        state.summarized = now
+                        if idle:
+                            # 重复已结束，之后再出现相同消息时重新输出一条
+                            state.last_message = None
+                    else:
+                        pending = True
+
+                if state.dropped:
+                    # 一段时间内没有再被丢弃说明限流已结束
+                    idle = now - state.last_dropped >= DEDUP_IDLE
+                    if force or idle or now - state.summarized >= SUMMARY_INTERVAL:
+                        summaries.append((state.site, state.level, f"日志过多，已丢弃该处的 {state.dropped} 条日志"))
+                        state.dropped = 0
+                        state.summarized = now
+                    else:
+                        pending = True
+        return summaries, pending
+
+    @staticmethod
+    def _emit_summary(site, level, text):
+        """以原调用点的名义写出汇总，使其按原模块的级别过滤并显示原位置"""
+        name, function, line = site
+
+        def patch(record):
+            record.update(name=name, function=function, line=line)
+
+        logger.bind(**{SUMMARY_MARK: True}).patch(patch).log(level, "{}", text)
+
+    def flush(self):
+        """立即写出所有尚未写出的汇总"""
+        summaries, _ = self._collect_summaries(time.monotonic(), force=True)
+        for site, level, text in summaries:
+            self._emit_summary(site, level, text)
+
+    def get_stats(self):
+        """
+        获取过滤统计信息
+
+        Returns:
+            dict: 包含保留条数、合并的重复条数、限流丢弃条数，以及被抑制最多的调用点及其条数
+        """
+        with self._lock:
+            noisy_sites = sorted(
+                (
+                    (state.suppressed, "{}:{}:{}".format(*state.site))
+                    for state in self._sites.values()
+                    if state.suppressed
+                ),
+                reverse=True,
+            )
+            return {
+                "passed": self._passed_count,
+                "duplicates": self._duplicate_count,
+                "rate_limited": self._rate_limited_count,
+                "suppressed": self._duplicate_count + self._rate_limited_count,
+                "top_sites": [(site, count) for count, site in noisy_sites[:10]],
+            }
@@ -0,0 +1,398 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+日志文件读取和行索引
+
+供日志查看器使用的非界面部分：
+- LogDocument：通过内存映射读取日志文件，文件追加内容后只映射新增的长度；
+  压缩归档（.zst/.gz/.zip）以流的方式逐块解压到临时文件后同样通过内存映射读取
+- LogIndex：增量构建的行偏移索引，同时记录每行的级别和模块，供过滤使用
+- LogFilter：按级别、模块和子串过滤行，可以只对新增的行执行
+"""
+
+import bisect
+import gzip
+import mmap
+import os
+import re
+import tempfile
+import zipfile
+from array import array
+from pathlib import Path
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+from utils.log_archiver import LOG_SUFFIXES, ARCHIVE_SUFFIXES
+
+# 级别名称到数值的映射（与 loguru 的内置级别一致），0 表示无法识别
+LEVEL_NUMBERS = {
+    "TRACE": 5,
+    "DEBUG": 10,
+    "INFO": 20,
+    "SUCCESS": 25,
+    "WARNING": 30,
+    "ERROR": 40,
+    "CRITICAL": 50,
+}
+
+# 文本日志的行首格式见 utils.logger.FILE_FORMAT，结构化日志的字段顺序见 JsonLinesSink.serialize
+TEXT_HEADER = re.compile(rb"\d{4}-\d\d-\d\d \d\d:\d\d:\d\d\.\d{3} \| (\w+) *\| ([^:| ]*):")
+JSON_HEADER = re.compile(rb'\{"time": "[^"]*", "level": "(\w+)", "module": "([^"]*)"')
+
+# 每次从归档流中解压的字节数
+STREAM_CHUNK_SIZE = 4 * 1024 * 1024
+
+# 每次建立索引或搜索处理的最大字节数，处理完一块就可以发布一次进度
+INDEX_CHUNK_SIZE = 8 * 1024 * 1024
+
+
+def open_log_stream(path):
+    """
+    以二进制流的方式打开日志文件，压缩归档会被透明解压
+
+    Args:
+        path (str | Path): 日志文件或归档路径
+
+    Returns:
+        file-like: 可逐块读取的二进制流
+
+    Raises:
+        RuntimeError: 打开 .zst 归档但未安装 zstandard 时
+        OSError: 文件无法读取时
+    """
+    path = Path(path)
+    if path.suffix == ".zst":
+        if zstandard is None:
+            raise RuntimeError("读取 .zst 日志需要安装 zstandard")
+        return zstandard.ZstdDecompressor().stream_reader(open(path, "rb"), closefd=True)
+    if path.suffix == ".gz":
+        return gzip.open(path, "rb")
+    if path.suffix == ".zip":
+        archive = zipfile.ZipFile(path)
+        names = archive.namelist()
+        if not names:
+            archive.close()
+            raise OSError(f"归档中没有日志文件: {path}")
+        # ZipExtFile 持有归档的引用，归档在流关闭后随之释放
+        return archive.open(names[0])
+    return open(path, "rb")
+
+
+def list_log_files(log_dir):
+    """
+    列出日志目录中的日志文件和归档，最新的排在前面
+
+    Args:
+        log_dir (str | Path): 日志目录
+
+    Returns:
+        list[Path]: 文件路径列表
+    """
+    files = []
+    try:
+        for path in Path(log_dir).iterdir():
+            if path.suffix in LOG_SUFFIXES + ARCHIVE_SUFFIXES and path.is_file():
+                files.append((path.stat().st_mtime, path))
+    except OSError:
+        return []
+    files.sort(reverse=True)
+    return [path for _, path in files]
+
+
+class LogDocument:
+    """
+    通过内存映射读取的日志内容
+
+    普通日志文件直接映射；归档文件逐块解压到临时文件并映射临时文件。
+    refresh 把文件新增的内容纳入映射，旧的映射对象不会被主动关闭，
+    其他线程正在读取的旧映射在不再被引用后自动释放。
+    """
+
+    def __init__(self, path):
+        """
+        初始化日志内容
+
+        Args:
+            path (str | Path): 日志文件或归档路径
+        """
+        self.path = Path(path)
+        self.is_archive = self.path.suffix in ARCHIVE_SUFFIXES
+        self.size = 0
+        self.complete = False
+        self._file = None
+        self._stream = None
+        self._map = None
+
+    def open(self):
+        """
+        打开文件
+
+        Raises:
+            OSError: 文件无法读取时
+        """
+        if self.is_archive:
+            self._stream = open_log_stream(self.path)
+            self._file = tempfile.TemporaryFile(prefix="log-viewer-")
+        else:
+            self._file = open(self.path, "rb")
+
+    def refresh(self):
+        """
+        纳入文件新增的内容
+
+        归档每次最多解压 STREAM_CHUNK_SIZE 字节，需要反复调用直到 complete 为 True。
+
+        Returns:
+            bool: 文件是否被截断或替换（此时需要重新打开并重建索引）
+        """
+        if self._stream is not None:
+            data = self._stream.read(STREAM_CHUNK_SIZE)
+            if data:
+                self._file.seek(0, os.SEEK_END)
+                self._file.write(data)
+                self._file.flush()
+            else:
+                self._stream.close()
+                self._stream = None
+                self.complete = True
+
+        size = os.fstat(self._file.fileno()).st_size
+        if size < self.size:
+            return True
+
+        if size > self.size:
+            self._map = mmap.mmap(self._file.fileno(), size, access=mmap.ACCESS_READ)
+            self.size = size
+        return False
+
+    def is_replaced(self):
+        """判断日志文件是否已被轮转替换（路径指向了另一个文件）"""
+        if self.is_archive or self._file is None:
+            return False
+        try:
+            return not os.path.samestat(os.stat(self.path), os.fstat(self._file.fileno()))
+        except OSError:
+            # 轮转后新文件尚未创建时继续读取已打开的文件
+            return False
+
+    @property
+    def buffer(self):
+        """当前的内存映射（文件为空时为 None）"""
+        return self._map
+
+    def read(self, start, end):
+        """
+        读取一段字节
+
+        Args:
+            start (int): 起始偏移
+            end (int): 结束偏移（不包含）
+
+        Returns:
+            bytes: 读取的内容
+        """
+        buffer = self._map
+        if buffer is None:
+            return b""
+        return buffer[start:end]
+
+    def close(self):
+        """关闭文件（映射在不再被引用后释放）"""
+        if self._stream is not None:
+            self._stream.close()
+            self._stream = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        self._map = None
+
+
+class LogIndex:
+    """
+    增量构建的行索引
+
+    每行记录起始偏移、级别数值和模块编号。数组只会追加，其他线程读取已发布的行数范围内的数据是安全的。
+    无法识别行首格式的行（如异常堆栈）沿用上一行的级别和模块。
+    """
+
+    def __init__(self):
+        self.starts = array("Q")
+        self.levels = array("B")
+        self.modules = array("I")
+        self.module_names = []
+        self._module_ids = {}
+        self.end = 0
+
+    def __len__(self):
+        return len(self.starts)
+
+    def line_range(self, line_no):
+        """
+        获取某一行的字节范围（不含换行符）
+
+        Args:
+            line_no (int): 行号（从0开始）
+
+        Returns:
+            tuple: (起始偏移, 结束偏移)
+        """
+        start = self.starts[line_no]
+        end = self.starts[line_no + 1] if line_no + 1 < len(self.starts) else self.end
+        return start, end - 1
+
+    def _module_id(self, name):
+        """获取模块名称对应的编号"""
+        module_id = self._module_ids.get(name)
+        if module_id is None:
+            module_id = len(self.module_names)
+            self.module_names.append(name)
+            self._module_ids[name] = module_id
+        return module_id
+
+    def update(self, buffer, size, limit=INDEX_CHUNK_SIZE):
+        """
+        为新增的完整行建立索引（最后一行没有换行符时等写完再处理）
+
+        Args:
+            buffer: 日志内容的内存映射
+            size (int): 内容长度
+            limit (int): 本次最多处理的字节数
+
+        Returns:
+            int: 新增的行数
+        """
+        pos = self.end
+        stop = min(size, pos + limit)
+        if buffer is None or pos >= stop:
+            return 0
+
+        starts = array("Q")
+        levels = array("B")
+        modules = array("I")
+        level_no = self.levels[-1] if self.levels else 0
+        module_id = self.modules[-1] if self.modules else self._module_id("")
+
+        find = buffer.find
+        text_match = TEXT_HEADER.match
+        json_match = JSON_HEADER.match
+        while pos < stop:
+            newline = find(b"\n", pos, size)
+            if newline < 0:
+                break
+            header = text_match(buffer, pos, newline) or json_match(buffer, pos, newline)
+            if header is not None:
+                level_no = LEVEL_NUMBERS.get(header.group(1).decode("ascii"), 0)
+                module_id = self._module_id(header.group(2).decode("utf-8", "replace"))
+            starts.append(pos)
+            levels.append(level_no)
+            modules.append(module_id)
+            pos = newline + 1
+
+        # 先追加行数据再更新结束偏移，保证其他线程读到的每一行范围都是完整的
+        self.levels.extend(levels)
+        self.modules.extend(modules)
+        self.starts.extend(starts)
+        self.end = pos
+        return len(starts)
+
+
+class LogFilter:
+    """
+    按级别、模块和子串过滤日志行
+
+    模块按前缀匹配（如 "ui.managers" 包含其子模块），子串匹配不区分 ASCII 大小写。
+    """
+
+    def __init__(self, min_level=0, module="", text=""):
+        """
+        初始化过滤条件
+
+        Args:
+            min_level (int): 最低级别数值，0 表示不过滤级别
+            module (str): 模块名前缀，空字符串表示不过滤模块
+            text (str): 要搜索的子串，空字符串表示不搜索
+        """
+        self.min_level = min_level
+        self.module = module.strip()
+        self.needle = text.lower().encode("utf-8")
+        self._module_matches = {}
+
+    @property
+    def is_empty(self):
+        """是否没有任何过滤条件"""
+        return not self.min_level and not self.module and not self.needle
+
+    def _match_module(self, index, module_id):
+        """判断模块编号是否匹配（按编号缓存结果）"""
+        matched = self._module_matches.get(module_id)
+        if matched is None:
+            name = index.module_names[module_id]
+            matched = name == self.module or name.startswith(self.module + ".")
+            self._module_matches[module_id] = matched
+        return matched
+
+    def apply(self, index, buffer, first, last):
+        """
+        过滤一段行
+
+        Args:
+            index (LogIndex): 行索引
+            buffer: 日志内容的内存映射
+            first (int): 起始行号
+            last (int): 结束行号（不包含）
+
+        Returns:
+            array: 匹配的行号
+        """
+        if self.needle:
+            candidates = self._search(index, buffer, first, last)
+        else:
+            candidates = range(first, last)
+
+        if not self.min_level and not self.module:
+            return array("I", candidates)
+
+        levels = index.levels
+        modules = index.modules
+        rows = array("I")
+        for line_no in candidates:
+            if self.min_level and levels[line_no] < self.min_level:
+                continue
+            if self.module and not self._match_module(index, modules[line_no]):
+                continue
+            rows.append(line_no)
+        return rows
+
+    def _search(self, index, buffer, first, last):
+        """
+        在一段行中搜索子串
+
+        按行边界分块读取并转换为小写后查找，命中后直接跳到下一行，每行最多命中一次。
+
+        Returns:
+            list: 包含子串的行号
+        """
+        starts = index.starts
+        needle = self.needle
+        hits = []
+        line_no = first
+        while line_no < last:
+            chunk_start = starts[line_no]
+            chunk_last = bisect.bisect_left(starts, chunk_start + INDEX_CHUNK_SIZE, line_no + 1, last)
+            chunk_end = starts[chunk_last] if chunk_last < len(starts) else index.end
+            chunk = buffer[chunk_start:chunk_end].lower()
+
+            pos = chunk.find(needle)
+            while pos >= 0:
+                hit = bisect.bisect_right(starts, chunk_start + pos, line_no, chunk_last) - 1
+                hits.append(hit)
+                next_line = hit + 1
+                if next_line >= chunk_last:
+                    break
+                pos = chunk.find(needle, starts[next_line] - chunk_start)
+            line_no = chunk_last
+        return hits
@@ -4,69 +4,561 @@
 """日志封装"""
 
 import sys
+import threading
+import time
+import traceback
+from datetime import datetime
 from pathlib import Path
 from loguru import logger
+from utils.json_sink import JsonLinesSink
+from utils.log_archiver import LogArchiver
+from utils.ring_sink import RingBufferSink
+from utils.log_flood import FloodFilter
 
 
-def setup_logger(log_dir, log_retention_days=7, log_rotation="1 day", debug_mode=False):
+# 控制台输出格式：普通模式只显示时间、级别和消息，调试模式额外显示日期和代码位置
+CONSOLE_FORMAT = "<green>{time:HH:mm:ss}</green> | <level>{level: <8}</level> | <level>{message}</level>\n{exception}"
+CONSOLE_DEBUG_FORMAT = (
+    "<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | "
+    "<cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> | <level>{message}</level>\n{exception}"
+)
+FILE_FORMAT = "{time:YYYY-MM-DD HH:mm:ss.SSS} | {level: <8} | {name}:{function}:{line} | {message}"
+# 结构化输出器自行序列化日志记录，loguru 只需格式化消息本身
+STRUCTURED_FORMAT = "{message}"
+
+# 输出器自身的最低级别：实际级别由 LevelFilter 决定，切换级别时无需重建输出器
+SINK_LEVEL = "DEBUG"
+
+# 没有输出器需要额外接收低级别日志时的捕获级别（高于所有内置级别）
+NO_CAPTURE_LEVEL = 1000
+
+
+class LevelFilter:
     """
-    配置日志系统
+    按模块解析日志级别的过滤器
 
-    Args:
-        log_dir: 日志文件目录
-        log_retention_days: 日志保留天数
-        log_rotation: 日志轮转周期
-        debug_mode: 是否启用调试模式
+    输出器持有该对象的引用，修改级别只需更新其中的字典，无需移除和重建输出器。
+    模块名到级别的解析结果会被缓存，之后每条日志只需一次字典查找。
+    """
 
-    Returns:
-        logger: 配置好的logger实例
+    def __init__(self, level="INFO"):
+        """
+        初始化过滤器
 
-    Raises:
-        OSError: 当无法创建日志目录时
-        PermissionError: 当没有写入权限时
+        Args:
+            level (str | int): 默认日志级别
+        """
+        self.default_level = self._to_level_no(level)
+        self.module_levels = {}
+        self._cache = {}
+
+    @staticmethod
+    def _to_level_no(level):
+        """将级别名称转换为级别数值"""
+        return level if isinstance(level, int) else logger.level(level).no
+
+    def set_level(self, level, module=None):
+        """
+        设置日志级别
+
+        Args:
+            level (str | int): 日志级别，为None时移除该模块的单独设置
+            module (str, optional): 模块名（如 "ui.managers"，对其子模块同样生效），为空时设置默认级别
+        """
+        if module:
+            if level is None:
+                self.module_levels.pop(module, None)
+            else:
+                self.module_levels[module] = self._to_level_no(level)
+        elif level is not None:
+            self.default_level = self._to_level_no(level)
+        self._cache.clear()
+
+    def resolve(self, name):
+        """
+        解析模块的有效日志级别
+
+        Args:
+            name (str): 模块名
+
+        Returns:
+            int: 级别数值
+        """
+        level_no = self._cache.get(name)
+        if level_no is not None:
+            return level_no
+
+        # 从完整模块名开始逐级向上查找单独设置的级别
+        level_no = self.default_level
+        if self.module_levels and name:
+            module = name
+            while True:
+                if module in self.module_levels:
+                    level_no = self.module_levels[module]
+                    break
+                index = module.rfind(".")
+                if index < 0:
+                    break
+                module = module[:index]
+
+        self._cache[name] = level_no
+        return level_no
+
+    def __call__(self, record):
+        return record["level"].no >= self.resolve(record["name"])
+
+
+class LogController:
     """
-    try:
-        # 移除默认的日志处理器
-        logger.remove()
+    日志控制器
+
+    输出器只在首次配置时创建一次，之后切换调试模式、调整模块级别和控制台格式
+    都通过输出器持有引用的过滤器和格式函数完成，不会停止 enqueue 的后台线程，
+    也不会丢失队列中尚未写入的日志。
+    """
+
+    def __init__(self):
+        self.filter = LevelFilter()
+        self.flood = FloodFilter()
+        self.debug_mode = False
+        self._console_id = None
+        self._file_id = None
+        self._file_options = None
+        self._structured_sink = None
+        self._archiver = None
+        self._log_dir = None
+        self._ring_id = None
+        self._ring_sink = None
+        self._previous_excepthooks = None
 
-        # 确定日志级别
-        log_level = "DEBUG" if debug_mode else "INFO"
+        # 不受级别过滤器限制的输出器（环形缓冲）需要接收的最低级别
+        self.capture_level = NO_CAPTURE_LEVEL
+
+    def sink_filter(self, record):
+        """
+        控制台和文件输出器的过滤条件：先按级别过滤，再经过洪泛过滤（每条日志只判断一次），
+        被级别过滤掉的日志不消耗限流令牌
+        """
+        return self.filter(record) and self.flood(record)
+
+    def ring_filter(self, record):
+        """环形缓冲输出器的过滤条件：只对会被输出的日志做洪泛过滤，低于输出级别的日志直接保留"""
+        return self.flood(record) if self.filter(record) else True
+
+    def format_console(self, record):
+        """控制台输出器的格式函数（根据当前模式返回格式模板）"""
+        return CONSOLE_DEBUG_FORMAT if self.debug_mode else CONSOLE_FORMAT
+
+    def configure(
+        self,
+        log_dir,
+        log_retention_days=7,
+        log_rotation="1 day",
+        debug_mode=False,
+        structured=False,
+        compression_level=3,
+        max_total_size_mb=0,
+        ring_buffer_size=0,
+        flood_rate=20.0,
+        flood_burst=100,
+        flood_dedup=True,
+    ):
+        """
+        配置日志系统
+
+        首次调用时创建输出器；之后再次调用只更新级别，只有日志目录、轮转、保留或输出格式设置变化时才重建文件输出器。
+
+        Args:
+            log_dir: 日志文件目录
+            log_retention_days: 日志保留天数
+            log_rotation: 日志轮转周期（结构化日志固定按日期分文件）
+            debug_mode: 是否启用调试模式
+            structured: 是否使用结构化 JSON Lines 文件输出器代替文本文件输出器
+            compression_level: 轮转日志的 zstd 压缩级别
+            max_total_size_mb: 日志目录总大小上限（MB），为0时不限制
+            ring_buffer_size: 内存中保留的最近调试日志条数，为0时不保留
+            flood_rate: 每个调用点每秒允许的日志条数，为0时不限流
+            flood_burst: 每个调用点允许的突发日志条数
+            flood_dedup: 是否把同一调用点连续的重复消息合并为汇总
+        """
+        self.set_debug_mode(debug_mode)
+        self.flood.configure(flood_rate, flood_burst, flood_dedup)
+        self._log_dir = Path(log_dir)
+
+        if self._console_id is None:
+            # 移除默认的日志处理器
+            logger.remove()
+            self._console_id = logger.add(
+                sys.stderr, level=SINK_LEVEL, format=self.format_console, filter=self.sink_filter, colorize=True
+            )
+
+        self._configure_ring_buffer(ring_buffer_size)
+
+        file_options = (
+            str(Path(log_dir)),
+            log_retention_days,
+            log_rotation,
+            bool(structured),
+            compression_level,
+            max_total_size_mb,
+        )
+        if file_options == self._file_options:
+            return
 
         # 确保日志目录存在
         log_path = Path(log_dir)
         log_path.mkdir(parents=True, exist_ok=True)
 
-        # 配置控制台输出
-        console_format = (
-            "<green>{time:HH:mm:ss}</green> | <level>{level: <8}</level> | <level>{message}</level>"
-            if not debug_mode
-            else "<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | "
-            "<cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> | <level>{message}</level>"
-        )
+        # 文件设置变化时只替换文件输出器，remove 会先写完队列中的日志再停止后台线程
+        if self._file_id is not None:
+            logger.remove(self._file_id)
+            self._file_id = None
+            self._structured_sink = None
+        self._stop_archiver()
 
-        logger.add(sys.stderr, level=log_level, format=console_format, colorize=True)
+        # 轮转下来的文件由后台归档器压缩和清理，不在写日志的线程中执行
+        self._archiver = LogArchiver(log_path, log_retention_days, max_total_size_mb, compression_level)
 
-        # 配置文件输出
-        log_file = log_path / "{time:YYYY-MM-DD}.log"
-        file_format = "{time:YYYY-MM-DD HH:mm:ss.SSS} | {level: <8} | {name}:{function}:{line} | {message}"
+        if structured:
+            self._structured_sink = JsonLinesSink(log_path, on_rotate=self._archiver.submit)
+            self._file_id = logger.add(
+                self._structured_sink,
+                level=SINK_LEVEL,
+                format=STRUCTURED_FORMAT,
+                filter=self.sink_filter,
+                catch=True,
+            )
+            self._file_options = file_options
+            return
 
-        logger.add(
-            str(log_file),
-            level=log_level,
-            format=file_format,
+        self._file_id = logger.add(
+            str(log_path / "{time:YYYY-MM-DD}.log"),
+            level=SINK_LEVEL,
+            format=FILE_FORMAT,
+            filter=self.sink_filter,
             rotation=log_rotation,
-            retention=f"{log_retention_days} days",
             encoding="utf-8",
-            compression="zip",
+            compression=self._archiver.submit,
             enqueue=True,
             catch=True,
         )
-        
+        self._file_options = file_options
+
+    def _configure_ring_buffer(self, size):
+        """
+        按需创建或替换环形缓冲输出器
+
+        环形缓冲不使用级别过滤器，即使文件输出器为 INFO 也会接收 DEBUG 日志。
+        已输出的日志由 loguru 交给环形缓冲；未达到输出级别但不低于 capture_level 的日志
+        由延迟格式化的日志门面通过 capture 直接存入环形缓冲，不创建 loguru 日志记录。
+        """
+        if self._ring_sink is not None and self._ring_sink.capacity == size:
+            return
+
+        if self._ring_id is not None:
+            logger.remove(self._ring_id)
+            self._ring_id = None
+            self._ring_sink = None
+            self.capture_level = NO_CAPTURE_LEVEL
+
+        if size > 0:
+            self._ring_sink = RingBufferSink(size)
+            self._ring_id = logger.add(
+                self._ring_sink, level=SINK_LEVEL, format=STRUCTURED_FORMAT, filter=self.ring_filter, catch=True
+            )
+            self.capture_level = DEBUG_NO
+            self._install_excepthooks()
+
+    def capture(self, level_name, name, frame, message, args, exception=False):
+        """
+        把未达到输出级别的日志直接存入环形缓冲（只保存原始字段，写出时才格式化）
+
+        Args:
+            level_name (str): 级别名称
+            name (str): 模块名
+            frame (frame): 调用方的栈帧，用于记录函数名和行号
+            message (str): 消息模板
+            args (tuple): 消息参数
+            exception (bool): 是否附带当前正在处理的异常
+        """
+        ring_sink = self._ring_sink
+        if ring_sink is not None:
+            ring_sink.append(
+                time.time(),
+                level_name,
+                name,
+                frame.f_code.co_name,
+                frame.f_lineno,
+                message,
+                args,
+                traceback.format_exc() if exception else None,
+            )
+
+    def _install_excepthooks(self):
+        """安装未处理异常的钩子：记录异常并写出环形缓冲，再交给原来的钩子处理"""
+        if self._previous_excepthooks is not None:
+            return
+        self._previous_excepthooks = (sys.excepthook, threading.excepthook)
+
+        def handle_exception(exc_type, exc_value, exc_traceback):
+            if not issubclass(exc_type, KeyboardInterrupt):
+                logger.opt(exception=(exc_type, exc_value, exc_traceback)).critical("未处理的异常")
+                self.dump_ring_buffer("crash")
+            self._previous_excepthooks[0](exc_type, exc_value, exc_traceback)
+
+        def handle_thread_exception(args):
+            if not issubclass(args.exc_type, SystemExit):
+                thread_name = args.thread.name if args.thread else "未知"
+                logger.opt(exception=(args.exc_type, args.exc_value, args.exc_traceback)).critical(
+                    f"线程 {thread_name} 中未处理的异常"
+                )
+                self.dump_ring_buffer("crash")
+            self._previous_excepthooks[1](args)
+
+        # PyQt5 在槽函数抛出异常时会调用 sys.excepthook，设置了钩子后不会直接终止程序
+        sys.excepthook = handle_exception
+        threading.excepthook = handle_thread_exception
+
+    def _restore_excepthooks(self):
+        """恢复安装钩子之前的异常处理"""
+        if self._previous_excepthooks is not None:
+            sys.excepthook, threading.excepthook = self._previous_excepthooks
+            self._previous_excepthooks = None
+
+    def dump_ring_buffer(self, reason="snapshot"):
+        """
+        把环形缓冲中的日志写入日志目录
+
+        Args:
+            reason (str): 文件名前缀，如 crash（未处理的异常）或 snapshot（手动导出）
+
+        Returns:
+            Path | None: 写入的文件路径，未启用环形缓冲或写入失败时返回None
+        """
+        ring_sink = self._ring_sink
+        if ring_sink is None or self._log_dir is None:
+            return None
+
+        now = datetime.now()
+        path = self._log_dir / f"{reason}-{now:%Y%m%d-%H%M%S}.log"
+        try:
+            count = ring_sink.dump(path, header=f"# {reason} {now:%Y-%m-%d %H:%M:%S}，最近 {ring_sink.capacity} 条日志")
+        except OSError as e:
+            logger.error(f"写出诊断日志失败: {e}")
+            return None
+
+        logger.info(f"已写出 {count} 条诊断日志: {path}")
+        return path
+
+    def set_debug_mode(self, enabled):
+        """
+        切换调试模式（只修改默认级别和控制台格式，不重建输出器）
+
+        Args:
+            enabled (bool): 是否启用调试模式
+        """
+        self.debug_mode = bool(enabled)
+        self.filter.set_level("DEBUG" if self.debug_mode else "INFO")
+
+    def set_level(self, level, module=None):
+        """
+        设置日志级别
+
+        Args:
+            level (str | int): 日志级别（不低于 DEBUG），为None时移除该模块的单独设置
+            module (str, optional): 模块名，为空时设置默认级别
+        """
+        self.filter.set_level(level, module)
+
+    def is_enabled(self, level_no, name=""):
+        """
+        判断某个模块的某个级别是否会被输出
+
+        Args:
+            level_no (int): 级别数值
+            name (str): 模块名
+
+        Returns:
+            bool: 是否会被输出
+        """
+        return level_no >= self.capture_level or level_no >= self.filter.resolve(name)
+
+    def reset(self):
+        """移除所有输出器（下次 configure 时重新创建）"""
+        self.flood.flush()
+        logger.remove()
+        self._console_id = None
+        self._file_id = None
+        self._file_options = None
+        self._structured_sink = None
+        self._ring_id = None
+        self._ring_sink = None
+        self.capture_level = NO_CAPTURE_LEVEL
+        self._restore_excepthooks()
+        self._stop_archiver()
+
+    def _stop_archiver(self):
+        """停止后台归档器（未压缩完的文件留到下次启动时处理）"""
+        if self._archiver is not None:
+            self._archiver.stop()
+            self._archiver = None
+
+    def flush(self):
+        """立即写入结构化输出器缓冲区中的日志（未使用结构化输出器时无操作）"""
+        if self._structured_sink is not None:
+            self._structured_sink.flush_pending()
+
+
+# 全局日志控制器
+log_controller = LogController()
+
+
+# 常用级别的数值，避免每次调用时查询
+DEBUG_NO = logger.level("DEBUG").no
+INFO_NO = logger.level("INFO").no
+WARNING_NO = logger.level("WARNING").no
+ERROR_NO = logger.level("ERROR").no
+CRITICAL_NO = logger.level("CRITICAL").no
+
+
+class LazyLogger:
+    """
+    延迟格式化的日志门面
+
+    先用按模块缓存的级别判断是否需要输出，不输出时直接返回，既不格式化消息也不创建日志记录。
+    消息使用 loguru 的花括号占位符，参数只在真正输出时才被格式化：
+
+        log = get_logger(__name__)
+        log.debug("已从配置文件加载 {}: {}", attr_name, value)
+
+    不带参数的消息不会被格式化，可以直接包含花括号；参数本身的计算开销较大时，
+    可以先用 log.is_enabled("DEBUG") 判断。
+    """
+
+    __slots__ = ("name",)
+
+    def __init__(self, name):
+        """
+        初始化日志门面
+
+        Args:
+            name (str): 模块名，通常为 __name__
+        """
+        self.name = name
+
+    def is_enabled(self, level="DEBUG"):
+        """
+        判断当前模块的某个级别是否会被输出
+
+        Args:
+            level (str | int): 日志级别
+
+        Returns:
+            bool: 是否会被输出
+        """
+        level_no = level if isinstance(level, int) else logger.level(level).no
+        return log_controller.is_enabled(level_no, self.name)
+
+    def _log(self, level_name, level_no, message, args, exception=False):
+        """
+        级别判断通过后交给 loguru 输出（depth=2 使记录的位置指向调用方）；
+        未达到输出级别但需要保留在环形缓冲中时只保存原始字段
+        """
+        controller = log_controller
+        if level_no >= controller.filter.resolve(self.name):
+            logger.opt(depth=2, exception=exception).log(level_name, message, *args)
+        elif level_no >= controller.capture_level:
+            controller.capture(level_name, self.name, sys._getframe(2), message, args, exception)
+
+    def debug(self, message, *args):
+        self._log("DEBUG", DEBUG_NO, message, args)
+
+    def info(self, message, *args):
+        self._log("INFO", INFO_NO, message, args)
+
+    def warning(self, message, *args):
+        self._log("WARNING", WARNING_NO, message, args)
+
+    def error(self, message, *args):
+        self._log("ERROR", ERROR_NO, message, args)
+
+    def exception(self, message, *args):
+        self._log("ERROR", ERROR_NO, message, args, exception=True)
+
+    def critical(self, message, *args):
+        self._log("CRITICAL", CRITICAL_NO, message, args)
+
+
+def get_logger(name):
+    """
+    获取模块的延迟格式化日志门面
+
+    Args:
+        name (str): 模块名，通常为 __name__
+
+    Returns:
+        LazyLogger: 日志门面
+    """
+    return LazyLogger(name)
+
+
+def setup_logger(
+    log_dir,
+    log_retention_days=7,
+    log_rotation="1 day",
+    debug_mode=False,
+    structured=False,
+    compression_level=3,
+    max_total_size_mb=0,
+    ring_buffer_size=0,
+    flood_rate=20.0,
+    flood_burst=100,
+    flood_dedup=True,
+):
+    """
+    配置日志系统
+
+    可以重复调用：只有首次调用会创建输出器，之后只更新级别和变化了的文件设置。
+
+    Args:
+        log_dir: 日志文件目录
+        log_retention_days: 日志保留天数
+        log_rotation: 日志轮转周期
+        debug_mode: 是否启用调试模式
+        structured: 是否将文件日志写为结构化 JSON Lines
+        compression_level: 轮转日志的 zstd 压缩级别
+        max_total_size_mb: 日志目录总大小上限（MB），为0时不限制
+        ring_buffer_size: 内存中保留的最近调试日志条数，为0时不保留
+        flood_rate: 每个调用点每秒允许的日志条数，为0时不限流
+        flood_burst: 每个调用点允许的突发日志条数
+        flood_dedup: 是否把同一调用点连续的重复消息合并为汇总
+
+    Returns:
+        logger: 配置好的logger实例
+
+    Raises:
+        OSError: 当无法创建日志目录时
+        PermissionError: 当没有写入权限时
+    """
+    try:
+        log_controller.configure(
+            log_dir,
+            log_retention_days,
+            log_rotation,
+            debug_mode,
+            structured,
+            compression_level,
+            max_total_size_mb,
+            ring_buffer_size,
+            flood_rate,
+            flood_burst,
+            flood_dedup,
+        )
         return logger
 
     except Exception as e:
         # 如果配置失败，至少保证有基本的控制台输出
-        logger.remove()
+        log_controller.reset()
         logger.add(sys.stderr, level="ERROR")
         logger.error(f"日志系统配置失败: {e}")
         raise
@@ -92,11 +584,17 @@ if __name__ == "__main__":
             except ZeroDivisionError:
                 logger.exception("发生了除零异常")
 
+            # 运行时切换级别不会重建输出器
+            log_controller.set_debug_mode(False)
+            logger.debug("这条调试日志不会被输出")
+            log_controller.set_level("DEBUG", module="__main__")
+            logger.debug("单独为 __main__ 模块开启调试日志")
+
             print("✅ 日志测试完成")
 
-            logger.remove()
+            log_controller.reset()
 
         except Exception as e:
             print(f"❌ 日志测试失败: {e}")
-            logger.remove()  # 确保清理
+            log_controller.reset()  # 确保清理
             raise
@@ -5,22 +5,16 @@
 通知系统模块
 """
 
-import winrt
-import winrt.windows.foundation
-import winrt.windows.foundation.collections
-
 import os
 import sys
 import queue
 import threading
 import time
-from .logger import logger
-from windows_toasts import (
-    InteractableWindowsToaster, Toast, WindowsToaster, 
-    ToastImagePosition, ToastButton, ToastDisplayImage, ToastAudio
-)
+from .logger import logger, get_logger
 from config.app_config import APP_INFO
 
+log = get_logger(__name__)
+
 
 # 全局通知对象
 _toaster = None
@@ -35,6 +29,12 @@ def get_toaster():
     """
     global _toaster
     if _toaster is None:
+        # winrt 和 windows_toasts 加载较慢，推迟到第一次发送通知时（通常在通知线程中）再导入
+        import winrt
+        import winrt.windows.foundation
+        import winrt.windows.foundation.collections
+        from windows_toasts import InteractableWindowsToaster
+
         _toaster = InteractableWindowsToaster('')
     return _toaster
 
@@ -52,6 +52,7 @@ def send_notification(title, message, icon_path=None, buttons=None, silent=True)
     """
     try:
         toaster = get_toaster()
+        from windows_toasts import Toast, ToastImagePosition, ToastButton, ToastDisplayImage, ToastAudio
         
         # 根据silent参数设置音频
         audio = ToastAudio(silent=True) if silent else ToastAudio()
@@ -121,7 +122,7 @@ def notification_thread(message_queue, icon_path=None, stop_event=None):
         icon_path (str, optional): 图标路径
         stop_event (threading.Event, optional): 停止事件
     """
-    logger.debug("通知线程已启动")
+    log.debug("通知线程已启动")
     
     # 如果未指定停止事件，则创建一个新的
     if stop_event is None:
@@ -160,16 +161,17 @@ def notification_thread(message_queue, icon_path=None, stop_event=None):
             # 尝试短暂休眠以避免CPU占用过高
             time.sleep(0.1)
     
-    logger.debug("通知线程已终止")
+    log.debug("通知线程已终止")
 
 
-def create_notification_thread(message_queue, icon_path=None):
+def create_notification_thread(message_queue, icon_path=None, start=True):
     """
     创建并启动通知线程
     
     Args:
         message_queue (queue.Queue): 消息队列
         icon_path (str, optional): 图标路径
+        start (bool, optional): 是否立即启动线程，为False时由调用方稍后调用 thread.start()
         
     Returns:
         (threading.Thread, threading.Event): 线程对象和停止事件
@@ -189,6 +191,7 @@ def create_notification_thread(message_queue, icon_path=None):
     )
     
     # 启动线程
-    thread.start()
+    if start:
+        thread.start()
     
     return thread, stop_event 
\ No newline at end of file
@@ -10,7 +10,9 @@ import ctypes
 import sys
 import win32security
 import win32api
-from utils.logger import logger
+from utils.logger import logger, get_logger
+
+log = get_logger(__name__)
 
 
 class WindowsPrivilegeManager:
@@ -125,19 +127,23 @@ class WindowsPrivilegeManager:
             }
 
             # 记录权限获取结果
-            logger.debug(
-                f"权限获取状态: 核心权限 {privilege_status['core']['acquired']}/{privilege_status['core']['total']}, "
-                f"增强权限 {privilege_status['enhanced']['acquired']}/{privilege_status['enhanced']['total']}, "
-                f"进程权限 {privilege_status['process']['acquired']}/{privilege_status['process']['total']}"
+            log.debug(
+                "权限获取状态: 核心权限 {}/{}, 增强权限 {}/{}, 进程权限 {}/{}",
+                privilege_status["core"]["acquired"],
+                privilege_status["core"]["total"],
+                privilege_status["enhanced"]["acquired"],
+                privilege_status["enhanced"]["total"],
+                privilege_status["process"]["acquired"],
+                privilege_status["process"]["total"],
             )
 
             # 记录详细的权限获取情况（调试用）
-            logger.debug("详细权限获取情况:")
+            log.debug("详细权限获取情况:")
             for priv_name, result in privilege_details.items():
                 status = "✅" if result["success"] else "❌"
-                logger.debug(f"  {priv_name}: {status}")
+                log.debug("  {}: {}", priv_name, status)
                 if not result["success"] and result.get("error_message"):
-                    logger.debug(f"    失败原因: {result['error_message']}")
+                    log.debug("    失败原因: {}", result['error_message'])
 
             # 获取管理员状态
             is_admin = self.check_admin_rights()
@@ -184,18 +190,18 @@ class WindowsPrivilegeManager:
 
             if error_code == 0:
                 result["success"] = True
-                logger.debug(f"成功获取权限: {privilege_name}")
+                log.debug("成功获取权限: {}", privilege_name)
             else:
                 if error_code == 1300:  # ERROR_NOT_ALL_ASSIGNED
                     result["error_message"] = "权限不足，通常只有系统进程才能获取此权限"
-                    logger.debug(f"无法获取权限 {privilege_name}: 权限不足 (ERROR_NOT_ALL_ASSIGNED)")
+                    log.debug("无法获取权限 {}: 权限不足 (ERROR_NOT_ALL_ASSIGNED)", privilege_name)
                 else:
                     result["error_message"] = f"错误码: {error_code}"
                     logger.warning(f"无法获取权限 {privilege_name}: 错误码 {error_code}")
 
         except Exception as e:
             result["error_message"] = str(e)
-            logger.debug(f"请求权限 {privilege_name} 出现异常: {str(e)}")
+            log.debug("请求权限 {} 出现异常: {}", privilege_name, str(e))
 
         return result
 
@@ -264,11 +270,11 @@ class WindowsPrivilegeManager:
 
     def debug_privilege_constants(self):
         """调试方法：显示权限常量的实际值"""
-        logger.debug("权限常量值:")
-        logger.debug(f"  SE_DEBUG_NAME = '{win32security.SE_DEBUG_NAME}'")
-        logger.debug(f"  SE_INCREASE_QUOTA_NAME = '{win32security.SE_INCREASE_QUOTA_NAME}'")
-        logger.debug(f"  SE_INC_WORKING_SET_NAME = '{win32security.SE_INC_WORKING_SET_NAME}'")
-        logger.debug(f"  SE_MANAGE_VOLUME_NAME = '{win32security.SE_MANAGE_VOLUME_NAME}'")
+        log.debug("权限常量值:")
+        log.debug("  SE_DEBUG_NAME = '{}'", win32security.SE_DEBUG_NAME)
+        log.debug("  SE_INCREASE_QUOTA_NAME = '{}'", win32security.SE_INCREASE_QUOTA_NAME)
+        log.debug("  SE_INC_WORKING_SET_NAME = '{}'", win32security.SE_INC_WORKING_SET_NAME)
+        log.debug("  SE_MANAGE_VOLUME_NAME = '{}'", win32security.SE_MANAGE_VOLUME_NAME)
 
     def log_privilege_status(self):
         """记录当前权限状态到日志"""
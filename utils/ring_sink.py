@@ -0,0 +1,148 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+内存环形缓冲日志输出器
+
+始终在内存中保留最近 N 条 DEBUG 及以上级别的日志（不受文件输出器级别限制），
+发生未处理的异常或用户从托盘菜单请求时再写入磁盘，
+这样平时不必开启调试模式也能拿到出问题前的调试上下文。
+
+缓冲区只保存日志的原始字段（时间、级别、模块、位置、消息模板和参数），
+写出时才格式化：被级别过滤掉、只进入缓冲区的调试日志不经过 loguru，也不格式化消息。
+"""
+
+import threading
+import traceback
+from datetime import datetime
+from pathlib import Path
+
+
+class RingBufferSink:
+    """
+    固定容量的环形缓冲输出器
+
+    槽位在创建时一次性分配，之后只按位置覆盖最旧的一条，缓冲区本身不会增长或重新分配。
+    日志有两个来源：loguru 调用 write 传入已输出的日志，LazyLogger 调用 append 传入
+    未达到输出级别、只需保留在缓冲区中的日志。每个槽位是一个原始字段元组，
+    异常只保存格式化后的文本，不持有日志记录和异常堆栈（避免让其中的对象一直存活）。
+    消息参数按引用保存，写出时才格式化，可变对象显示的是写出时的内容。
+    """
+
+    def __init__(self, capacity=2000):
+        """
+        初始化输出器
+
+        Args:
+            capacity (int): 保留的日志条数
+        """
+        self.capacity = max(1, capacity)
+        self._slots = [None] * self.capacity
+        self._next = 0
+        self._total = 0
+        self._lock = threading.Lock()
+
+    def append(self, timestamp, level, name, function, line, message, args=(), exception=None):
+        """
+        保存一条日志的原始字段
+
+        Args:
+            timestamp (float): 时间戳（time.time() 的值）
+            level (str): 级别名称
+            name (str): 模块名
+            function (str): 函数名
+            line (int): 行号
+            message (str): 消息模板（loguru 的花括号占位符）
+            args (tuple): 消息参数
+            exception (str, optional): 格式化后的异常信息
+        """
+        entry = (timestamp, level, name, function, line, message, args, exception)
+        with self._lock:
+            self._slots[self._next] = entry
+            self._next += 1
+            if self._next == self.capacity:
+                self._next = 0
+            self._total += 1
+
+    def write(self, message):
+        """
+        接收一条已输出的日志（由 loguru 调用，消息已经格式化）
+
+        Args:
+            message: loguru 的日志消息，原始字段取自 message.record
+        """
+        record = message.record
+        exception = record["exception"]
+        if exception is not None:
+            exception = "".join(traceback.format_exception(exception.type, exception.value, exception.traceback))
+        self.append(
+            record["time"].timestamp(),
+            record["level"].name,
+            record["name"],
+            record["function"],
+            record["line"],
+            record["message"],
+            (),
+            exception,
+        )
+
+    @staticmethod
+    def format_entry(entry):
+        """
+        把原始字段格式化为与文件输出器相同格式的文本
+
+        Args:
+            entry (tuple): 原始字段元组
+
+        Returns:
+            str: 日志文本
+        """
+        timestamp, level, name, function, line, message, args, exception = entry
+        if args:
+            try:
+                message = message.format(*args)
+            except Exception:
+                message = f"{message} {args!r}"
+        time_text = datetime.fromtimestamp(timestamp).strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
+        text = f"{time_text} | {level: <8} | {name}:{function}:{line} | {message}"
+        if exception:
+            text = f"{text}\n{exception.rstrip()}"
+        return text
+
+    def snapshot(self):
+        """
+        按时间顺序获取缓冲区中的日志
+
+        Returns:
+            list[str]: 从旧到新的日志文本
+        """
+        with self._lock:
+            slots = list(self._slots)
+            start = self._next
+        return [self.format_entry(entry) for entry in slots[start:] + slots[:start] if entry is not None]
+
+    def dump(self, path, header=""):
+        """
+        把缓冲区中的日志写入文件
+
+        Args:
+            path (str | Path): 目标文件路径
+            header (str): 写在文件开头的说明
+
+        Returns:
+            int: 写入的日志条数
+        """
+        lines = self.snapshot()
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            if header:
+                f.write(f"{header}\n")
+            for text in lines:
+                f.write(text + "\n")
+        return len(lines)
+
+    @property
+    def total_count(self):
+        """累计接收的日志条数（包括已被覆盖的）"""
+        return self._total
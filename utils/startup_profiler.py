@@ -0,0 +1,229 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+启动阶段计时
+
+以 --profile-startup 启动时，在启动流程的各个阶段记录单调时钟时间戳（包括主窗口首次绘制），
+启动完成后输出各阶段耗时，并把本次结果追加到本地历史记录中。
+与最近几次同一启动方式（正常显示或最小化）的耗时中位数相比，超出阈值的总耗时或阶段耗时会被标记为变慢。
+未开启时 mark 等调用只做一次布尔判断，不影响正常启动。
+"""
+
+import json
+import statistics
+import time
+from pathlib import Path
+
+from utils.logger import logger
+
+# 命令行开关
+PROFILE_FLAG = "--profile-startup"
+
+# 历史记录保留的条数
+HISTORY_LIMIT = 50
+
+# 计算基线时使用的最近记录条数
+BASELINE_RUNS = 10
+
+# 至少有这么多条历史记录时才进行比较
+MIN_BASELINE_RUNS = 3
+
+# 比基线慢超过该比例时标记为变慢
+REGRESSION_THRESHOLD = 0.2
+
+# 比基线慢的绝对值低于该值（毫秒）时视为测量噪声，不标记
+MIN_REGRESSION_MS = 30.0
+
+
+class StartupProfiler:
+    """
+    启动阶段计时器
+
+    mark(phase) 记录的是阶段结束的时间点，阶段耗时为与上一个时间点之差，
+    起点为 start() 传入的时间（通常是 main.py 在导入其余模块前记录的时间）。
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.origin = None
+        self.minimized = False
+        self.history_file = None
+        self._marks = []
+        self._finished = False
+        self._paint_filter = None
+
+    def start(self, origin=None, minimized=False):
+        """
+        开始计时
+
+        Args:
+            origin (float, optional): 起点（time.perf_counter 的值），默认为当前时间
+            minimized (bool): 是否以最小化模式启动（首次绘制不会发生，历史记录分开比较）
+        """
+        self.enabled = True
+        self.origin = time.perf_counter() if origin is None else origin
+        self.minimized = minimized
+        self._marks = []
+        self._finished = False
+
+    def mark(self, phase):
+        """
+        记录一个阶段结束
+
+        Args:
+            phase (str): 阶段名称
+        """
+        if self.enabled and not self._finished:
+            self._marks.append((phase, time.perf_counter()))
+
+    def set_history_file(self, path):
+        """
+        设置历史记录文件（配置目录确定之后调用）
+
+        Args:
+            path (str | Path): 历史记录文件路径
+        """
+        self.history_file = Path(path)
+
+    def watch_first_paint(self, window):
+        """
+        在窗口首次绘制完成后记录 first_paint 并结束计时
+
+        最小化启动时窗口不会绘制，改为在事件循环开始运行后结束计时。
+
+        Args:
+            window (QWidget): 主窗口
+        """
+        if not self.enabled:
+            return
+
+        from PyQt5.QtCore import QTimer
+
+        from utils.first_paint import call_after_first_paint
+
+        if self.minimized:
+            QTimer.singleShot(0, lambda: self.finish("event_loop"))
+            return
+
+        self._paint_filter = call_after_first_paint(window, lambda: self.finish("first_paint"))
+
+    def phases(self):
+        """
+        获取各阶段耗时
+
+        Returns:
+            list: [(阶段名称, 耗时毫秒)]，按记录顺序排列
+        """
+        result = []
+        previous = self.origin
+        for phase, timestamp in self._marks:
+            result.append((phase, (timestamp - previous) * 1000))
+            previous = timestamp
+        return result
+
+    def finish(self, phase=None):
+        """
+        结束计时：输出各阶段耗时、与历史基线比较并保存本次结果
+
+        Args:
+            phase (str, optional): 结束前再记录的最后一个阶段
+
+        Returns:
+            dict | None: 本次结果，未开启或已结束时返回 None
+        """
+        if not self.enabled or self._finished:
+            return None
+        if phase:
+            self.mark(phase)
+        self._finished = True
+
+        phases = self.phases()
+        run = {
+            "time": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "minimized": self.minimized,
+            "total_ms": round(sum(ms for _, ms in phases), 1),
+            "phases": {name: round(ms, 1) for name, ms in phases},
+        }
+
+        history = self._load_history()
+        baseline = [item for item in history if item.get("minimized") == self.minimized][-BASELINE_RUNS:]
+        regressions = self.find_regressions(run, baseline)
+
+        lines = [f"启动耗时 {run['total_ms']:.1f} ms（{'最小化启动' if self.minimized else '正常启动'}）"]
+        for name, ms in phases:
+            lines.append(f"  {name:<24}{ms:>9.1f} ms")
+        logger.info("\n".join(lines))
+
+        if regressions:
+            logger.warning(
+                "启动变慢（对比最近 {} 次的中位数）:\n{}",
+                len(baseline),
+                "\n".join(f"  {name}: {ms:.1f} ms，基线 {base:.1f} ms" for name, ms, base in regressions),
+            )
+        run["regressions"] = [name for name, _, _ in regressions]
+
+        self._save_history(history + [run])
+        return run
+
+    @staticmethod
+    def find_regressions(run, baseline):
+        """
+        与历史基线比较，找出变慢的总耗时和阶段
+
+        Args:
+            run (dict): 本次结果
+            baseline (list): 用于比较的历史结果
+
+        Returns:
+            list: [(名称, 本次耗时毫秒, 基线耗时毫秒)]
+        """
+        if len(baseline) < MIN_BASELINE_RUNS:
+            return []
+
+        candidates = [("total", run["total_ms"], [item["total_ms"] for item in baseline])]
+        for name, ms in run["phases"].items():
+            values = [item["phases"][name] for item in baseline if name in item.get("phases", {})]
+            if len(values) >= MIN_BASELINE_RUNS:
+                candidates.append((name, ms, values))
+
+        regressions = []
+        for name, ms, values in candidates:
+            base = statistics.median(values)
+            if ms - base > MIN_REGRESSION_MS and ms > base * (1 + REGRESSION_THRESHOLD):
+                regressions.append((name, ms, base))
+        return regressions
+
+    def _load_history(self):
+        """读取历史记录，文件不存在或损坏的行会被忽略"""
+        if self.history_file is None or not self.history_file.exists():
+            return []
+        history = []
+        try:
+            with open(self.history_file, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        item = json.loads(line)
+                    except ValueError:
+                        continue
+                    if isinstance(item, dict) and "total_ms" in item:
+                        history.append(item)
+        except OSError as e:
+            logger.warning(f"读取启动耗时历史失败: {str(e)}")
+        return history
+
+    def _save_history(self, history):
+        """保存最近 HISTORY_LIMIT 条历史记录"""
+        if self.history_file is None:
+            return
+        try:
+            self.history_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.history_file, "w", encoding="utf-8") as f:
+                for item in history[-HISTORY_LIMIT:]:
+                    f.write(json.dumps(item, ensure_ascii=False) + "\n")
+        except OSError as e:
+            logger.warning(f"保存启动耗时历史失败: {str(e)}")
+
+
+# 全局启动计时器
+startup_profiler = StartupProfiler()
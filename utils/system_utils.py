@@ -5,23 +5,36 @@
 系统工具函数模块
 
 提供Windows系统相关的工具函数，包括管理员权限检查、单实例运行、开机自启等功能。
+其他系统上没有 winreg 和 ctypes.windll，这些函数不做任何操作，模块仍可正常导入。
 """
 
 import ctypes
 import os
 import sys
-import winreg
-from .logger import logger
+from .logger import logger, get_logger
 
+if sys.platform == "win32":
+    import winreg
 
-def run_as_admin():
+log = get_logger(__name__)
+
+
+def run_as_admin(before_restart=None):
     """
     判断是否以管理员权限运行，如果不是则尝试获取管理员权限
 
+    Args:
+        before_restart (callable, optional): 以管理员身份重新启动前调用，如释放实例锁，
+            避免新进程把当前进程当作正在运行的实例
+
     Returns:
         bool: 是否以管理员权限运行
     """
+    if sys.platform != "win32":
+        return True
     if not ctypes.windll.shell32.IsUserAnAdmin():
+        if before_restart is not None:
+            before_restart()
         ctypes.windll.shell32.ShellExecuteW(None, "runas", sys.executable, " ".join(sys.argv), None, 1)
         return False
     return True
@@ -40,6 +53,9 @@ def check_single_instance(mutex_name):
     if not mutex_name:
         raise ValueError("mutex_name 参数不能为空")
 
+    if sys.platform != "win32":
+        return True
+
     mutex = ctypes.windll.kernel32.CreateMutexW(None, False, mutex_name)
     if ctypes.windll.kernel32.GetLastError() == 183:
         logger.warning("程序已经在运行中，无法启动多个实例！")
@@ -79,7 +95,7 @@ def show_already_running_dialog(app_name):
             0x00000040 | 0x00040000,  # MB_ICONINFORMATION | MB_TOPMOST
         )
 
-        logger.debug("已显示程序重复运行提醒对话框")
+        log.debug("已显示程序重复运行提醒对话框")
 
     except Exception as e:
         logger.error(f"显示程序重复运行对话框失败: {str(e)}")
@@ -120,6 +136,9 @@ def check_auto_start(app_name=None, program_path=None):
         except ImportError:
             raise ValueError("app_name 参数不能为空，且无法从配置中获取")
 
+    if sys.platform != "win32":
+        return False
+
     try:
         # 打开注册表键
         with winreg.OpenKey(
@@ -137,19 +156,19 @@ def check_auto_start(app_name=None, program_path=None):
                     registry_path = os.path.normpath(registry_path)
 
                     if current_path.lower() == registry_path.lower():
-                        logger.debug(f"开机自启已设置且路径正确: {app_name} -> {value}")
+                        log.debug("开机自启已设置且路径正确: {} -> {}", app_name, value)
                         return True
                     else:
                         logger.warning(f"开机自启路径不匹配: 当前={current_path}, 注册表={registry_path}")
                         return False
                 else:
                     # 如果没有提供路径，只检查是否存在
-                    logger.debug(f"开机自启已设置: {app_name} -> {value}")
+                    log.debug("开机自启已设置: {} -> {}", app_name, value)
                     return True
 
             except FileNotFoundError:
                 # 注册表项不存在
-                logger.debug(f"开机自启未设置: {app_name}")
+                log.debug("开机自启未设置: {}", app_name)
                 return False
 
     except Exception as e:
@@ -177,6 +196,10 @@ def enable_auto_start(app_name=None, program_path=None, startup_args=None):
         except ImportError:
             raise ValueError("app_name 参数不能为空，且无法从配置中获取")
 
+    if sys.platform != "win32":
+        log.debug("当前系统不支持通过注册表设置开机自启: {}", app_name)
+        return False
+
     try:
         # 获取程序路径
         if program_path is None:
@@ -196,7 +219,7 @@ def enable_auto_start(app_name=None, program_path=None, startup_args=None):
             # 设置注册表值
             winreg.SetValueEx(key, app_name, 0, winreg.REG_SZ, command)
 
-        logger.debug(f"已设置开机自启（注册表）: {app_name} -> {command}")
+        log.debug("已设置开机自启（注册表）: {} -> {}", app_name, command)
         return True
 
     except PermissionError:
@@ -225,6 +248,9 @@ def disable_auto_start(app_name=None):
         except ImportError:
             raise ValueError("app_name 参数不能为空，且无法从配置中获取")
 
+    if sys.platform != "win32":
+        return True
+
     try:
         # 打开注册表键进行删除
         with winreg.OpenKey(
@@ -233,7 +259,7 @@ def disable_auto_start(app_name=None):
             try:
                 # 删除注册表项
                 winreg.DeleteValue(key, app_name)
-                logger.debug(f"已取消开机自启: {app_name}")
+                log.debug("已取消开机自启: {}", app_name)
                 return True
             except FileNotFoundError:
                 return True
@@ -9,10 +9,10 @@ import os
 import json
 import re
 import threading
-import requests
-from packaging import version
 from PyQt5.QtCore import QObject, pyqtSignal
-from .logger import logger
+from .logger import logger, get_logger
+
+log = get_logger(__name__)
 
 
 class VersionChecker(QObject):
@@ -60,13 +60,16 @@ class VersionChecker(QObject):
         """
         检查更新的线程函数
         """
+        # requests 只在检查更新时才用到，在后台线程中导入，不占用启动时间
+        import requests
+
         try:
             current_ver = self.get_current_version()
 
             # 发送 HTTP 请求获取最新版本信息
             headers = {"User-Agent": f"{self.app_name}/{current_ver}", "Accept": "application/vnd.github.v3+json"}
 
-            logger.debug(f"正在检查更新，当前版本: {current_ver}")
+            log.debug("正在检查更新，当前版本: {}", current_ver)
 
             response = requests.get(self.github_api_url, headers=headers, timeout=self.timeout)
             response.raise_for_status()
@@ -116,7 +119,7 @@ class VersionChecker(QObject):
 
             update_info_str = json.dumps(update_info, ensure_ascii=False, indent=2)
 
-            logger.debug(f"版本检查完成 - 当前: {current_ver}, 最新: {latest_version}, 有更新: {has_update}")
+            log.debug("版本检查完成 - 当前: {}, 最新: {}, 有更新: {}", current_ver, latest_version, has_update)
 
             # 静默模式下也发送信号，但添加静默标记，用于更新界面信息而不显示弹窗
             self.check_finished.emit(
@@ -170,6 +173,8 @@ class VersionChecker(QObject):
         Returns:
             bool: 如果有更新返回 True，否则返回 False
         """
+        from packaging import version
+
         try:
             # 清理版本号格式
             current_clean = self._clean_version(current_ver)